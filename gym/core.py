@@ -183,6 +183,36 @@ class Env(Generic[ObsType, ActType]):
         """
         pass
 
+    def save_state(self) -> Any:
+        """Returns a snapshot of the internal state of the environment, restored by :meth:`load_state`.
+
+        The snapshot allows to roll back or checkpoint an environment mid-episode, e.g. the state tuple of the
+        classic control environments or the ``qpos``, ``qvel``, ``act`` and ``time`` of the MuJoCo simulation.
+        It must be picklable, and does not include :attr:`np_random`.
+
+        Returns:
+            The snapshot of the internal state
+
+        Raises:
+            NotImplementedError: The environment does not implement snapshots
+        """
+        raise NotImplementedError(
+            f"`{type(self).__name__}` does not implement `save_state`."
+        )
+
+    def load_state(self, state: Any):
+        """Restores the internal state of the environment from a snapshot returned by :meth:`save_state`.
+
+        Args:
+            state: The snapshot returned by :meth:`save_state`
+
+        Raises:
+            NotImplementedError: The environment does not implement snapshots
+        """
+        raise NotImplementedError(
+            f"`{type(self).__name__}` does not implement `load_state`."
+        )
+
     @property
     def unwrapped(self) -> "Env":
         """Returns the base non-wrapped environment.
@@ -332,6 +362,14 @@ class Wrapper(Env[ObsType, ActType]):
         """Closes the environment."""
         return self.env.close()
 
+    def save_state(self) -> Any:
+        """Returns a snapshot of the internal state of the environment."""
+        return self.env.save_state()
+
+    def load_state(self, state: Any):
+        """Restores the internal state of the environment from a snapshot."""
+        return self.env.load_state(state)
+
     def __str__(self):
         """Returns the wrapper name and the unwrapped environment string."""
         return f"<{type(self).__name__}{self.env}>"
@@ -13,6 +13,7 @@ register(
     entry_point="gym.envs.classic_control.cartpole:CartPoleEnv",
     max_episode_steps=200,
     reward_threshold=195.0,
+    vector_entry_point="gym.envs.classic_control.cartpole:CartPoleVectorEnv",
 )
 
 register(
@@ -20,6 +21,7 @@ register(
     entry_point="gym.envs.classic_control.cartpole:CartPoleEnv",
     max_episode_steps=500,
     reward_threshold=475.0,
+    vector_entry_point="gym.envs.classic_control.cartpole:CartPoleVectorEnv",
 )
 
 register(
@@ -27,6 +29,7 @@ register(
     entry_point="gym.envs.classic_control.mountain_car:MountainCarEnv",
     max_episode_steps=200,
     reward_threshold=-110.0,
+    vector_entry_point="gym.envs.classic_control.mountain_car:MountainCarVectorEnv",
 )
 
 register(
@@ -34,12 +37,14 @@ register(
     entry_point="gym.envs.classic_control.continuous_mountain_car:Continuous_MountainCarEnv",
     max_episode_steps=999,
     reward_threshold=90.0,
+    vector_entry_point="gym.envs.classic_control.continuous_mountain_car:Continuous_MountainCarVectorEnv",
 )
 
 register(
     id="Pendulum-v1",
     entry_point="gym.envs.classic_control.pendulum:PendulumEnv",
     max_episode_steps=200,
+    vector_entry_point="gym.envs.classic_control.pendulum:PendulumVectorEnv",
 )
 
 register(
@@ -47,6 +52,7 @@ register(
     entry_point="gym.envs.classic_control.acrobot:AcrobotEnv",
     reward_threshold=-100.0,
     max_episode_steps=500,
+    vector_entry_point="gym.envs.classic_control.acrobot:AcrobotVectorEnv",
 )
 
 # Box2d
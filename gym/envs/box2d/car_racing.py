@@ -523,7 +523,7 @@ class CarRacing(gym.Env, EzPickle):
                 self.car.gas(action[1])
                 self.car.brake(action[2])
             else:
-                if not self.action_space.contains(action):
+                if not self.action_space.check(action):
                     raise InvalidAction(
                         f"you passed the invalid action `{action}`. "
                         f"The supported action_space is `{self.action_space}`"
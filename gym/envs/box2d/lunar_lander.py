@@ -471,7 +471,7 @@ class LunarLander(gym.Env, EzPickle):
         if self.continuous:
             action = np.clip(action, -1, +1).astype(np.float32)
         else:
-            assert self.action_space.contains(
+            assert self.action_space.check(
                 action
             ), f"{action!r} ({type(action)}) invalid "
 
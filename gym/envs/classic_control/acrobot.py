@@ -21,6 +21,7 @@ __author__ = "Christoph Dann <cdann@cdann.de>"
 # SOURCE:
 # https://github.com/rlpy/rlpy/blob/master/rlpy/Domains/Acrobot.py
 from gym.envs.classic_control import utils
+from gym.vector.numpy_vector_env import NumpyVectorEnv
 
 
 class AcrobotEnv(core.Env):
@@ -272,6 +273,12 @@ class AcrobotEnv(core.Env):
         ddtheta1 = -(d2 * ddtheta2 + phi1) / d1
         return dtheta1, dtheta2, ddtheta1, ddtheta2, 0.0
 
+    def save_state(self):
+        return {"state": self.state}
+
+    def load_state(self, state):
+        self.state = state["state"]
+
     def render(self):
         try:
             import pygame
@@ -451,3 +458,119 @@ def rk4(derivs, y0, t):
         yout[i + 1] = y0 + dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
     # We only care about the final timestep and we cleave off action value which will be zero
     return yout[-1][:4]
+
+
+class AcrobotVectorEnv(NumpyVectorEnv):
+    """A natively vectorized version of :class:`AcrobotEnv`, integrating all the acrobots together with numpy operations.
+
+    The state is an array with shape ``(num_envs, 4)``, see :class:`NumpyVectorEnv` for the autoreset of the rows.
+    Only the ``"book"`` dynamics, without torque noise, are implemented.
+    """
+
+    # The physical constants of `AcrobotEnv`
+    dt = AcrobotEnv.dt
+    LINK_LENGTH_1 = AcrobotEnv.LINK_LENGTH_1
+    LINK_LENGTH_2 = AcrobotEnv.LINK_LENGTH_2
+    LINK_MASS_1 = AcrobotEnv.LINK_MASS_1
+    LINK_MASS_2 = AcrobotEnv.LINK_MASS_2
+    LINK_COM_POS_1 = AcrobotEnv.LINK_COM_POS_1
+    LINK_COM_POS_2 = AcrobotEnv.LINK_COM_POS_2
+    LINK_MOI = AcrobotEnv.LINK_MOI
+    MAX_VEL_1 = AcrobotEnv.MAX_VEL_1
+    MAX_VEL_2 = AcrobotEnv.MAX_VEL_2
+    AVAIL_TORQUE = AcrobotEnv.AVAIL_TORQUE
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+    ):
+        high = np.array(
+            [1.0, 1.0, 1.0, 1.0, self.MAX_VEL_1, self.MAX_VEL_2], dtype=np.float32
+        )
+        super().__init__(
+            num_envs,
+            spaces.Box(low=-high, high=high, dtype=np.float32),
+            spaces.Discrete(3),
+            max_episode_steps=max_episode_steps,
+            autoreset_mode=autoreset_mode,
+        )
+
+    def _reset_state(self, n, options):
+        low, high = utils.maybe_parse_reset_bounds(options, -0.1, 0.1)
+        # Rounded to float32 like `AcrobotEnv.reset`, but kept in float64 like the state returned by `_step_state`
+        return (
+            self.np_random.uniform(low=low, high=high, size=(n, 4))
+            .astype(np.float32)
+            .astype(np.float64)
+        )
+
+    def _step_state(self, state, actions):
+        torque = np.asarray(self.AVAIL_TORQUE)[actions]
+
+        # A single step of the 4-th order Runge-Kutta integration of `rk4`
+        dt2 = self.dt / 2.0
+        k1 = self._dsdt(state, torque)
+        k2 = self._dsdt(state + dt2 * k1, torque)
+        k3 = self._dsdt(state + dt2 * k2, torque)
+        k4 = self._dsdt(state + self.dt * k3, torque)
+        ns = state + self.dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        ns[:, 0] = _wrap_batch(ns[:, 0], -pi, pi)
+        ns[:, 1] = _wrap_batch(ns[:, 1], -pi, pi)
+        ns[:, 2] = np.clip(ns[:, 2], -self.MAX_VEL_1, self.MAX_VEL_1)
+        ns[:, 3] = np.clip(ns[:, 3], -self.MAX_VEL_2, self.MAX_VEL_2)
+        terminated = -cos(ns[:, 0]) - cos(ns[:, 1] + ns[:, 0]) > 1.0
+        rewards = np.where(terminated, 0.0, -1.0)
+        return ns, rewards, terminated
+
+    def _get_obs(self, state):
+        return np.stack(
+            [
+                cos(state[:, 0]),
+                sin(state[:, 0]),
+                cos(state[:, 1]),
+                sin(state[:, 1]),
+                state[:, 2],
+                state[:, 3],
+            ],
+            axis=1,
+        ).astype(np.float32)
+
+    def _dsdt(self, s, a):
+        m1 = self.LINK_MASS_1
+        m2 = self.LINK_MASS_2
+        l1 = self.LINK_LENGTH_1
+        lc1 = self.LINK_COM_POS_1
+        lc2 = self.LINK_COM_POS_2
+        I1 = self.LINK_MOI
+        I2 = self.LINK_MOI
+        g = 9.8
+        theta1, theta2, dtheta1, dtheta2 = s.T
+        d1 = (
+            m1 * lc1**2
+            + m2 * (l1**2 + lc2**2 + 2 * l1 * lc2 * cos(theta2))
+            + I1
+            + I2
+        )
+        d2 = m2 * (lc2**2 + l1 * lc2 * cos(theta2)) + I2
+        phi2 = m2 * lc2 * g * cos(theta1 + theta2 - pi / 2.0)
+        phi1 = (
+            -m2 * l1 * lc2 * dtheta2**2 * sin(theta2)
+            - 2 * m2 * l1 * lc2 * dtheta2 * dtheta1 * sin(theta2)
+            + (m1 * lc1 + m2 * l1) * g * cos(theta1 - pi / 2)
+            + phi2
+        )
+        ddtheta2 = (
+            a + d2 / d1 * phi1 - m2 * l1 * lc2 * dtheta1**2 * sin(theta2) - phi2
+        ) / (m2 * lc2**2 + I2 - d2**2 / d1)
+        ddtheta1 = -(d2 * ddtheta2 + phi1) / d1
+        return np.stack([dtheta1, dtheta2, ddtheta1, ddtheta2], axis=1)
+
+
+def _wrap_batch(x, m, M):
+    """Wraps the array ``x`` so m <= x <= M, like :func:`wrap` for each element."""
+    diff = M - m
+    x = np.where(x > M, x - diff * np.ceil((x - M) / diff), x)
+    return np.where(x < m, x + diff * np.ceil((m - x) / diff), x)
@@ -12,6 +12,7 @@ import gym
 from gym import logger, spaces
 from gym.envs.classic_control import utils
 from gym.error import DependencyNotInstalled
+from gym.vector.numpy_vector_env import NumpyVectorEnv
 
 
 class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
@@ -86,21 +87,21 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
         "render_fps": 50,
     }
 
-    def __init__(self, render_mode: Optional[str] = None):
-        self.gravity = 9.8
-        self.masscart = 1.0
-        self.masspole = 0.1
-        self.total_mass = self.masspole + self.masscart
-        self.length = 0.5  # actually half the pole's length
-        self.polemass_length = self.masspole * self.length
-        self.force_mag = 10.0
-        self.tau = 0.02  # seconds between state updates
-        self.kinematics_integrator = "euler"
-
-        # Angle at which to fail the episode
-        self.theta_threshold_radians = 12 * 2 * math.pi / 360
-        self.x_threshold = 2.4
+    gravity = 9.8
+    masscart = 1.0
+    masspole = 0.1
+    total_mass = masspole + masscart
+    length = 0.5  # actually half the pole's length
+    polemass_length = masspole * length
+    force_mag = 10.0
+    tau = 0.02  # seconds between state updates
+    kinematics_integrator = "euler"
+
+    # Angle at which to fail the episode
+    theta_threshold_radians = 12 * 2 * math.pi / 360
+    x_threshold = 2.4
 
+    def __init__(self, render_mode: Optional[str] = None):
         # Angle limit set to 2 * theta_threshold_radians so failing observation
         # is still within bounds.
         high = np.array(
@@ -129,7 +130,7 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
 
     def step(self, action):
         err_msg = f"{action!r} ({type(action)}) invalid"
-        assert self.action_space.contains(action), err_msg
+        assert self.action_space.check(action), err_msg
         assert self.state is not None, "Call reset before using step method."
         x, x_dot, theta, theta_dot = self.state
         force = self.force_mag if action == 1 else -self.force_mag
@@ -201,6 +202,16 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
         self.steps_beyond_terminated = None
         return np.array(self.state, dtype=np.float32), {}
 
+    def save_state(self):
+        return {
+            "state": self.state,
+            "steps_beyond_terminated": self.steps_beyond_terminated,
+        }
+
+    def load_state(self, state):
+        self.state = state["state"]
+        self.steps_beyond_terminated = state["steps_beyond_terminated"]
+
     def render(self):
         try:
             import pygame
@@ -297,3 +308,93 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
             pygame.display.quit()
             pygame.quit()
             self.isopen = False
+
+
+class CartPoleVectorEnv(NumpyVectorEnv):
+    """A natively vectorized version of :class:`CartPoleEnv`, stepping all the carts together with numpy operations.
+
+    The state is an array with shape ``(num_envs, 4)``, see :class:`NumpyVectorEnv` for the autoreset of the rows.
+
+    Example::
+
+        >>> envs = gym.vector.make("CartPole-v1", num_envs=4096, native=True)
+        >>> observations, infos = envs.reset(seed=42)
+        >>> observations, rewards, terminateds, truncateds, infos = envs.step(envs.action_space.sample())
+    """
+
+    # The physical constants of `CartPoleEnv`
+    gravity = CartPoleEnv.gravity
+    masscart = CartPoleEnv.masscart
+    masspole = CartPoleEnv.masspole
+    total_mass = CartPoleEnv.total_mass
+    length = CartPoleEnv.length
+    polemass_length = CartPoleEnv.polemass_length
+    force_mag = CartPoleEnv.force_mag
+    tau = CartPoleEnv.tau
+    kinematics_integrator = CartPoleEnv.kinematics_integrator
+    theta_threshold_radians = CartPoleEnv.theta_threshold_radians
+    x_threshold = CartPoleEnv.x_threshold
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+    ):
+        high = np.array(
+            [
+                self.x_threshold * 2,
+                np.finfo(np.float32).max,
+                self.theta_threshold_radians * 2,
+                np.finfo(np.float32).max,
+            ],
+            dtype=np.float32,
+        )
+        super().__init__(
+            num_envs,
+            spaces.Box(-high, high, dtype=np.float32),
+            spaces.Discrete(2),
+            max_episode_steps=max_episode_steps,
+            autoreset_mode=autoreset_mode,
+        )
+
+    def _reset_state(self, n, options):
+        low, high = utils.maybe_parse_reset_bounds(options, -0.05, 0.05)
+        return self.np_random.uniform(low=low, high=high, size=(n, 4))
+
+    def _step_state(self, state, actions):
+        x, x_dot, theta, theta_dot = state.T
+        force = np.where(actions == 1, self.force_mag, -self.force_mag)
+        costheta = np.cos(theta)
+        sintheta = np.sin(theta)
+
+        temp = (
+            force + self.polemass_length * theta_dot**2 * sintheta
+        ) / self.total_mass
+        thetaacc = (self.gravity * sintheta - costheta * temp) / (
+            self.length * (4.0 / 3.0 - self.masspole * costheta**2 / self.total_mass)
+        )
+        xacc = temp - self.polemass_length * thetaacc * costheta / self.total_mass
+
+        if self.kinematics_integrator == "euler":
+            x = x + self.tau * x_dot
+            x_dot = x_dot + self.tau * xacc
+            theta = theta + self.tau * theta_dot
+            theta_dot = theta_dot + self.tau * thetaacc
+        else:  # semi-implicit euler
+            x_dot = x_dot + self.tau * xacc
+            x = x + self.tau * x_dot
+            theta_dot = theta_dot + self.tau * thetaacc
+            theta = theta + self.tau * theta_dot
+
+        terminated = (
+            (x < -self.x_threshold)
+            | (x > self.x_threshold)
+            | (theta < -self.theta_threshold_radians)
+            | (theta > self.theta_threshold_radians)
+        )
+        rewards = np.ones(len(state), dtype=np.float64)
+        return np.stack([x, x_dot, theta, theta_dot], axis=1), rewards, terminated
+
+    def _get_obs(self, state):
+        return state.astype(np.float32)
@@ -22,6 +22,7 @@ import gym
 from gym import spaces
 from gym.envs.classic_control import utils
 from gym.error import DependencyNotInstalled
+from gym.vector.numpy_vector_env import NumpyVectorEnv
 
 
 class Continuous_MountainCarEnv(gym.Env):
@@ -105,17 +106,16 @@ class Continuous_MountainCarEnv(gym.Env):
         "render_fps": 30,
     }
 
+    min_action = -1.0
+    max_action = 1.0
+    min_position = -1.2
+    max_position = 0.6
+    max_speed = 0.07
+    goal_position = 0.45  # was 0.5 in gym, 0.45 in Arnaud de Broissia's version
+    power = 0.0015
+
     def __init__(self, render_mode: Optional[str] = None, goal_velocity=0):
-        self.min_action = -1.0
-        self.max_action = 1.0
-        self.min_position = -1.2
-        self.max_position = 0.6
-        self.max_speed = 0.07
-        self.goal_position = (
-            0.45  # was 0.5 in gym, 0.45 in Arnaud de Broissia's version
-        )
         self.goal_velocity = goal_velocity
-        self.power = 0.0015
 
         self.low_state = np.array(
             [self.min_position, -self.max_speed], dtype=np.float32
@@ -182,6 +182,12 @@ class Continuous_MountainCarEnv(gym.Env):
     def _height(self, xs):
         return np.sin(3 * xs) * 0.45 + 0.55
 
+    def save_state(self):
+        return {"state": self.state}
+
+    def load_state(self, state):
+        self.state = state["state"]
+
     def render(self):
         try:
             import pygame
@@ -284,3 +290,67 @@ class Continuous_MountainCarEnv(gym.Env):
             pygame.display.quit()
             pygame.quit()
             self.isopen = False
+
+
+class Continuous_MountainCarVectorEnv(NumpyVectorEnv):
+    """A natively vectorized version of :class:`Continuous_MountainCarEnv`, stepping all the cars together.
+
+    The state is an array with shape ``(num_envs, 2)``, see :class:`NumpyVectorEnv` for the autoreset of the rows.
+    """
+
+    # The physical constants of `Continuous_MountainCarEnv`
+    min_action = Continuous_MountainCarEnv.min_action
+    max_action = Continuous_MountainCarEnv.max_action
+    min_position = Continuous_MountainCarEnv.min_position
+    max_position = Continuous_MountainCarEnv.max_position
+    max_speed = Continuous_MountainCarEnv.max_speed
+    goal_position = Continuous_MountainCarEnv.goal_position
+    power = Continuous_MountainCarEnv.power
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+        goal_velocity=0,
+    ):
+        self.goal_velocity = goal_velocity
+
+        self.low_state = np.array(
+            [self.min_position, -self.max_speed], dtype=np.float32
+        )
+        self.high_state = np.array(
+            [self.max_position, self.max_speed], dtype=np.float32
+        )
+        super().__init__(
+            num_envs,
+            spaces.Box(low=self.low_state, high=self.high_state, dtype=np.float32),
+            spaces.Box(
+                low=self.min_action, high=self.max_action, shape=(1,), dtype=np.float32
+            ),
+            max_episode_steps=max_episode_steps,
+            autoreset_mode=autoreset_mode,
+        )
+
+    def _reset_state(self, n, options):
+        low, high = utils.maybe_parse_reset_bounds(options, -0.6, -0.4)
+        state = np.zeros((n, 2))
+        state[:, 0] = self.np_random.uniform(low=low, high=high, size=n)
+        return state
+
+    def _step_state(self, state, actions):
+        position, velocity = state.T
+        action = actions[:, 0].astype(np.float64)
+        force = np.clip(action, self.min_action, self.max_action)
+
+        velocity = velocity + force * self.power - 0.0025 * np.cos(3 * position)
+        velocity = np.clip(velocity, -self.max_speed, self.max_speed)
+        position = np.clip(position + velocity, self.min_position, self.max_position)
+        velocity[(position == self.min_position) & (velocity < 0)] = 0
+
+        terminated = (position >= self.goal_position) & (velocity >= self.goal_velocity)
+        rewards = np.where(terminated, 100.0, 0.0) - action**2 * 0.1
+        return np.stack([position, velocity], axis=1), rewards, terminated
+
+    def _get_obs(self, state):
+        return state.astype(np.float32)
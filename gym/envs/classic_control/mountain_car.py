@@ -11,6 +11,7 @@ import gym
 from gym import spaces
 from gym.envs.classic_control import utils
 from gym.error import DependencyNotInstalled
+from gym.vector.numpy_vector_env import NumpyVectorEnv
 
 
 class MountainCarEnv(gym.Env):
@@ -100,16 +101,17 @@ class MountainCarEnv(gym.Env):
         "render_fps": 30,
     }
 
+    min_position = -1.2
+    max_position = 0.6
+    max_speed = 0.07
+    goal_position = 0.5
+
+    force = 0.001
+    gravity = 0.0025
+
     def __init__(self, render_mode: Optional[str] = None, goal_velocity=0):
-        self.min_position = -1.2
-        self.max_position = 0.6
-        self.max_speed = 0.07
-        self.goal_position = 0.5
         self.goal_velocity = goal_velocity
 
-        self.force = 0.001
-        self.gravity = 0.0025
-
         self.low = np.array([self.min_position, -self.max_speed], dtype=np.float32)
         self.high = np.array([self.max_position, self.max_speed], dtype=np.float32)
 
@@ -125,9 +127,7 @@ class MountainCarEnv(gym.Env):
         self.observation_space = spaces.Box(self.low, self.high, dtype=np.float32)
 
     def step(self, action: int):
-        assert self.action_space.contains(
-            action
-        ), f"{action!r} ({type(action)}) invalid"
+        assert self.action_space.check(action), f"{action!r} ({type(action)}) invalid"
 
         position, velocity = self.state
         velocity += (action - 1) * self.force + math.cos(3 * position) * (-self.gravity)
@@ -161,6 +161,12 @@ class MountainCarEnv(gym.Env):
     def _height(self, xs):
         return np.sin(3 * xs) * 0.45 + 0.55
 
+    def save_state(self):
+        return {"state": self.state}
+
+    def load_state(self, state):
+        self.state = state["state"]
+
     def render(self):
         try:
             import pygame
@@ -267,3 +273,58 @@ class MountainCarEnv(gym.Env):
             pygame.display.quit()
             pygame.quit()
             self.isopen = False
+
+
+class MountainCarVectorEnv(NumpyVectorEnv):
+    """A natively vectorized version of :class:`MountainCarEnv`, stepping all the cars together with numpy operations.
+
+    The state is an array with shape ``(num_envs, 2)``, see :class:`NumpyVectorEnv` for the autoreset of the rows.
+    """
+
+    # The physical constants of `MountainCarEnv`
+    min_position = MountainCarEnv.min_position
+    max_position = MountainCarEnv.max_position
+    max_speed = MountainCarEnv.max_speed
+    goal_position = MountainCarEnv.goal_position
+    force = MountainCarEnv.force
+    gravity = MountainCarEnv.gravity
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+        goal_velocity=0,
+    ):
+        self.goal_velocity = goal_velocity
+
+        self.low = np.array([self.min_position, -self.max_speed], dtype=np.float32)
+        self.high = np.array([self.max_position, self.max_speed], dtype=np.float32)
+        super().__init__(
+            num_envs,
+            spaces.Box(self.low, self.high, dtype=np.float32),
+            spaces.Discrete(3),
+            max_episode_steps=max_episode_steps,
+            autoreset_mode=autoreset_mode,
+        )
+
+    def _reset_state(self, n, options):
+        low, high = utils.maybe_parse_reset_bounds(options, -0.6, -0.4)
+        state = np.zeros((n, 2))
+        state[:, 0] = self.np_random.uniform(low=low, high=high, size=n)
+        return state
+
+    def _step_state(self, state, actions):
+        position, velocity = state.T
+        velocity = velocity + (actions.astype(np.int64) - 1) * self.force
+        velocity += np.cos(3 * position) * (-self.gravity)
+        velocity = np.clip(velocity, -self.max_speed, self.max_speed)
+        position = np.clip(position + velocity, self.min_position, self.max_position)
+        velocity[(position == self.min_position) & (velocity < 0)] = 0
+
+        terminated = (position >= self.goal_position) & (velocity >= self.goal_velocity)
+        rewards = np.full(len(state), -1.0)
+        return np.stack([position, velocity], axis=1), rewards, terminated
+
+    def _get_obs(self, state):
+        return state.astype(np.float32)
@@ -9,6 +9,7 @@ import gym
 from gym import spaces
 from gym.envs.classic_control import utils
 from gym.error import DependencyNotInstalled
+from gym.vector.numpy_vector_env import NumpyVectorEnv
 
 DEFAULT_X = np.pi
 DEFAULT_Y = 1.0
@@ -92,13 +93,14 @@ class PendulumEnv(gym.Env):
         "render_fps": 30,
     }
 
+    max_speed = 8
+    max_torque = 2.0
+    dt = 0.05
+    m = 1.0
+    l = 1.0
+
     def __init__(self, render_mode: Optional[str] = None, g=10.0):
-        self.max_speed = 8
-        self.max_torque = 2.0
-        self.dt = 0.05
         self.g = g
-        self.m = 1.0
-        self.l = 1.0
 
         self.render_mode = render_mode
 
@@ -157,6 +159,13 @@ class PendulumEnv(gym.Env):
         theta, thetadot = self.state
         return np.array([np.cos(theta), np.sin(theta), thetadot], dtype=np.float32)
 
+    def save_state(self):
+        return {"state": self.state, "last_u": self.last_u}
+
+    def load_state(self, state):
+        self.state = state["state"]
+        self.last_u = state["last_u"]
+
     def render(self):
         try:
             import pygame
@@ -256,3 +265,73 @@ class PendulumEnv(gym.Env):
 
 def angle_normalize(x):
     return ((x + np.pi) % (2 * np.pi)) - np.pi
+
+
+class PendulumVectorEnv(NumpyVectorEnv):
+    """A natively vectorized version of :class:`PendulumEnv`, stepping all the pendulums together with numpy operations.
+
+    The state is an array with shape ``(num_envs, 2)``, see :class:`NumpyVectorEnv` for the autoreset of the rows.
+    """
+
+    # The physical constants of `PendulumEnv`
+    max_speed = PendulumEnv.max_speed
+    max_torque = PendulumEnv.max_torque
+    dt = PendulumEnv.dt
+    m = PendulumEnv.m
+    l = PendulumEnv.l
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+        g=10.0,
+    ):
+        self.g = g
+
+        high = np.array([1.0, 1.0, self.max_speed], dtype=np.float32)
+        super().__init__(
+            num_envs,
+            spaces.Box(low=-high, high=high, dtype=np.float32),
+            spaces.Box(
+                low=-self.max_torque, high=self.max_torque, shape=(1,), dtype=np.float32
+            ),
+            max_episode_steps=max_episode_steps,
+            autoreset_mode=autoreset_mode,
+        )
+
+    def _reset_state(self, n, options):
+        if options is None:
+            high = np.array([DEFAULT_X, DEFAULT_Y])
+        else:
+            x = options.get("x_init") if "x_init" in options else DEFAULT_X
+            y = options.get("y_init") if "y_init" in options else DEFAULT_Y
+            x = utils.verify_number_and_cast(x)
+            y = utils.verify_number_and_cast(y)
+            high = np.array([x, y])
+        return self.np_random.uniform(low=-high, high=high, size=(n, 2))
+
+    def _step_state(self, state, actions):
+        th, thdot = state.T  # th := theta
+
+        g = self.g
+        m = self.m
+        l = self.l
+        dt = self.dt
+
+        u = np.clip(actions[:, 0], -self.max_torque, self.max_torque)
+        costs = angle_normalize(th) ** 2 + 0.1 * thdot**2 + 0.001 * (u**2)
+
+        newthdot = thdot + (3 * g / (2 * l) * np.sin(th) + 3.0 / (m * l**2) * u) * dt
+        newthdot = np.clip(newthdot, -self.max_speed, self.max_speed)
+        newth = th + newthdot * dt
+
+        rewards = -costs.astype(np.float64)
+        terminated = np.zeros(len(state), dtype=np.bool_)
+        return np.stack([newth, newthdot], axis=1), rewards, terminated
+
+    def _get_obs(self, state):
+        theta, thetadot = state.T
+        return np.stack([np.cos(theta), np.sin(theta), thetadot], axis=1).astype(
+            np.float32
+        )
@@ -142,6 +142,24 @@ class BaseMujocoEnv(gym.Env):
         """
         assert qpos.shape == (self.model.nq,) and qvel.shape == (self.model.nv,)
 
+    def save_state(self):
+        """
+        Return the joints position qpos and velocity qvel, the actuator activations act and the time of the simulation.
+        """
+        return {
+            "qpos": np.copy(self.data.qpos),
+            "qvel": np.copy(self.data.qvel),
+            "act": None if self.data.act is None else np.copy(self.data.act),
+            "time": self.data.time,
+        }
+
+    def load_state(self, state):
+        """
+        Restore the simulation from a snapshot of :meth:`save_state`. Override this method depending on the MuJoCo bindings used.
+        """
+        assert state["qpos"].shape == (self.model.nq,)
+        assert state["qvel"].shape == (self.model.nv,)
+
     @property
     def dt(self):
         return self.model.opt.timestep * self.frame_skip
@@ -220,6 +238,19 @@ class MuJocoPyEnv(BaseMujocoEnv):
         self.sim.set_state(state)
         self.sim.forward()
 
+    def load_state(self, state):
+        super().load_state(state)
+        sim_state = self.sim.get_state()
+        sim_state = mujoco_py.MjSimState(
+            state["time"],
+            state["qpos"],
+            state["qvel"],
+            sim_state.act if self.model.na == 0 else state["act"],
+            sim_state.udd_state,
+        )
+        self.sim.set_state(sim_state)
+        self.sim.forward()
+
     def _step_mujoco_simulation(self, ctrl, n_frames):
         self.sim.data.ctrl[:] = ctrl
 
@@ -336,6 +367,15 @@ class MujocoEnv(BaseMujocoEnv):
             self.data.act[:] = None
         mujoco.mj_forward(self.model, self.data)
 
+    def load_state(self, state):
+        super().load_state(state)
+        self.data.qpos[:] = state["qpos"]
+        self.data.qvel[:] = state["qvel"]
+        if self.model.na > 0:
+            self.data.act[:] = state["act"]
+        self.data.time = state["time"]
+        mujoco.mj_forward(self.model, self.data)
+
     def _step_mujoco_simulation(self, ctrl, n_frames):
         self.data.ctrl[:] = ctrl
 
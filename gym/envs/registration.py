@@ -127,6 +127,7 @@ class EnvSpec:
     * autoreset: If to automatically reset the environment on episode end
     * disable_env_checker: If to disable the environment checker wrapper in `gym.make`, by default False (runs the environment checker)
     * kwargs: Additional keyword arguments passed to the environments through `gym.make`
+    * vector_entry_point: The location of a natively vectorized implementation of the environment, used by `gym.vector.make`
     """
 
     id: str
@@ -146,6 +147,9 @@ class EnvSpec:
     # Environment arguments
     kwargs: dict = field(default_factory=dict)
 
+    # Natively vectorized implementation
+    vector_entry_point: Optional[Union[Callable, str]] = field(default=None)
+
     # post-init attributes
     namespace: Optional[str] = field(init=False)
     name: str = field(init=False)
@@ -441,6 +445,7 @@ def register(
     autoreset: bool = False,
     disable_env_checker: bool = False,
     apply_step_compatibility: bool = False,
+    vector_entry_point: Optional[Union[Callable, str]] = None,
     **kwargs,
 ):
     """Register an environment with gym.
@@ -460,6 +465,8 @@ def register(
         autoreset: If to add the autoreset wrapper such that reset does not need to be called.
         disable_env_checker: If to disable the environment checker for the environment. Recommended to False.
         apply_step_compatibility: If to apply the `StepAPICompatibility` wrapper.
+        vector_entry_point: The entry point for creating a natively vectorized implementation of the environment
+            (a :class:`gym.vector.VectorEnv`), used by `gym.vector.make` with ``native=True``
         **kwargs: arbitrary keyword arguments which are passed to the environment constructor
     """
     global registry, current_namespace
@@ -491,6 +498,7 @@ def register(
         autoreset=autoreset,
         disable_env_checker=disable_env_checker,
         apply_step_compatibility=apply_step_compatibility,
+        vector_entry_point=vector_entry_point,
         **kwargs,
     )
     _check_spec_register(new_spec)
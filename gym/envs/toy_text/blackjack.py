@@ -131,7 +131,7 @@ class BlackjackEnv(gym.Env):
         self.render_mode = render_mode
 
     def step(self, action):
-        assert self.action_space.contains(action)
+        assert self.action_space.check(action)
         if action:  # hit: add a card to players hand and return
             self.player.append(draw_card(self.np_random))
             if is_bust(self.player):
@@ -184,6 +184,14 @@ class BlackjackEnv(gym.Env):
 
         return self._get_obs(), {}
 
+    def save_state(self):
+        # The hands are appended to in place by `step`
+        return {"dealer": list(self.dealer), "player": list(self.player)}
+
+    def load_state(self, state):
+        self.dealer = list(state["dealer"])
+        self.player = list(state["player"])
+
     def render(self):
         try:
             import pygame
@@ -157,6 +157,13 @@ class CliffWalkingEnv(Env):
 
         return int(self.s), {"prob": 1}
 
+    def save_state(self):
+        return {"s": self.s, "lastaction": self.lastaction}
+
+    def load_state(self, state):
+        self.s = state["s"]
+        self.lastaction = state["lastaction"]
+
     def render(self):
         if self.render_mode == "ansi":
             return self._render_text()
@@ -272,6 +272,18 @@ class TaxiEnv(Env):
 
         return int(self.s), {"prob": 1.0, "action_mask": self.action_mask(self.s)}
 
+    def save_state(self):
+        return {
+            "s": self.s,
+            "lastaction": self.lastaction,
+            "taxi_orientation": self.taxi_orientation,
+        }
+
+    def load_state(self, state):
+        self.s = state["s"]
+        self.lastaction = state["lastaction"]
+        self.taxi_orientation = state["taxi_orientation"]
+
     def render(self):
         if self.render_mode == "ansi":
             return self._render_text()
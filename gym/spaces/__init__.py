@@ -15,7 +15,7 @@ from gym.spaces.graph import Graph, GraphInstance
 from gym.spaces.multi_binary import MultiBinary
 from gym.spaces.multi_discrete import MultiDiscrete
 from gym.spaces.sequence import Sequence
-from gym.spaces.space import Space
+from gym.spaces.space import Space, set_validation_level
 from gym.spaces.text import Text
 from gym.spaces.tuple import Tuple
 from gym.spaces.utils import flatdim, flatten, flatten_space, unflatten
@@ -36,4 +36,5 @@ __all__ = [
     "flatten_space",
     "flatten",
     "unflatten",
+    "set_validation_level",
 ]
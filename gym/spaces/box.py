@@ -1,5 +1,15 @@
 """Implementation of a space that represents closed boxes in euclidean space."""
-from typing import Dict, List, Optional, Sequence, SupportsFloat, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    SupportsFloat,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 
@@ -7,6 +17,9 @@ import gym.error
 from gym import logger
 from gym.spaces.space import Space
 
+# The attributes from which the sampling plan is computed
+_SAMPLE_PLAN_ATTRIBUTES = ("low", "high", "bounded_below", "bounded_above")
+
 
 def _short_repr(arr: np.ndarray) -> str:
     """Create a shortened string representation of a numpy array.
@@ -168,7 +181,117 @@ class Box(Space[np.ndarray]):
                 f"manner is not in {{'below', 'above', 'both'}}, actual value: {manner}"
             )
 
-    def sample(self, mask: None = None) -> np.ndarray:
+    def __setattr__(self, name: str, value: Any):
+        """Sets an attribute of the box, discarding the sampling plan if a bound is reassigned."""
+        if name in _SAMPLE_PLAN_ATTRIBUTES:
+            self.__dict__["_sample_plan"] = None
+        super().__setattr__(name, value)
+
+    def _init_sample_plan(self):
+        """Precomputes how the coordinates are sampled, such that :meth:`sample` does not reclassify them on each call.
+
+        The plan is computed by the first sample, and again after ``low``, ``high``, ``bounded_below`` or
+        ``bounded_above`` is reassigned. Modifying these arrays in place is not tracked, the bounds must then be
+        reassigned (e.g. ``box.low = box.low``) before sampling.
+
+        The plan is a list of ``(distribution, index, low, high, width)`` for each interval type present in the box,
+        in the order the coordinates are sampled. ``index`` are the indices of the flattened coordinates of this
+        interval type, or ``None`` if all the coordinates have this interval type (then the samples are drawn in place).
+        """
+        bounded_below = self.bounded_below.reshape(-1)
+        bounded_above = self.bounded_above.reshape(-1)
+        low = self.low.reshape(-1).astype(np.float64)
+        high = self.high.reshape(-1).astype(np.float64)
+        # The uniform samples of the integer boxes are floored, their upper bound is made exclusive
+        width = (high if self.dtype.kind == "f" else high + 1) - low
+
+        # The float32 and float64 boxes are sampled directly in their dtype, unless the width of an interval overflows it
+        if self.dtype in (np.float32, np.float64) and np.all(
+            width[bounded_below & bounded_above] <= np.finfo(self.dtype).max
+        ):
+            self._sample_dtype = self.dtype
+        else:
+            self._sample_dtype = np.dtype(np.float64)
+        low = self.low.reshape(-1).astype(self._sample_dtype)
+        high = self.high.reshape(-1).astype(self._sample_dtype)
+        width = width.astype(self._sample_dtype)
+
+        self._sample_plan = []
+        for distribution, interval in (
+            ("normal", ~bounded_below & ~bounded_above),
+            ("exponential", bounded_below & ~bounded_above),
+            ("negative_exponential", ~bounded_below & bounded_above),
+            ("uniform", bounded_below & bounded_above),
+        ):
+            if np.all(interval):
+                self._sample_plan.append((distribution, None, low, high, width))
+            elif np.any(interval):
+                index = np.flatnonzero(interval)
+                self._sample_plan.append(
+                    (distribution, index, low[index], high[index], width[index])
+                )
+
+    def _sample(
+        self, batch_shape: Tuple[int, ...], out: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Samples an array of shape ``batch_shape + shape`` following the sampling plan, in ``out`` if provided."""
+        shape = batch_shape + self.shape
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        else:
+            assert (
+                isinstance(out, np.ndarray)
+                and out.shape == shape
+                and out.dtype == self.dtype
+                and out.flags.c_contiguous
+            ), f"Expect `out` to be a contiguous np.ndarray of shape {shape} and dtype {self.dtype}, actual value: {out!r}"
+
+        if self._sample_plan is None:
+            self._init_sample_plan()
+
+        flat_shape = batch_shape + (int(np.prod(self.shape, dtype=int)),)
+        in_place = self._sample_dtype == self.dtype
+        if in_place:
+            sample = out.reshape(flat_shape)
+        else:
+            sample = np.empty(flat_shape, dtype=self._sample_dtype)
+
+        for distribution, index, low, high, width in self._sample_plan:
+            if index is None:
+                values = sample
+            else:
+                values = np.empty(batch_shape + (len(index),), dtype=self._sample_dtype)
+
+            if distribution == "normal":
+                self.np_random.standard_normal(dtype=self._sample_dtype, out=values)
+            elif distribution == "exponential":
+                self.np_random.standard_exponential(
+                    dtype=self._sample_dtype, out=values
+                )
+                values += low
+            elif distribution == "negative_exponential":
+                self.np_random.standard_exponential(
+                    dtype=self._sample_dtype, out=values
+                )
+                np.subtract(high, values, out=values)
+            else:
+                self.np_random.random(dtype=self._sample_dtype, out=values)
+                values *= width
+                values += low
+                if self.dtype.kind == "f":
+                    # Rounding must not take the samples above the upper bound
+                    np.minimum(values, high, out=values)
+
+            if index is not None:
+                sample[..., index] = values
+
+        if self.dtype.kind == "i":
+            np.floor(sample, out=sample)
+        if not in_place:
+            out[...] = sample.reshape(shape)
+        return out
+
+    def sample(self, mask: None = None, out: Optional[np.ndarray] = None) -> np.ndarray:
         r"""Generates a single random sample inside the Box.
 
         In creating a sample of the box, each coordinate is sampled (independently) from a distribution
@@ -179,47 +302,44 @@ class Box(Space[np.ndarray]):
         * :math:`(-\infty, b]` : shifted negative exponential distribution
         * :math:`(-\infty, \infty)` : normal distribution
 
+        The classification of the coordinates is computed once, by the first sample after the bounds are assigned.
+
         Args:
             mask: A mask for sampling values from the Box space, currently unsupported.
+            out: An optional contiguous array of the shape and dtype of the Box, in which the sample is written.
 
         Returns:
-            A sampled value from the Box
+            A sampled value from the Box (``out`` if provided)
         """
         if mask is not None:
             raise gym.error.Error(
                 f"Box.sample cannot be provided a mask, actual value: {mask}"
             )
 
-        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
-        sample = np.empty(self.shape)
-
-        # Masking arrays which classify the coordinates according to interval
-        # type
-        unbounded = ~self.bounded_below & ~self.bounded_above
-        upp_bounded = ~self.bounded_below & self.bounded_above
-        low_bounded = self.bounded_below & ~self.bounded_above
-        bounded = self.bounded_below & self.bounded_above
+        return self._sample((), out)
 
-        # Vectorized sampling by interval type
-        sample[unbounded] = self.np_random.normal(size=unbounded[unbounded].shape)
+    def sample_batch(
+        self, n: int, mask: None = None, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Generates a batch of ``n`` random samples inside the Box, of shape ``(n, *shape)``.
 
-        sample[low_bounded] = (
-            self.np_random.exponential(size=low_bounded[low_bounded].shape)
-            + self.low[low_bounded]
-        )
+        The coordinates are sampled as in :meth:`sample`, with one call to :attr:`np_random` per interval type
+        for the whole batch.
 
-        sample[upp_bounded] = (
-            -self.np_random.exponential(size=upp_bounded[upp_bounded].shape)
-            + self.high[upp_bounded]
-        )
+        Args:
+            n: The number of samples
+            mask: A mask for sampling values from the Box space, currently unsupported.
+            out: An optional contiguous array of shape ``(n, *shape)`` and the dtype of the Box, in which the samples are written.
 
-        sample[bounded] = self.np_random.uniform(
-            low=self.low[bounded], high=high[bounded], size=bounded[bounded].shape
-        )
-        if self.dtype.kind == "i":
-            sample = np.floor(sample)
+        Returns:
+            The batch of samples (``out`` if provided)
+        """
+        if mask is not None:
+            raise gym.error.Error(
+                f"Box.sample_batch cannot be provided a mask, actual value: {mask}"
+            )
 
-        return sample.astype(self.dtype)
+        return self._sample((n,), out)
 
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
@@ -233,10 +353,31 @@ class Box(Space[np.ndarray]):
         return bool(
             np.can_cast(x.dtype, self.dtype)
             and x.shape == self.shape
-            and np.all(x >= self.low)
-            and np.all(x <= self.high)
+            # The array methods skip the dispatch of `np.all`, which dominates for small boxes
+            and (x >= self.low).all()
+            and (x <= self.high).all()
         )
 
+    def contains_batch(self, x, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each row of ``x`` (of shape ``(n, *shape)``) if it is a member of this space.
+
+        ``n`` is the expected number of samples, inferred from ``x`` if ``None``.
+        """
+        try:
+            x = np.asarray(x)
+        except (ValueError, TypeError):
+            return np.zeros(len(x) if n is None else n, dtype=np.bool_)
+        if (
+            x.ndim == 0
+            or x.shape[1:] != self.shape
+            or (n is not None and len(x) != n)
+            or not np.can_cast(x.dtype, self.dtype)
+        ):
+            return np.zeros(x.shape[:1] if n is None else n, dtype=np.bool_)
+
+        axes = tuple(range(1, x.ndim))
+        return np.all(x >= self.low, axis=axes) & np.all(x <= self.high, axis=axes)
+
     def to_jsonable(self, sample_n):
         """Convert a batch of samples from this space to a JSONable data type."""
         return np.array(sample_n).tolist()
@@ -277,6 +418,9 @@ class Box(Space[np.ndarray]):
         if not hasattr(self, "high_repr"):
             self.high_repr = _short_repr(self.high)
 
+        if "_sample_plan" not in state:
+            self._sample_plan = None
+
 
 def get_inf(dtype, sign: str) -> SupportsFloat:
     """Returns an infinite that doesn't break things.
@@ -1,4 +1,5 @@
 """Implementation of a space that represents the cartesian product of other spaces as a dictionary."""
+import functools
 from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from typing import Any
@@ -183,12 +184,64 @@ class Dict(Space[TypingDict[str, Space]], Mapping):
 
         return OrderedDict([(k, space.sample()) for k, space in self.spaces.items()])
 
+    def sample_batch(self, n: int, mask: Optional[TypingDict[str, Any]] = None) -> dict:
+        """Generates a batch of ``n`` random samples from this space, as an ordered dictionary of the batches of the subspaces.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask for each of the subspaces, expects the same keys as the space
+
+        Returns:
+            A dictionary with the same keys and the batches of samples of :attr:`self.spaces`
+        """
+        if mask is not None:
+            assert isinstance(
+                mask, dict
+            ), f"Expects mask to be a dict, actual type: {type(mask)}"
+            assert (
+                mask.keys() == self.spaces.keys()
+            ), f"Expect mask keys to be same as space keys, mask keys: {mask.keys()}, space keys: {self.spaces.keys()}"
+            return OrderedDict(
+                [
+                    (k, space.sample_batch(n, mask[k]))
+                    for k, space in self.spaces.items()
+                ]
+            )
+
+        return OrderedDict(
+            [(k, space.sample_batch(n)) for k, space in self.spaces.items()]
+        )
+
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, dict) and x.keys() == self.spaces.keys():
             return all(x[key] in self.spaces[key] for key in self.spaces.keys())
         return False
 
+    def contains_batch(self, x: dict, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each sample of the batch ``x`` if it is a member of this space.
+
+        Args:
+            x: A dictionary of the batches of the subspaces, as returned by :meth:`sample_batch`
+            n: The expected number of samples. If ``None``, it is inferred from the batches of the subspaces,
+                so it is required for a ``Dict`` without subspaces (whose batches are empty dictionaries).
+
+        Returns:
+            A boolean array of shape ``(n,)``
+        """
+        if not isinstance(x, dict) or x.keys() != self.spaces.keys():
+            return np.zeros(() if n is None else n, dtype=np.bool_)
+        contained = []
+        for key, space in self.spaces.items():
+            contained.append(space.contains_batch(x[key], n=n))
+            if n is None and contained[-1].ndim == 1:
+                # The batches of the next subspaces must have as many samples
+                n = len(contained[-1])
+        # The subspaces whose batches have an unknown number of samples return `False` with shape `()`
+        return functools.reduce(
+            np.logical_and, contained, np.ones(() if n is None else n, dtype=np.bool_)
+        )
+
     def __getitem__(self, key: str) -> Space:
         """Get the space that is associated to `key`."""
         return self.spaces[key]
@@ -58,19 +58,7 @@ class Discrete(Space[int]):
             A sampled integer from the space
         """
         if mask is not None:
-            assert isinstance(
-                mask, np.ndarray
-            ), f"The expected type of the mask is np.ndarray, actual type: {type(mask)}"
-            assert (
-                mask.dtype == np.int8
-            ), f"The expected dtype of the mask is np.int8, actual dtype: {mask.dtype}"
-            assert mask.shape == (
-                self.n,
-            ), f"The expected shape of the mask is {(self.n,)}, actual shape: {mask.shape}"
-            valid_action_mask = mask == 1
-            assert np.all(
-                np.logical_or(mask == 0, valid_action_mask)
-            ), f"All values of a mask should be 0 or 1, actual values: {mask}"
+            valid_action_mask = self._check_mask(mask)
             if np.any(valid_action_mask):
                 return int(
                     self.start + self.np_random.choice(np.where(valid_action_mask)[0])
@@ -80,6 +68,45 @@ class Discrete(Space[int]):
 
         return int(self.start + self.np_random.integers(self.n))
 
+    def sample_batch(self, n: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Generates a batch of ``n`` random samples from this space, of shape ``(n,)``.
+
+        The valid actions of the mask are computed once, and the samples are drawn with a single call.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask for if an action can be selected, used for all the samples (see :meth:`sample`).
+
+        Returns:
+            The batch of sampled integers
+        """
+        if mask is not None:
+            valid_actions = np.flatnonzero(self._check_mask(mask))
+            if len(valid_actions) == 0:
+                return np.full(n, self.start, dtype=self.dtype)
+            return (self.start + self.np_random.choice(valid_actions, size=n)).astype(
+                self.dtype
+            )
+
+        return (self.start + self.np_random.integers(self.n, size=n)).astype(self.dtype)
+
+    def _check_mask(self, mask: np.ndarray) -> np.ndarray:
+        """Checks the type, shape and values of a sample mask, and returns the boolean mask of the valid actions."""
+        assert isinstance(
+            mask, np.ndarray
+        ), f"The expected type of the mask is np.ndarray, actual type: {type(mask)}"
+        assert (
+            mask.dtype == np.int8
+        ), f"The expected dtype of the mask is np.int8, actual dtype: {mask.dtype}"
+        assert mask.shape == (
+            self.n,
+        ), f"The expected shape of the mask is {(self.n,)}, actual shape: {mask.shape}"
+        valid_action_mask = mask == 1
+        assert np.all(
+            np.logical_or(mask == 0, valid_action_mask)
+        ), f"All values of a mask should be 0 or 1, actual values: {mask}"
+        return valid_action_mask
+
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, int):
@@ -93,6 +120,23 @@ class Discrete(Space[int]):
 
         return self.start <= as_int < self.start + self.n
 
+    def contains_batch(self, x, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each element of ``x`` (of shape ``(n,)``) if it is a member of this space.
+
+        ``n`` is the expected number of samples, inferred from ``x`` if ``None``.
+        """
+        try:
+            x = np.asarray(x)
+        except (ValueError, TypeError):
+            return np.zeros(len(x) if n is None else n, dtype=np.bool_)
+        if (
+            x.ndim != 1
+            or (n is not None and len(x) != n)
+            or not np.issubdtype(x.dtype, np.integer)
+        ):
+            return np.zeros(x.shape[:1] if n is None else n, dtype=np.bool_)
+        return (self.start <= x) & (x < self.start + self.n)
+
     def __repr__(self) -> str:
         """Gives a string representation of this space."""
         if self.start != 0:
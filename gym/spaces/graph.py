@@ -112,6 +112,36 @@ class Graph(Space):
         Returns:
             A NamedTuple representing a graph with attributes .nodes, .edges, and .edge_links.
         """
+        # A batch of one graph draws the same random numbers as a single graph
+        return self.sample_batch(1, mask, num_nodes=num_nodes, num_edges=num_edges)[0]
+
+    def sample_batch(
+        self,
+        n: int,
+        mask: Optional[
+            Tuple[
+                Optional[Union[np.ndarray, tuple]],
+                Optional[Union[np.ndarray, tuple]],
+            ]
+        ] = None,
+        num_nodes: int = 10,
+        num_edges: Optional[int] = None,
+    ) -> Tuple[GraphInstance, ...]:
+        """Generates a batch of ``n`` sample graphs, as a tuple (the layout of the batches of custom spaces).
+
+        The numbers of edges, the nodes, the edges and the edge links of all the graphs are each drawn with a single
+        call, then split between the graphs.
+
+        Args:
+            n: The number of samples
+            mask: An optional tuple of optional node and edge mask used for all the samples (see :meth:`sample`)
+            num_nodes: The number of nodes of each graph, the default is 10 nodes
+            num_edges: An optional number of edges of each graph, otherwise, a random number between 0 and
+                `num_nodes`^2 for each graph
+
+        Returns:
+            A tuple of ``n`` graphs
+        """
         assert (
             num_nodes > 0
         ), f"The number of nodes is expected to be greater than 0, actual value: {num_nodes}"
@@ -121,16 +151,18 @@ class Graph(Space):
         else:
             node_space_mask, edge_space_mask = None, None
 
-        # we only have edges when we have at least 2 nodes
         if num_edges is None:
             if num_nodes > 1:
-                # maximal number of edges is `n*(n-1)` allowing self connections and two-way is allowed
-                num_edges = self.np_random.integers(num_nodes * (num_nodes - 1))
+                nums_edges = self.np_random.integers(
+                    num_nodes * (num_nodes - 1), size=n
+                )
             else:
-                num_edges = 0
+                nums_edges = np.zeros(n, dtype=np.int64)
 
             if edge_space_mask is not None:
-                edge_space_mask = tuple(edge_space_mask for _ in range(num_edges))
+                edge_space_mask = tuple(
+                    edge_space_mask for _ in range(int(nums_edges.sum()))
+                )
         else:
             if self.edge_space is None:
                 warn(
@@ -139,26 +171,48 @@ class Graph(Space):
             assert (
                 num_edges >= 0
             ), f"Expects the number of edges to be greater than 0, actual value: {num_edges}"
-        assert num_edges is not None
+            nums_edges = np.full(n, num_edges, dtype=np.int64)
+            if edge_space_mask is not None:
+                edge_space_mask = tuple(edge_space_mask) * n
+        if node_space_mask is not None:
+            node_space_mask = tuple(node_space_mask) * n
 
-        sampled_node_space = self._generate_sample_space(self.node_space, num_nodes)
-        sampled_edge_space = self._generate_sample_space(self.edge_space, num_edges)
+        sampled_node_space = self._generate_sample_space(self.node_space, n * num_nodes)
+        sampled_edge_space = self._generate_sample_space(
+            self.edge_space, int(nums_edges.sum())
+        )
 
         assert sampled_node_space is not None
-        sampled_nodes = sampled_node_space.sample(node_space_mask)
+        sampled_nodes = sampled_node_space.sample(node_space_mask).reshape(
+            (n, num_nodes) + self.node_space.shape
+        )
         sampled_edges = (
             sampled_edge_space.sample(edge_space_mask)
             if sampled_edge_space is not None
             else None
         )
-
-        sampled_edge_links = None
-        if sampled_edges is not None and num_edges > 0:
-            sampled_edge_links = self.np_random.integers(
-                low=0, high=num_nodes, size=(num_edges, 2)
+        sampled_edge_links = (
+            self.np_random.integers(
+                low=0, high=num_nodes, size=(int(nums_edges.sum()), 2)
             )
+            if sampled_edges is not None
+            else None
+        )
 
-        return GraphInstance(sampled_nodes, sampled_edges, sampled_edge_links)
+        graphs = []
+        ends = np.cumsum(nums_edges)
+        for nodes, end, num in zip(sampled_nodes, ends, nums_edges):
+            if sampled_edges is None or num == 0:
+                graphs.append(GraphInstance(nodes, None, None))
+            else:
+                graphs.append(
+                    GraphInstance(
+                        nodes,
+                        sampled_edges[end - num : end],
+                        sampled_edge_links[end - num : end],
+                    )
+                )
+        return tuple(graphs)
 
     def contains(self, x: GraphInstance) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
@@ -69,18 +69,7 @@ class MultiBinary(Space[np.ndarray]):
             Sampled values from space
         """
         if mask is not None:
-            assert isinstance(
-                mask, np.ndarray
-            ), f"The expected type of the mask is np.ndarray, actual type: {type(mask)}"
-            assert (
-                mask.dtype == np.int8
-            ), f"The expected dtype of the mask is np.int8, actual dtype: {mask.dtype}"
-            assert (
-                mask.shape == self.shape
-            ), f"The expected shape of the mask is {self.shape}, actual shape: {mask.shape}"
-            assert np.all(
-                (mask == 0) | (mask == 1) | (mask == 2)
-            ), f"All values of a mask should be 0, 1 or 2, actual values: {mask}"
+            self._check_mask(mask)
 
             return np.where(
                 mask == 2,
@@ -90,6 +79,39 @@ class MultiBinary(Space[np.ndarray]):
 
         return self.np_random.integers(low=0, high=2, size=self.n, dtype=self.dtype)
 
+    def sample_batch(self, n: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Generates a batch of ``n`` random samples from this space, of shape ``(n, *shape)``.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask used for all the samples (see :meth:`sample`).
+
+        Returns:
+            The batch of sampled values
+        """
+        samples = self.np_random.integers(
+            low=0, high=2, size=(n,) + self.shape, dtype=self.dtype
+        )
+        if mask is not None:
+            self._check_mask(mask)
+            return np.where(mask == 2, samples, mask.astype(self.dtype))
+        return samples
+
+    def _check_mask(self, mask: np.ndarray):
+        """Checks the type, shape and values of a sample mask."""
+        assert isinstance(
+            mask, np.ndarray
+        ), f"The expected type of the mask is np.ndarray, actual type: {type(mask)}"
+        assert (
+            mask.dtype == np.int8
+        ), f"The expected dtype of the mask is np.int8, actual dtype: {mask.dtype}"
+        assert (
+            mask.shape == self.shape
+        ), f"The expected shape of the mask is {self.shape}, actual shape: {mask.shape}"
+        assert np.all(
+            (mask == 0) | (mask == 1) | (mask == 2)
+        ), f"All values of a mask should be 0, 1 or 2, actual values: {mask}"
+
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, Sequence):
@@ -98,9 +120,22 @@ class MultiBinary(Space[np.ndarray]):
         return bool(
             isinstance(x, np.ndarray)
             and self.shape == x.shape
-            and np.all((x == 0) | (x == 1))
+            and ((x == 0) | (x == 1)).all()
         )
 
+    def contains_batch(self, x, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each row of ``x`` (of shape ``(n, *shape)``) if it is a member of this space.
+
+        ``n`` is the expected number of samples, inferred from ``x`` if ``None``.
+        """
+        try:
+            x = np.asarray(x)
+        except (ValueError, TypeError):
+            return np.zeros(len(x) if n is None else n, dtype=np.bool_)
+        if x.ndim == 0 or x.shape[1:] != self.shape or (n is not None and len(x) != n):
+            return np.zeros(x.shape[:1] if n is None else n, dtype=np.bool_)
+        return np.all((x == 0) | (x == 1), axis=tuple(range(1, x.ndim)))
+
     def to_jsonable(self, sample_n) -> list:
         """Convert a batch of samples from this space to a JSONable data type."""
         return np.array(sample_n).tolist()
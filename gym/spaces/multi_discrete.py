@@ -78,50 +78,73 @@ class MultiDiscrete(Space[np.ndarray]):
             An `np.ndarray` of shape `space.shape`
         """
         if mask is not None:
-
-            def _apply_mask(
-                sub_mask: Union[np.ndarray, tuple],
-                sub_nvec: Union[np.ndarray, np.integer],
-            ) -> Union[int, List[int]]:
-                if isinstance(sub_nvec, np.ndarray):
-                    assert isinstance(
-                        sub_mask, tuple
-                    ), f"Expects the mask to be a tuple for sub_nvec ({sub_nvec}), actual type: {type(sub_mask)}"
-                    assert len(sub_mask) == len(
-                        sub_nvec
-                    ), f"Expects the mask length to be equal to the number of actions, mask length: {len(sub_mask)}, nvec length: {len(sub_nvec)}"
-                    return [
-                        _apply_mask(new_mask, new_nvec)
-                        for new_mask, new_nvec in zip(sub_mask, sub_nvec)
-                    ]
-                else:
-                    assert np.issubdtype(
-                        type(sub_nvec), np.integer
-                    ), f"Expects the sub_nvec to be an action, actually: {sub_nvec}, {type(sub_nvec)}"
-                    assert isinstance(
-                        sub_mask, np.ndarray
-                    ), f"Expects the sub mask to be np.ndarray, actual type: {type(sub_mask)}"
-                    assert (
-                        len(sub_mask) == sub_nvec
-                    ), f"Expects the mask length to be equal to the number of actions, mask length: {len(sub_mask)}, action: {sub_nvec}"
-                    assert (
-                        sub_mask.dtype == np.int8
-                    ), f"Expects the mask dtype to be np.int8, actual dtype: {sub_mask.dtype}"
-
-                    valid_action_mask = sub_mask == 1
-                    assert np.all(
-                        np.logical_or(sub_mask == 0, valid_action_mask)
-                    ), f"Expects all masks values to 0 or 1, actual values: {sub_mask}"
-
-                    if np.any(valid_action_mask):
-                        return self.np_random.choice(np.where(valid_action_mask)[0])
-                    else:
-                        return 0
-
-            return np.array(_apply_mask(mask, self.nvec), dtype=self.dtype)
+            return np.array(self._sample_masked(mask, self.nvec), dtype=self.dtype)
 
         return (self.np_random.random(self.nvec.shape) * self.nvec).astype(self.dtype)
 
+    def sample_batch(self, n: int, mask: Optional[tuple] = None) -> np.ndarray:
+        """Generates a batch of ``n`` random samples from this space, of shape ``(n, *shape)``.
+
+        Without a mask, the whole batch is drawn with a single call. With a mask, the valid actions of each position
+        are computed once and drawn for the whole batch.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask for multi-discrete used for all the samples (see :meth:`sample`).
+
+        Returns:
+            An `np.ndarray` of shape `(n, *space.shape)`
+        """
+        if mask is not None:
+            return self._sample_masked(mask, self.nvec, n).astype(self.dtype)
+
+        return (self.np_random.random((n,) + self.nvec.shape) * self.nvec).astype(
+            self.dtype
+        )
+
+    def _sample_masked(
+        self,
+        sub_mask: Union[np.ndarray, tuple],
+        sub_nvec: Union[np.ndarray, np.integer],
+        n: Optional[int] = None,
+    ) -> Union[int, List[int], np.ndarray]:
+        """Samples the actions of ``sub_nvec`` with ``sub_mask``, a single sample if ``n`` is ``None`` else a batch of ``n`` samples."""
+        if isinstance(sub_nvec, np.ndarray):
+            assert isinstance(
+                sub_mask, tuple
+            ), f"Expects the mask to be a tuple for sub_nvec ({sub_nvec}), actual type: {type(sub_mask)}"
+            assert len(sub_mask) == len(
+                sub_nvec
+            ), f"Expects the mask length to be equal to the number of actions, mask length: {len(sub_mask)}, nvec length: {len(sub_nvec)}"
+            samples = [
+                self._sample_masked(new_mask, new_nvec, n)
+                for new_mask, new_nvec in zip(sub_mask, sub_nvec)
+            ]
+            return samples if n is None else np.stack(samples, axis=1)
+        else:
+            assert np.issubdtype(
+                type(sub_nvec), np.integer
+            ), f"Expects the sub_nvec to be an action, actually: {sub_nvec}, {type(sub_nvec)}"
+            assert isinstance(
+                sub_mask, np.ndarray
+            ), f"Expects the sub mask to be np.ndarray, actual type: {type(sub_mask)}"
+            assert (
+                len(sub_mask) == sub_nvec
+            ), f"Expects the mask length to be equal to the number of actions, mask length: {len(sub_mask)}, action: {sub_nvec}"
+            assert (
+                sub_mask.dtype == np.int8
+            ), f"Expects the mask dtype to be np.int8, actual dtype: {sub_mask.dtype}"
+
+            valid_action_mask = sub_mask == 1
+            assert np.all(
+                np.logical_or(sub_mask == 0, valid_action_mask)
+            ), f"Expects all masks values to 0 or 1, actual values: {sub_mask}"
+
+            if np.any(valid_action_mask):
+                return self.np_random.choice(np.where(valid_action_mask)[0], size=n)
+            else:
+                return 0 if n is None else np.zeros(n, dtype=np.int64)
+
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, Sequence):
@@ -133,10 +156,29 @@ class MultiDiscrete(Space[np.ndarray]):
             isinstance(x, np.ndarray)
             and x.shape == self.shape
             and x.dtype != object
-            and np.all(0 <= x)
-            and np.all(x < self.nvec)
+            and (0 <= x).all()
+            and (x < self.nvec).all()
         )
 
+    def contains_batch(self, x, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each row of ``x`` (of shape ``(n, *shape)``) if it is a member of this space.
+
+        ``n`` is the expected number of samples, inferred from ``x`` if ``None``.
+        """
+        try:
+            x = np.asarray(x)
+        except (ValueError, TypeError):
+            return np.zeros(len(x) if n is None else n, dtype=np.bool_)
+        if (
+            x.ndim == 0
+            or x.shape[1:] != self.shape
+            or (n is not None and len(x) != n)
+            or x.dtype == object
+        ):
+            return np.zeros(x.shape[:1] if n is None else n, dtype=np.bool_)
+        axes = tuple(range(1, x.ndim))
+        return np.all(0 <= x, axis=axes) & np.all(x < self.nvec, axis=axes)
+
     def to_jsonable(self, sample_n: Iterable[np.ndarray]):
         """Convert a batch of samples from this space to a JSONable data type."""
         return [sample.tolist() for sample in sample_n]
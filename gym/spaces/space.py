@@ -20,6 +20,36 @@ from gym.utils import seeding
 
 T_cov = TypeVar("T_cov", covariant=True)
 
+# The validation levels of :meth:`Space.check`
+VALIDATION_NONE = 0
+VALIDATION_CONTAINS = 1
+
+validation_level = VALIDATION_CONTAINS
+
+
+def set_validation_level(level: int):
+    """Sets the validation level of the per-step containment checks done with :meth:`Space.check`.
+
+    With ``VALIDATION_NONE``, :meth:`Space.check` returns ``True`` without checking its argument, such that the
+    containment asserts of the environments (e.g. of the actions in :meth:`Env.step`) are no-ops in production runs.
+    With ``VALIDATION_CONTAINS`` (the default), :meth:`Space.check` is :meth:`Space.contains`.
+
+    Example::
+
+        >>> gym.spaces.set_validation_level(gym.spaces.space.VALIDATION_NONE)
+        >>> Discrete(2).check(5)
+        True
+
+    Args:
+        level: The validation level, either ``VALIDATION_NONE`` or ``VALIDATION_CONTAINS``
+    """
+    global validation_level
+    assert level in (
+        VALIDATION_NONE,
+        VALIDATION_CONTAINS,
+    ), f"Expect the validation level to be VALIDATION_NONE ({VALIDATION_NONE}) or VALIDATION_CONTAINS ({VALIDATION_CONTAINS}), actual value: {level}"
+    validation_level = level
+
 
 class Space(Generic[T_cov]):
     """Superclass that is used to define observation and action spaces.
@@ -100,6 +130,22 @@ class Space(Generic[T_cov]):
         """
         raise NotImplementedError
 
+    def sample_batch(self, n: int, mask: Optional[Any] = None) -> Any:
+        """Randomly sample ``n`` elements of this space, with the same distribution as :meth:`sample`.
+
+        The batch has the layout of ``gym.vector.utils.create_empty_array(space, n)``, e.g. a numpy array of shape
+        ``(n, *shape)`` for :class:`Box`. Subclasses draw the whole batch with vectorized calls to :attr:`np_random`,
+        whereas this default implementation calls :meth:`sample` ``n`` times and returns a tuple of the samples.
+
+        Args:
+            n: The number of samples
+            mask: A mask used for all the samples, with the same format as the mask of :meth:`sample`.
+
+        Returns:
+            A batch of ``n`` samples from the space
+        """
+        return tuple(self.sample(mask) for _ in range(n))
+
     def seed(self, seed: Optional[int] = None) -> list:
         """Seed the PRNG of this space and possibly the PRNGs of subspaces."""
         self._np_random, seed = seeding.np_random(seed)
@@ -109,6 +155,33 @@ class Space(Generic[T_cov]):
         """Return boolean specifying if x is a valid member of this space."""
         raise NotImplementedError
 
+    def contains_batch(self, x, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each sample of the batch ``x`` if it is a valid member of this space.
+
+        ``x`` has the layout of :meth:`sample_batch`. Subclasses check the whole batch with vectorized operations,
+        whereas this default implementation calls :meth:`contains` on each sample of the tuple ``x``.
+        A batch whose structure does not match the space (e.g. a 0-d array) is not a member, and the returned array
+        is all ``False``, with shape ``()`` if its number of samples is not known.
+
+        Args:
+            x: A batch of samples
+            n: The expected number of samples. If ``None``, it is inferred from ``x``.
+
+        Returns:
+            A boolean array of shape ``(n,)``
+        """
+        if not isinstance(x, (tuple, list)) or (n is not None and len(x) != n):
+            return np.zeros(() if n is None else n, dtype=np.bool_)
+        return np.array([self.contains(sample) for sample in x], dtype=np.bool_)
+
+    def check(self, x) -> bool:
+        """Checks if ``x`` is a valid member of this space, for the per-step asserts of the environments.
+
+        This is :meth:`contains`, unless the validation level set with :func:`set_validation_level` is
+        ``VALIDATION_NONE``, then ``True`` is returned without checking ``x``.
+        """
+        return validation_level == VALIDATION_NONE or self.contains(x)
+
     def __contains__(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         return self.contains(x)
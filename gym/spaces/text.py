@@ -81,38 +81,7 @@ class Text(Space[str]):
         Returns:
             A sampled string from the space
         """
-        if mask is not None:
-            assert isinstance(
-                mask, tuple
-            ), f"Expects the mask type to be a tuple, actual type: {type(mask)}"
-            assert (
-                len(mask) == 2
-            ), f"Expects the mask length to be two, actual length: {len(mask)}"
-            length, charlist_mask = mask
-
-            if length is not None:
-                assert np.issubdtype(
-                    type(length), np.integer
-                ), f"Expects the Text sample length to be an integer, actual type: {type(length)}"
-                assert (
-                    self.min_length <= length <= self.max_length
-                ), f"Expects the Text sample length be between {self.min_length} and {self.max_length}, actual length: {length}"
-
-            if charlist_mask is not None:
-                assert isinstance(
-                    charlist_mask, np.ndarray
-                ), f"Expects the Text sample mask to be an np.ndarray, actual type: {type(charlist_mask)}"
-                assert (
-                    charlist_mask.dtype == np.int8
-                ), f"Expects the Text sample mask to be an np.ndarray, actual dtype: {charlist_mask.dtype}"
-                assert charlist_mask.shape == (
-                    len(self.character_set),
-                ), f"expects the Text sample mask to be {(len(self.character_set),)}, actual shape: {charlist_mask.shape}"
-                assert np.all(
-                    np.logical_or(charlist_mask == 0, charlist_mask == 1)
-                ), f"Expects all masks values to 0 or 1, actual values: {charlist_mask}"
-        else:
-            length, charlist_mask = None, None
+        length, charlist_mask = self._check_mask(mask)
 
         if length is None:
             length = self.np_random.integers(self.min_length, self.max_length + 1)
@@ -138,6 +107,85 @@ class Text(Space[str]):
 
         return "".join(string)
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: Optional[Tuple[Optional[int], Optional[np.ndarray]]] = None,
+    ) -> Tuple[str, ...]:
+        """Generates a batch of ``n`` random strings, as a tuple (the layout of the batches of custom spaces).
+
+        The lengths of the strings are drawn with a single call, then all their characters with another call.
+
+        Args:
+            n: The number of samples
+            mask: An optional tuple of length and mask for the text used for all the samples (see :meth:`sample`).
+
+        Returns:
+            A tuple of ``n`` sampled strings from the space
+        """
+        length, charlist_mask = self._check_mask(mask)
+
+        if length is None:
+            lengths = self.np_random.integers(
+                self.min_length, self.max_length + 1, size=n
+            )
+        else:
+            lengths = np.full(n, length)
+
+        if charlist_mask is None:
+            characters = self.character_list
+        else:
+            valid_indexes = np.where(charlist_mask == 1)[0]
+            if len(valid_indexes) == 0:
+                if self.min_length == 0:
+                    return tuple("" for _ in range(n))
+                raise ValueError(
+                    f"Trying to sample with a minimum length > 0 ({self.min_length}) but the character mask is all zero meaning that no character could be sampled."
+                )
+            characters = [self.character_list[index] for index in valid_indexes]
+
+        text = "".join(self.np_random.choice(characters, size=int(lengths.sum())))
+        ends = np.cumsum(lengths)
+        return tuple(text[end - length : end] for end, length in zip(ends, lengths))
+
+    def _check_mask(
+        self, mask: Optional[Tuple[Optional[int], Optional[np.ndarray]]]
+    ) -> Tuple[Optional[int], Optional[np.ndarray]]:
+        """Checks a sample mask, and returns its length and character mask (``None`` if not provided)."""
+        if mask is None:
+            return None, None
+        assert isinstance(
+            mask, tuple
+        ), f"Expects the mask type to be a tuple, actual type: {type(mask)}"
+        assert (
+            len(mask) == 2
+        ), f"Expects the mask length to be two, actual length: {len(mask)}"
+        length, charlist_mask = mask
+
+        if length is not None:
+            assert np.issubdtype(
+                type(length), np.integer
+            ), f"Expects the Text sample length to be an integer, actual type: {type(length)}"
+            assert (
+                self.min_length <= length <= self.max_length
+            ), f"Expects the Text sample length be between {self.min_length} and {self.max_length}, actual length: {length}"
+
+        if charlist_mask is not None:
+            assert isinstance(
+                charlist_mask, np.ndarray
+            ), f"Expects the Text sample mask to be an np.ndarray, actual type: {type(charlist_mask)}"
+            assert (
+                charlist_mask.dtype == np.int8
+            ), f"Expects the Text sample mask to be an np.ndarray, actual dtype: {charlist_mask.dtype}"
+            assert charlist_mask.shape == (
+                len(self.character_set),
+            ), f"expects the Text sample mask to be {(len(self.character_set),)}, actual shape: {charlist_mask.shape}"
+            assert np.all(
+                np.logical_or(charlist_mask == 0, charlist_mask == 1)
+            ), f"Expects all masks values to 0 or 1, actual values: {charlist_mask}"
+
+        return length, charlist_mask
+
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, str):
@@ -1,4 +1,5 @@
 """Implementation of a space that represents the cartesian product of other spaces."""
+import functools
 from collections.abc import Sequence as CollectionSequence
 from typing import Iterable, Optional
 from typing import Sequence as TypingSequence
@@ -115,6 +116,34 @@ class Tuple(Space[tuple], CollectionSequence):
 
         return tuple(space.sample() for space in self.spaces)
 
+    def sample_batch(
+        self, n: int, mask: Optional[TypingTuple[Optional[np.ndarray], ...]] = None
+    ) -> tuple:
+        """Generates a batch of ``n`` random samples inside this space, as a tuple of the batches of the subspaces.
+
+        Args:
+            n: The number of samples
+            mask: An optional tuple of optional masks for each of the subspace's samples,
+                expects the same number of masks as spaces
+
+        Returns:
+            Tuple of the subspace's batches of samples
+        """
+        if mask is not None:
+            assert isinstance(
+                mask, tuple
+            ), f"Expected type of mask is tuple, actual type: {type(mask)}"
+            assert len(mask) == len(
+                self.spaces
+            ), f"Expected length of mask is {len(self.spaces)}, actual length: {len(mask)}"
+
+            return tuple(
+                space.sample_batch(n, mask=sub_mask)
+                for space, sub_mask in zip(self.spaces, mask)
+            )
+
+        return tuple(space.sample_batch(n) for space in self.spaces)
+
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, (list, np.ndarray)):
@@ -125,6 +154,30 @@ class Tuple(Space[tuple], CollectionSequence):
             and all(space.contains(part) for (space, part) in zip(self.spaces, x))
         )
 
+    def contains_batch(self, x: tuple, n: Optional[int] = None) -> np.ndarray:
+        """Returns a boolean array specifying for each sample of the batch ``x`` if it is a member of this space.
+
+        Args:
+            x: A tuple of the batches of the subspaces, as returned by :meth:`sample_batch`
+            n: The expected number of samples. If ``None``, it is inferred from the batches of the subspaces,
+                so it is required for a ``Tuple`` without subspaces (whose batches are empty tuples).
+
+        Returns:
+            A boolean array of shape ``(n,)``
+        """
+        if not isinstance(x, tuple) or len(x) != len(self.spaces):
+            return np.zeros(() if n is None else n, dtype=np.bool_)
+        contained = []
+        for space, part in zip(self.spaces, x):
+            contained.append(space.contains_batch(part, n=n))
+            if n is None and contained[-1].ndim == 1:
+                # The batches of the next subspaces must have as many samples
+                n = len(contained[-1])
+        # The subspaces whose batches have an unknown number of samples return `False` with shape `()`
+        return functools.reduce(
+            np.logical_and, contained, np.ones(() if n is None else n, dtype=np.bool_)
+        )
+
     def __repr__(self) -> str:
         """Gives a string representation of this space."""
         return "Tuple(" + ", ".join([str(s) for s in self.spaces]) + ")"
@@ -1,12 +1,42 @@
 """Module for vector environments."""
-from typing import Iterable, List, Optional, Union
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Iterable, List, Optional, Tuple, Union
 
 import gym
-from gym.vector.async_vector_env import AsyncVectorEnv
+from gym.envs.registration import EnvSpec
+from gym.vector import wrappers
+from gym.vector.async_vector_env import AsyncState, AsyncVectorEnv
+from gym.vector.double_batch_vector_env import DoubleBatchVectorEnv
+from gym.vector.numpy_vector_env import NumpyVectorEnv
+from gym.vector.rollout_collector import Rollout, RolloutCollector
 from gym.vector.sync_vector_env import SyncVectorEnv
+from gym.vector.threaded_vector_env import ThreadedVectorEnv
 from gym.vector.vector_env import VectorEnv, VectorEnvWrapper
 
-__all__ = ["AsyncVectorEnv", "SyncVectorEnv", "VectorEnv", "VectorEnvWrapper", "make"]
+__all__ = [
+    "AsyncState",
+    "AsyncVectorEnv",
+    "DoubleBatchVectorEnv",
+    "NumpyVectorEnv",
+    "Rollout",
+    "RolloutCollector",
+    "SyncVectorEnv",
+    "ThreadedVectorEnv",
+    "VectorEnv",
+    "VectorEnvWrapper",
+    "make",
+    "wrappers",
+]
+
+# The environment specification and the spaces of a single environment made by `make`, keyed by the environment id,
+# wrappers and kwargs, such that the next asynchronous vector environments do not create an environment in the main
+# process. An entry is only valid while the id is registered with the same specification, and the least recently
+# used entries are dropped above `_SINGLE_SPACES_MAX_SIZE` entries.
+_single_spaces: "OrderedDict[tuple, Tuple[EnvSpec, gym.Space, gym.Space]]" = (
+    OrderedDict()
+)
+_SINGLE_SPACES_MAX_SIZE = 64
 
 
 def make(
@@ -15,6 +45,9 @@ def make(
     asynchronous: bool = True,
     wrappers: Optional[Union[callable, List[callable]]] = None,
     disable_env_checker: Optional[bool] = None,
+    threaded: bool = False,
+    vector_kwargs: Optional[dict] = None,
+    native: bool = False,
     **kwargs,
 ) -> VectorEnv:
     """Create a vectorized environment from multiple copies of an environment, from its id.
@@ -36,11 +69,44 @@ def make(
         wrappers: If not ``None``, then apply the wrappers to each internal environment during creation.
         disable_env_checker: If to run the env checker for the first environment only. None will default to the environment spec `disable_env_checker` parameter
             (that is by default False), otherwise will run according to this argument (True = not run, False = run)
+        threaded: If ``True``, wraps the environments in a :class:`ThreadedVectorEnv` (which uses a thread pool to run
+            the environments in parallel), regardless of ``asynchronous``. This is efficient for simulators that release the GIL.
+        vector_kwargs: Keyword arguments applied to the vector environment (e.g. ``context``, ``shared_step_buffers``).
+            For an :class:`AsyncVectorEnv`, the spaces of the environment are inferred from its first creation
+            with the same ``id``, ``wrappers`` and ``kwargs`` (without creating an environment in the main process
+            afterwards), unless the spaces are given in ``vector_kwargs``, and with the ``"forkserver"`` context, the module of the environment's entry point is
+            preloaded by the forkserver process.
+        native: If ``True``, creates the natively vectorized implementation of the environment registered as its
+            ``vector_entry_point`` (e.g. a :class:`NumpyVectorEnv` stepping all the sub-environments with numpy
+            operations), regardless of ``asynchronous`` and ``threaded``. The ``max_episode_steps`` of the environment
+            specification is passed to it, along with ``vector_kwargs`` and ``kwargs``.
         **kwargs: Keywords arguments applied during `gym.make`
 
     Returns:
         The vectorized environment.
+
+    Raises:
+        Error: If ``native=True`` and the environment has no ``vector_entry_point``.
+        ValueError: If ``native=True`` with ``wrappers``, which apply to single environments.
     """
+    if native:
+        spec = gym.spec(id)
+        if spec.vector_entry_point is None:
+            raise gym.error.Error(
+                f"The environment `{spec.id}` has no natively vectorized implementation (`vector_entry_point`)."
+            )
+        if wrappers is not None:
+            raise ValueError(
+                "`wrappers` apply to single environments and cannot be used with `native=True`."
+            )
+        if callable(spec.vector_entry_point):
+            env_creator = spec.vector_entry_point
+        else:
+            env_creator = gym.envs.registration.load(spec.vector_entry_point)
+        env_kwargs = {"max_episode_steps": spec.max_episode_steps, **spec.kwargs}
+        env_kwargs.update(kwargs)
+        env_kwargs.update(vector_kwargs or {})
+        return env_creator(num_envs=num_envs, **env_kwargs)
 
     def create_env(env_num: int):
         """Creates an environment that can enable or disable the environment checker."""
@@ -70,4 +136,42 @@ def make(
     env_fns = [
         create_env(disable_env_checker or env_num > 0) for env_num in range(num_envs)
     ]
-    return AsyncVectorEnv(env_fns) if asynchronous else SyncVectorEnv(env_fns)
+    vector_kwargs = dict(vector_kwargs or {})
+    if threaded:
+        return ThreadedVectorEnv(env_fns, **vector_kwargs)
+    if not asynchronous:
+        return SyncVectorEnv(env_fns, **vector_kwargs)
+
+    spec = gym.spec(id)
+    if isinstance(spec.entry_point, str):
+        vector_kwargs.setdefault("preload_modules", [spec.entry_point.split(":")[0]])
+    if any(
+        key in vector_kwargs
+        for key in ("observation_space", "action_space", "observation_transform")
+    ):
+        # The spaces are given explicitly (and may be transformed), they are neither taken from nor added to the cache
+        return AsyncVectorEnv(env_fns, **vector_kwargs)
+
+    wrappers_key = tuple(wrappers) if isinstance(wrappers, Iterable) else wrappers
+    spaces_key = (spec.id, wrappers_key, repr(sorted(kwargs.items())))
+    if spaces_key in _single_spaces and _single_spaces[spaces_key][0] is spec:
+        _, observation_space, action_space = _single_spaces[spaces_key]
+        vector_kwargs["observation_space"] = _copy_space(observation_space)
+        vector_kwargs["action_space"] = _copy_space(action_space)
+    env = AsyncVectorEnv(env_fns, **vector_kwargs)
+    _single_spaces[spaces_key] = (
+        spec,
+        _copy_space(env.single_observation_space),
+        _copy_space(env.single_action_space),
+    )
+    _single_spaces.move_to_end(spaces_key)
+    while len(_single_spaces) > _SINGLE_SPACES_MAX_SIZE:
+        _single_spaces.popitem(last=False)
+    return env
+
+
+def _copy_space(space: gym.Space) -> gym.Space:
+    """Returns a copy of ``space`` with a new random number generator, such that the vector environments made from the cache do not share the sampling streams."""
+    space = deepcopy(space)
+    space.seed()
+    return space
@@ -1,10 +1,14 @@
 """An async vector environment."""
 import multiprocessing as mp
+import os
 import sys
 import time
+from collections import OrderedDict, deque
 from copy import deepcopy
+from ctypes import c_bool
 from enum import Enum
-from typing import List, Optional, Sequence, Tuple, Union
+from multiprocessing import connection
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -19,24 +23,40 @@ from gym.error import (
 )
 from gym.vector.utils import (
     CloudpickleWrapper,
+    SharedMemoryArena,
     clear_mpi_env_vars,
     concatenate,
+    copy_batch,
     create_empty_array,
+    create_shared_info_memory,
     create_shared_memory,
+    dump_env_state,
+    get_batch_item,
+    get_env_rng_state,
     iterate,
+    load_env_state,
     read_from_shared_memory,
+    read_info_from_shared_memory,
+    scatter,
+    seed_env,
+    set_batch_item,
+    set_env_rng_state,
     write_to_shared_memory,
 )
-from gym.vector.vector_env import VectorEnv
+from gym.vector.vector_env import AUTORESET_MODES, VectorEnv, _summarize_counter
+from gym.wrappers.transform_observation import TransformObservation
 
-__all__ = ["AsyncVectorEnv"]
+__all__ = ["AsyncState", "AsyncVectorEnv"]
 
 
 class AsyncState(Enum):
+    """The call of an :class:`AsyncVectorEnv` whose results are awaited, e.g. ``WAITING_STEP`` between :meth:`AsyncVectorEnv.step_async` and :meth:`AsyncVectorEnv.step_wait`."""
+
     DEFAULT = "default"
     WAITING_RESET = "reset"
     WAITING_STEP = "step"
     WAITING_CALL = "call"
+    WAITING_CALL_BATCH = "call_batch"
 
 
 class AsyncVectorEnv(VectorEnv):
@@ -66,6 +86,15 @@ class AsyncVectorEnv(VectorEnv):
         context: Optional[str] = None,
         daemon: bool = True,
         worker: Optional[callable] = None,
+        shared_step_buffers: bool = False,
+        envs_per_worker: int = 1,
+        shared_info_dtypes: Optional[Dict[str, np.dtype]] = None,
+        cpu_affinity: Optional[Union[bool, Sequence[Union[int, Sequence[int]]]]] = None,
+        num_observation_buffers: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+        preload_modules: Optional[Sequence[str]] = None,
+        respawn_workers: bool = False,
+        observation_transform: Optional[Callable[[Any], Any]] = None,
     ):
         """Vectorized environment that runs multiple environments in parallel.
 
@@ -74,17 +103,60 @@ class AsyncVectorEnv(VectorEnv):
             observation_space: Observation space of a single environment. If ``None``,
                 then the observation space of the first environment is taken.
             action_space: Action space of a single environment. If ``None``,
-                then the action space of the first environment is taken.
+                then the action space of the first environment is taken. If both ``observation_space`` and
+                ``action_space`` are given, then no environment is created in the main process.
             shared_memory: If ``True``, then the observations from the worker processes are communicated back through
                 shared variables. This can improve the efficiency if the observations are large (e.g. images).
+                The shared variables are held in a single :class:`SharedMemoryArena` (see :attr:`shared_memory_arena`),
+                which can be passed to external consumers (e.g. a learner process).
             copy: If ``True``, then the :meth:`~AsyncVectorEnv.reset` and :meth:`~AsyncVectorEnv.step` methods
-                return a copy of the observations.
+                return a copy of the observations. If ``False``, the arrays of the infos are also reused between steps.
             context: Context for `multiprocessing`_. If ``None``, then the default context is used.
             daemon: If ``True``, then subprocesses have ``daemon`` flag turned on; that is, they will quit if
                 the head process quits. However, ``daemon=True`` prevents subprocesses to spawn children,
                 so for some environments you may want to have it set to ``False``.
             worker: If set, then use that worker in a subprocess instead of a default one.
                 Can be useful to override some inner vector env logic, for instance, how resets on termination or truncation are handled.
+            shared_step_buffers: If ``True``, then the actions, rewards, terminated and truncated flags are also communicated
+                through preallocated shared memory, and the pipes only carry a wake-up signal (and the info dictionaries).
+                This greatly reduces the pickling and pipe overhead for cheap environments. Requires ``shared_memory=True``.
+            envs_per_worker: Number of environments hosted by each worker process. Each worker steps its slice of
+                environments serially and writes the results into the shared buffers at once, such that the number of
+                processes can match the number of cores while ``num_envs`` stays large. If greater than 1, then
+                ``shared_step_buffers`` is enabled.
+            shared_info_dtypes: The data types of numeric info keys declared up front (e.g. ``{"x_position": np.float64}``).
+                These keys are communicated through typed shared buffers rather than pickled through the pipes.
+                If not ``None``, then ``shared_step_buffers`` is enabled.
+            cpu_affinity: If not ``None``, then each worker process is pinned to a set of CPU cores (with
+                ``os.sched_setaffinity``, Linux only) before creating its environments. Either a sequence with the
+                core (or list of cores) of each worker, repeated if shorter than the number of workers, or ``True``
+                to pin the workers round-robin to the available cores. With ``shared_step_buffers``, each worker
+                also first-touches its slice of the shared buffers, such that its memory is allocated on its NUMA node.
+            num_observation_buffers: If not ``None``, the observations are copied in a ring of this many preallocated
+                buffers, and :meth:`~AsyncVectorEnv.reset` and :meth:`~AsyncVectorEnv.step` return the current buffer
+                instead of a fresh copy (regardless of ``copy``). The returned observations stay valid for the following
+                ``num_observation_buffers - 1`` calls to these methods, and are overwritten after.
+            autoreset_mode: When the sub-environments are reset after termination or truncation. With ``"same-step"``,
+                they are reset within the same step and the terminal observation is in ``info["final_observation"]``.
+                With ``"next-step"``, they are reset on the following step (ignoring their action, with a zero reward)
+                and the terminal observation is returned in the batch of observations, through the shared buffer.
+                With ``"disabled"``, they are only reset by :meth:`reset` (e.g. with ``indices``).
+            preload_modules: With the ``"forkserver"`` context, the modules imported by the forkserver process (along
+                with ``gym``) before it forks the workers, e.g. the module of the environment, such that the workers
+                start without importing them. This has no effect if the forkserver process is already running.
+            respawn_workers: If ``True``, then a worker that raised an error is replaced by a new worker process (with
+                new environments) instead of being shut down, such that the vector environment remains usable.
+                The error is still raised, and the indices of the sub-environments of the new workers, which must be
+                reset (e.g. with ``reset(indices=...)``), are in :attr:`respawned_env_indices`.
+            observation_transform: If not ``None``, a function applied by the workers to the observations of their
+                environments (e.g. resizing or gray-scaling images), before writing them to the shared buffers.
+                The ``observation_space`` of the transformed observations must then be given, and the buffers are
+                sized from it rather than from the observation space of the environments.
+
+        Notes:
+            With ``shared_step_buffers``, the terminal observations of the sub-environments that are reset
+            automatically are also written to a preallocated shared buffer, such that ``info["final_observation"]``
+            does not travel through the pipes.
 
         Warnings: worker is an advanced mode option. It provides a high degree of flexibility and a high chance
             to shoot yourself in the foot; thus, if you are writing your own worker, it is recommended to start
@@ -95,32 +167,84 @@ class AsyncVectorEnv(VectorEnv):
                 (or, by default, the observation space of the first sub-environment).
             ValueError: If observation_space is a custom space (i.e. not a default space in Gym,
                 such as gym.spaces.Box, gym.spaces.Discrete, or gym.spaces.Dict) and shared_memory is True.
+            ValueError: If ``shared_step_buffers`` is True (or ``envs_per_worker`` is greater than 1, or ``shared_info_dtypes``
+                is not None) and ``shared_memory`` is False or the action space is a custom space.
+            ValueError: If ``cpu_affinity`` is used on a platform without ``os.sched_setaffinity``.
+            ValueError: If ``num_observation_buffers`` is less than 1.
+            ValueError: If ``autoreset_mode`` is not one of ``"same-step"``, ``"next-step"`` or ``"disabled"``.
+            ValueError: If ``observation_transform`` is given without ``observation_space``.
         """
+        if envs_per_worker < 1:
+            raise ValueError(
+                f"Expected `envs_per_worker` to be a positive integer, actual value: {envs_per_worker}"
+            )
+        if num_observation_buffers is not None and num_observation_buffers < 1:
+            raise ValueError(
+                f"`num_observation_buffers` must be at least 1, got {num_observation_buffers}."
+            )
+        if autoreset_mode not in AUTORESET_MODES:
+            raise ValueError(
+                f"`autoreset_mode` must be one of {AUTORESET_MODES}, got {autoreset_mode!r}."
+            )
+        if observation_transform is not None and observation_space is None:
+            raise ValueError(
+                "Using `observation_transform` in `AsyncVectorEnv` requires the `observation_space` "
+                "of the transformed observations."
+            )
         ctx = mp.get_context(context)
+        if ctx.get_start_method() == "forkserver":
+            ctx.set_forkserver_preload(["gym"] + list(preload_modules or []))
         self.env_fns = env_fns
         self.shared_memory = shared_memory
+        self.shared_step_buffers = (
+            shared_step_buffers or envs_per_worker > 1 or shared_info_dtypes is not None
+        )
+        self.envs_per_worker = envs_per_worker
         self.copy = copy
-        dummy_env = env_fns[0]()
-        self.metadata = dummy_env.metadata
+        self.autoreset_mode = autoreset_mode
+        self.respawn_workers = respawn_workers
+        self.observation_transform = observation_transform
+        self.respawned_env_indices = []
+        self.metadata = None
 
         if (observation_space is None) or (action_space is None):
+            dummy_env = env_fns[0]()
+            self.metadata = dummy_env.metadata
             observation_space = observation_space or dummy_env.observation_space
             action_space = action_space or dummy_env.action_space
-        dummy_env.close()
-        del dummy_env
+            dummy_env.close()
+            del dummy_env
         super().__init__(
             num_envs=len(env_fns),
             observation_space=observation_space,
             action_space=action_space,
         )
 
+        self.num_observation_buffers = num_observation_buffers
+        self._observation_buffers = [
+            create_empty_array(
+                self.single_observation_space, n=self.num_envs, fn=np.zeros
+            )
+            for _ in range(num_observation_buffers or 0)
+        ]
+        self._observation_buffer_index = 0
+        # The shared batch arrays of the results of `call_batch`, with their space, arena and shared memory
+        self._call_buffers = []
+        self._call_batch_space, self._call_buffer = None, None
+
+        self.shared_memory_arena = None
+        if self.shared_memory:
+            try:
+                # All the shared buffers are reserved in a single contiguous shared memory block
+                self.shared_memory_arena = SharedMemoryArena()
+            except RuntimeError:  # Python < 3.8, use one `multiprocessing.Array` per buffer
+                pass
+        buffer_ctx = self.shared_memory_arena or ctx
+
         if self.shared_memory:
             try:
                 _obs_buffer = create_shared_memory(
-                    self.single_observation_space, n=self.num_envs, ctx=ctx
-                )
-                self.observations = read_from_shared_memory(
-                    self.single_observation_space, _obs_buffer, n=self.num_envs
+                    self.single_observation_space, n=self.num_envs, ctx=buffer_ctx
                 )
             except CustomSpaceError:
                 raise ValueError(
@@ -137,40 +261,197 @@ class AsyncVectorEnv(VectorEnv):
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
 
+        self._shared_buffers = _obs_buffer
+        if self.shared_step_buffers:
+            if not self.shared_memory:
+                raise ValueError(
+                    "Using `shared_step_buffers=True`, `envs_per_worker > 1` or `shared_info_dtypes` "
+                    "in `AsyncVectorEnv` requires `shared_memory=True`."
+                )
+            try:
+                _action_buffer = create_shared_memory(
+                    self.single_action_space, n=self.num_envs, ctx=buffer_ctx
+                )
+            except CustomSpaceError:
+                raise ValueError(
+                    "Using `shared_step_buffers=True` in `AsyncVectorEnv` "
+                    "is incompatible with non-standard Gym action spaces "
+                    "(i.e. custom spaces inheriting from `gym.Space`). Set "
+                    "`shared_step_buffers=False` if you use custom action spaces."
+                )
+            self._shared_buffers = OrderedDict(
+                [
+                    ("observations", _obs_buffer),
+                    ("actions", _action_buffer),
+                    ("rewards", buffer_ctx.Array("d", self.num_envs)),
+                    ("terminateds", buffer_ctx.Array(c_bool, self.num_envs)),
+                    ("truncateds", buffer_ctx.Array(c_bool, self.num_envs)),
+                    (
+                        "final_observations",
+                        create_shared_memory(
+                            self.single_observation_space,
+                            n=self.num_envs,
+                            ctx=buffer_ctx,
+                        ),
+                    ),
+                    (
+                        "infos",
+                        create_shared_info_memory(
+                            shared_info_dtypes or {}, n=self.num_envs, ctx=buffer_ctx
+                        ),
+                    ),
+                ]
+            )
+
+        if self.shared_memory_arena is not None:
+            self.shared_memory_arena.allocate()
+        if self.shared_memory:
+            self.observations = read_from_shared_memory(
+                self.single_observation_space, _obs_buffer, n=self.num_envs
+            )
+        if self.shared_step_buffers:
+            # The parent writes the whole batch of actions to shared memory at once
+            self._actions = read_from_shared_memory(
+                self.single_action_space,
+                self._shared_buffers["actions"],
+                n=self.num_envs,
+            )
+            self._rewards = np.frombuffer(
+                self._shared_buffers["rewards"].get_obj(), dtype=np.float64
+            )
+            self._terminateds = np.frombuffer(
+                self._shared_buffers["terminateds"].get_obj(), dtype=np.bool_
+            )
+            self._truncateds = np.frombuffer(
+                self._shared_buffers["truncateds"].get_obj(), dtype=np.bool_
+            )
+            self._final_observations = read_from_shared_memory(
+                self.single_observation_space,
+                self._shared_buffers["final_observations"],
+                n=self.num_envs,
+            )
+            self._shared_infos = read_info_from_shared_memory(
+                self._shared_buffers["infos"]
+            )
+        # The indices of the sub-environments hosted by each worker process
+        self.worker_env_indices = [
+            list(range(start, min(start + envs_per_worker, self.num_envs)))
+            for start in range(0, self.num_envs, envs_per_worker)
+        ]
+        self.num_workers = len(self.worker_env_indices)
+        self.worker_cpus = self._get_worker_cpus(cpu_affinity)
+        self._env_workers = np.array(
+            [
+                worker
+                for worker, env_indices in enumerate(self.worker_env_indices)
+                for _ in env_indices
+            ]
+        )
+        # The indices of the sub-environments with a pending `step`, for each worker in the order of the calls
+        self._pending_steps = [deque() for _ in range(self.num_workers)]
+        self._partial_step = False
+        # The workers and sub-environments of the pending `reset`
+        self._reset_workers = list(range(self.num_workers))
+        self._reset_indices = list(range(self.num_envs))
+
         self.parent_pipes, self.processes = [], []
         self.error_queue = ctx.Queue()
-        target = _worker_shared_memory if self.shared_memory else _worker
-        target = worker or target
+        if self.shared_step_buffers:
+            target = _worker_shared_step_buffers
+        elif self.shared_memory:
+            target = _worker_shared_memory
+        else:
+            target = _worker
+        self._context = ctx
+        self._worker_target = worker or target
+        self._daemon = daemon
         with clear_mpi_env_vars():
-            for idx, env_fn in enumerate(self.env_fns):
-                parent_pipe, child_pipe = ctx.Pipe()
-                process = ctx.Process(
-                    target=target,
-                    name=f"Worker<{type(self).__name__}>-{idx}",
-                    args=(
-                        idx,
-                        CloudpickleWrapper(env_fn),
-                        child_pipe,
-                        parent_pipe,
-                        _obs_buffer,
-                        self.error_queue,
-                    ),
-                )
-
+            for idx in range(self.num_workers):
+                parent_pipe, process = self._start_worker(idx)
                 self.parent_pipes.append(parent_pipe)
                 self.processes.append(process)
 
-                process.daemon = daemon
-                process.start()
-                child_pipe.close()
-
         self._state = AsyncState.DEFAULT
         self._check_spaces()
+        if self.autoreset_mode != "same-step":
+            for pipe in self.parent_pipes:
+                pipe.send(("_set_autoreset_mode", self.autoreset_mode))
+            _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+            self._raise_if_errors(successes)
+        if self.metadata is None:
+            self.parent_pipes[0].send(("_call", ("metadata", (), {})))
+            metadata, success = self.parent_pipes[0].recv()
+            self._raise_if_errors([success])
+            self.metadata = metadata[0] if self.shared_step_buffers else metadata
+
+    def _start_worker(self, idx: int):
+        """Starts the process of the worker ``idx``, returning its pipe and process."""
+        if self.shared_step_buffers:
+            env_fn = OrderedDict(
+                [
+                    (i, self._get_worker_env_fn(idx, self.env_fns[i]))
+                    for i in self.worker_env_indices[idx]
+                ]
+            )
+        else:
+            env_fn = self._get_worker_env_fn(idx, self.env_fns[idx])
+        parent_pipe, child_pipe = self._context.Pipe()
+        process = self._context.Process(
+            target=self._worker_target,
+            name=f"Worker<{type(self).__name__}>-{idx}",
+            args=(
+                idx,
+                CloudpickleWrapper(env_fn),
+                child_pipe,
+                parent_pipe,
+                self._shared_buffers,
+                self.error_queue,
+            ),
+        )
+        process.daemon = self._daemon
+        process.start()
+        child_pipe.close()
+        return parent_pipe, process
+
+    def _get_worker_env_fn(self, idx: int, env_fn: callable) -> callable:
+        """Returns the function creating an environment of the worker ``idx``, with its observation transform."""
+        if self.observation_transform is not None:
+            env_fn = _transform_env_fn(
+                env_fn, self.observation_transform, self.single_observation_space
+            )
+        if self.worker_cpus is not None:
+            # The worker is pinned before creating its environments and touching its shared memory
+            env_fn = _pin_env_fn(env_fn, self.worker_cpus[idx])
+        return env_fn
+
+    def _respawn_worker(self, idx: int):
+        """Replaces the worker ``idx``, which exited after an error, by a new worker process."""
+        self.processes[idx].join()
+        with clear_mpi_env_vars():
+            self.parent_pipes[idx], self.processes[idx] = self._start_worker(idx)
+        self._pending_steps[idx].clear()
+
+        # The shared buffers were already first touched by the pinned worker that was replaced
+        commands = [
+            (
+                "_check_spaces",
+                (self.single_observation_space, self.single_action_space, False),
+            )
+        ]
+        if self.autoreset_mode != "same-step":
+            commands.append(("_set_autoreset_mode", self.autoreset_mode))
+        for command in commands:
+            self.parent_pipes[idx].send(command)
+            _, success = self.parent_pipes[idx].recv()
+            if not success:
+                _, exctype, value = self.error_queue.get()
+                raise exctype(value)
 
     def reset_async(
         self,
         seed: Optional[Union[int, List[int]]] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ):
         """Send calls to the :obj:`reset` methods of the sub-environments.
 
@@ -179,6 +460,8 @@ class AsyncVectorEnv(VectorEnv):
         Args:
             seed: List of seeds for each environment
             options: The reset option
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset,
+                otherwise only the workers hosting them are reached (and ``seed``, if a list, has one seed per index).
 
         Raises:
             ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
@@ -188,11 +471,12 @@ class AsyncVectorEnv(VectorEnv):
         """
         self._assert_is_running()
 
+        indices = list(range(self.num_envs) if indices is None else indices)
         if seed is None:
-            seed = [None for _ in range(self.num_envs)]
+            seed = [None for _ in indices]
         if isinstance(seed, int):
-            seed = [seed + i for i in range(self.num_envs)]
-        assert len(seed) == self.num_envs
+            seed = [seed + i for i in indices]
+        assert len(seed) == len(indices)
 
         if self._state != AsyncState.DEFAULT:
             raise AlreadyPendingCallError(
@@ -200,14 +484,28 @@ class AsyncVectorEnv(VectorEnv):
                 self._state.value,
             )
 
-        for pipe, single_seed in zip(self.parent_pipes, seed):
+        reset_kwargs = {}
+        for index, single_seed in zip(indices, seed):
             single_kwargs = {}
             if single_seed is not None:
                 single_kwargs["seed"] = single_seed
             if options is not None:
                 single_kwargs["options"] = options
-
-            pipe.send(("reset", single_kwargs))
+            reset_kwargs[index] = single_kwargs
+
+        self._reset_workers = sorted(set(self._env_workers[indices].tolist()))
+        self._reset_indices = indices
+        with self._timer("ipc_send"):
+            for worker in self._reset_workers:
+                if self.shared_step_buffers:
+                    data = {
+                        i: reset_kwargs[i]
+                        for i in self.worker_env_indices[worker]
+                        if i in reset_kwargs
+                    }
+                else:
+                    data = reset_kwargs[worker]
+                self.parent_pipes[worker].send(("reset", data))
         self._state = AsyncState.WAITING_RESET
 
     def reset_wait(
@@ -215,6 +513,7 @@ class AsyncVectorEnv(VectorEnv):
         timeout: Optional[Union[int, float]] = None,
         seed: Optional[int] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ) -> Union[ObsType, Tuple[ObsType, List[dict]]]:
         """Waits for the calls triggered by :meth:`reset_async` to finish and returns the results.
 
@@ -222,6 +521,7 @@ class AsyncVectorEnv(VectorEnv):
             timeout: Number of seconds before the call to `reset_wait` times out. If `None`, the call to `reset_wait` never times out.
             seed: ignored
             options: ignored
+            indices: ignored, the sub-environments reset are the ones given to :meth:`reset_async`
 
         Returns:
             A tuple of batched observations and list of dictionaries
@@ -238,33 +538,66 @@ class AsyncVectorEnv(VectorEnv):
                 AsyncState.WAITING_RESET.value,
             )
 
-        if not self._poll(timeout):
+        if len(self._reset_workers) == 0:
+            # No sub-environment was reset by `reset_async(indices=[])`
             self._state = AsyncState.DEFAULT
-            raise mp.TimeoutError(
-                f"The call to `reset_wait` has timed out after {timeout} second(s)."
-            )
-
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+            return self._get_observations(), {}
+
+        pipes = [self.parent_pipes[worker] for worker in self._reset_workers]
+        with self._timer("ipc_recv"):
+            if not self._poll(timeout, pipes):
+                self._state = AsyncState.DEFAULT
+                raise mp.TimeoutError(
+                    f"The call to `reset_wait` has timed out after {timeout} second(s)."
+                )
+            results, successes = zip(*[pipe.recv() for pipe in pipes])
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
-        infos = {}
-        results, info_data = zip(*results)
-        for i, info in enumerate(info_data):
-            infos = self._add_info(infos, info, i)
+        if self.shared_step_buffers:
+            with self._timer("add_info"):
+                infos = self._batch_infos(
+                    {
+                        i: info
+                        for worker_infos in results
+                        for i, info in worker_infos.items()
+                    }
+                )
+                infos = self._add_shared_info(infos, np.array(self._reset_indices))
+            with self._timer("concatenate"):
+                observations = self._get_observations()
+            return observations, infos
 
-        if not self.shared_memory:
-            self.observations = concatenate(
-                self.single_observation_space, results, self.observations
-            )
+        results, info_data = zip(*results)
+        with self._timer("add_info"):
+            infos = self._batch_infos(dict(zip(self._reset_workers, info_data)))
+
+        with self._timer("concatenate"):
+            if not self.shared_memory:
+                if len(self._reset_workers) == self.num_envs:
+                    self.observations = concatenate(
+                        self.single_observation_space, results, self.observations
+                    )
+                else:
+                    self.observations = scatter(
+                        self.single_observation_space,
+                        results,
+                        self._reset_workers,
+                        self.observations,
+                    )
+            observations = self._get_observations()
 
-        return (deepcopy(self.observations) if self.copy else self.observations), infos
+        return observations, infos
 
-    def step_async(self, actions: np.ndarray):
+    def step_async(self, actions: np.ndarray, env_ids: Optional[Sequence[int]] = None):
         """Send the calls to :obj:`step` to each sub-environment.
 
         Args:
             actions: Batch of actions. element of :attr:`~VectorEnv.action_space`
+            env_ids: If not ``None``, then only the sub-environments with these indices are stepped, and ``actions``
+                is the batch of actions for these sub-environments (in the same order). Sub-environments can be
+                stepped this way while other sub-environments have a pending step, in which case the results are
+                collected by :meth:`step_wait` as soon as they are ready. Requires ``shared_step_buffers=True``.
 
         Raises:
             ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
@@ -272,26 +605,80 @@ class AsyncVectorEnv(VectorEnv):
                 method (e.g. :meth:`reset_async`). This can be caused by two consecutive
                 calls to :meth:`step_async`, with no call to :meth:`step_wait` in
                 between.
+            ValueError: If ``env_ids`` is used without ``shared_step_buffers`` or contains sub-environments
+                with a pending step.
         """
         self._assert_is_running()
+        if env_ids is not None:
+            self._step_async_env_ids(actions, env_ids)
+            return
+
         if self._state != AsyncState.DEFAULT:
             raise AlreadyPendingCallError(
                 f"Calling `step_async` while waiting for a pending call to `{self._state.value}` to complete.",
                 self._state.value,
             )
 
-        actions = iterate(self.action_space, actions)
-        for pipe, action in zip(self.parent_pipes, actions):
-            pipe.send(("step", action))
+        with self._timer("ipc_send"):
+            if self.shared_step_buffers:
+                set_batch_item(self._actions, slice(None), actions)
+                for pipe, pending_steps, env_indices in zip(
+                    self.parent_pipes, self._pending_steps, self.worker_env_indices
+                ):
+                    pipe.send(("step", None))
+                    pending_steps.append(env_indices)
+            else:
+                actions = iterate(self.action_space, actions)
+                for pipe, action in zip(self.parent_pipes, actions):
+                    pipe.send(("step", action))
+        self._state = AsyncState.WAITING_STEP
+        self._partial_step = False
+
+    def _step_async_env_ids(self, actions, env_ids: Sequence[int]):
+        if not self.shared_step_buffers:
+            raise ValueError(
+                "Stepping a subset of the sub-environments with `env_ids` requires `shared_step_buffers=True`."
+            )
+        if self._state not in (AsyncState.DEFAULT, AsyncState.WAITING_STEP):
+            raise AlreadyPendingCallError(
+                f"Calling `step_async` while waiting for a pending call to `{self._state.value}` to complete.",
+                self._state.value,
+            )
+        env_ids = [int(i) for i in env_ids]
+        pending = {i for steps in self._pending_steps for ids in steps for i in ids}
+        if len(set(env_ids)) != len(env_ids) or pending.intersection(env_ids):
+            raise ValueError(
+                f"Expected `env_ids` to be unique and not already pending, actual value: {env_ids}"
+            )
+
+        with self._timer("ipc_send"):
+            set_batch_item(self._actions, env_ids, actions)
+            for worker in np.unique(self._env_workers[env_ids]):
+                worker_env_ids = [i for i in env_ids if self._env_workers[i] == worker]
+                self.parent_pipes[worker].send(("step", worker_env_ids))
+                self._pending_steps[worker].append(worker_env_ids)
         self._state = AsyncState.WAITING_STEP
+        self._partial_step = True
 
     def step_wait(
-        self, timeout: Optional[Union[int, float]] = None
+        self,
+        timeout: Optional[Union[int, float]] = None,
+        min_ready: Optional[int] = None,
+        env_ids: Optional[Sequence[int]] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[dict]]:
         """Wait for the calls to :obj:`step` in each sub-environment to finish.
 
+        If ``min_ready`` or ``env_ids`` is given, or :meth:`step_async` was called with ``env_ids``, then only the
+        results of the sub-environments that are ready are returned, and their indices are in ``info["env_id"]``.
+        The other sub-environments keep stepping and their results are returned by the next calls to :meth:`step_wait`.
+
         Args:
             timeout: Number of seconds before the call to :meth:`step_wait` times out. If ``None``, the call to :meth:`step_wait` never times out.
+            min_ready: The minimum number of sub-environments to wait for. If ``None``, waits for every pending sub-environment.
+                Requires ``shared_step_buffers=True``.
+            env_ids: If not ``None``, then waits for the pending steps of these sub-environments only (which must have
+                been sent by the same earlier call to :meth:`step_async`), and returns their results in this order.
+                Requires ``shared_step_buffers=True``.
 
         Returns:
              The batched environment step information, (obs, reward, terminated, truncated, info)
@@ -307,44 +694,190 @@ class AsyncVectorEnv(VectorEnv):
                 "Calling `step_wait` without any prior call " "to `step_async`.",
                 AsyncState.WAITING_STEP.value,
             )
+        if min_ready is not None or env_ids is not None or self._partial_step:
+            return self._step_wait_ready(timeout, min_ready, env_ids)
+
+        with self._timer("ipc_recv"):
+            if not self._poll(timeout):
+                self._state = AsyncState.DEFAULT
+                raise mp.TimeoutError(
+                    f"The call to `step_wait` has timed out after {timeout} second(s)."
+                )
+            results = [pipe.recv() for pipe in self.parent_pipes]
+
+        if self.shared_step_buffers:
+            env_infos, successes = {}, []
+            for worker_infos, success in results:
+                successes.append(success)
+                if success:
+                    env_infos.update(worker_infos)
+            with self._timer("add_info"):
+                infos = self._batch_infos(env_infos)
+                infos = self._add_shared_info(
+                    infos,
+                    np.arange(self.num_envs),
+                    final_observation=self.autoreset_mode == "same-step",
+                )
+            for pending_steps in self._pending_steps:
+                pending_steps.clear()
 
-        if not self._poll(timeout):
+            self._raise_if_errors(successes)
             self._state = AsyncState.DEFAULT
-            raise mp.TimeoutError(
-                f"The call to `step_wait` has timed out after {timeout} second(s)."
+
+            with self._timer("concatenate"):
+                observations = self._get_observations()
+            return (
+                observations,
+                np.copy(self._rewards),
+                np.copy(self._terminateds),
+                np.copy(self._truncateds),
+                infos,
             )
 
-        observations_list, rewards, terminateds, truncateds, infos = [], [], [], [], {}
+        observations_list, rewards, terminateds, truncateds, info_data = (
+            [],
+            [],
+            [],
+            [],
+            [],
+        )
         successes = []
-        for i, pipe in enumerate(self.parent_pipes):
-            result, success = pipe.recv()
+        for result, success in results:
+            successes.append(success)
+            if not success:
+                continue
             obs, rew, terminated, truncated, info = result
 
-            successes.append(success)
             observations_list.append(obs)
             rewards.append(rew)
             terminateds.append(terminated)
             truncateds.append(truncated)
-            infos = self._add_info(infos, info, i)
+            info_data.append(info)
 
         self._raise_if_errors(successes)
+        with self._timer("add_info"):
+            infos = self._batch_infos(info_data)
         self._state = AsyncState.DEFAULT
 
-        if not self.shared_memory:
-            self.observations = concatenate(
-                self.single_observation_space,
-                observations_list,
-                self.observations,
-            )
+        with self._timer("concatenate"):
+            if not self.shared_memory:
+                self.observations = concatenate(
+                    self.single_observation_space,
+                    observations_list,
+                    self.observations,
+                )
+            observations = self._get_observations()
 
         return (
-            deepcopy(self.observations) if self.copy else self.observations,
+            observations,
             np.array(rewards),
             np.array(terminateds, dtype=np.bool_),
             np.array(truncateds, dtype=np.bool_),
             infos,
         )
 
+    def _step_wait_ready(self, timeout, min_ready, env_ids=None):
+        if not self.shared_step_buffers:
+            raise ValueError(
+                "Waiting for a subset of the sub-environments with `min_ready` or `env_ids` requires `shared_step_buffers=True`."
+            )
+        if env_ids is not None:
+            env_ids = [int(i) for i in env_ids]
+            # The steps of `env_ids` must be the next ones of their workers, without other sub-environments
+            next_steps = [set(steps[0]) for steps in self._pending_steps if steps]
+            if set(env_ids) != {
+                i for ids in next_steps if not ids.isdisjoint(env_ids) for i in ids
+            }:
+                raise ValueError(
+                    f"Expected `env_ids` to be the sub-environments of the next pending steps of their workers, actual value: {env_ids}"
+                )
+            min_ready = len(env_ids)
+        num_pending = sum(len(ids) for steps in self._pending_steps for ids in steps)
+        min_ready = num_pending if min_ready is None else min(min_ready, num_pending)
+
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        ready_ids, env_infos, successes = [], {}, []
+        while len(ready_ids) < min_ready:
+            pipes = [
+                pipe
+                for pipe, pending_steps in zip(self.parent_pipes, self._pending_steps)
+                if pending_steps
+                and pipe is not None
+                and (env_ids is None or not set(env_ids).isdisjoint(pending_steps[0]))
+            ]
+            delta = None if end_time is None else max(end_time - time.perf_counter(), 0)
+            with self._timer("ipc_recv"):
+                ready_pipes = connection.wait(pipes, timeout=delta)
+                if not ready_pipes:
+                    self._state = AsyncState.DEFAULT
+                    raise mp.TimeoutError(
+                        f"The call to `step_wait` has timed out after {timeout} second(s)."
+                    )
+                results = [pipe.recv() for pipe in ready_pipes]
+            for pipe, (worker_infos, success) in zip(ready_pipes, results):
+                worker = self.parent_pipes.index(pipe)
+                successes.append(success)
+                for i in self._pending_steps[worker].popleft():
+                    if success and i in worker_infos:
+                        env_infos[i] = worker_infos[i]
+                    ready_ids.append(i)
+            if not all(successes):
+                break
+
+        self._raise_if_errors(successes)
+        if not any(self._pending_steps):
+            self._state = AsyncState.DEFAULT
+
+        ready_ids = np.array(ready_ids if env_ids is None else env_ids, dtype=np.int64)
+        with self._timer("add_info"):
+            infos = self._batch_infos(env_infos)
+            infos = self._add_shared_info(
+                infos, ready_ids, final_observation=self.autoreset_mode == "same-step"
+            )
+            infos = {key: value[ready_ids] for key, value in infos.items()}
+        infos["env_id"], infos["_env_id"] = ready_ids, np.ones(len(ready_ids), bool)
+        with self._timer("concatenate"):
+            observations = get_batch_item(self.observations, ready_ids)
+        return (
+            observations,
+            self._rewards[ready_ids],
+            self._terminateds[ready_ids],
+            self._truncateds[ready_ids],
+            infos,
+        )
+
+    def _get_observations(self):
+        """Returns the batched observations, copied in the next buffer of the ring if there is one."""
+        if self._observation_buffers:
+            out = self._observation_buffers[self._observation_buffer_index]
+            self._observation_buffer_index = (
+                self._observation_buffer_index + 1
+            ) % self.num_observation_buffers
+            return copy_batch(self.single_observation_space, self.observations, out)
+        return deepcopy(self.observations) if self.copy else self.observations
+
+    def _add_shared_info(
+        self, infos: dict, env_ids: np.ndarray, final_observation: bool = False
+    ) -> dict:
+        """Add the infos communicated through shared memory by the sub-environments ``env_ids``."""
+        for key, (values, mask) in self._shared_infos.items():
+            env_mask = np.zeros(self.num_envs, dtype=np.bool_)
+            env_mask[env_ids] = mask[env_ids]
+            if np.any(env_mask):
+                infos[key] = np.where(env_mask, values, np.zeros_like(values))
+                infos[f"_{key}"] = env_mask
+
+        if final_observation:
+            dones = np.zeros(self.num_envs, dtype=np.bool_)
+            dones[env_ids] = self._terminateds[env_ids] | self._truncateds[env_ids]
+            if np.any(dones):
+                final_observations, _ = self._init_info_arrays(object)
+                for i in np.flatnonzero(dones):
+                    final_observations[i] = get_batch_item(self._final_observations, i)
+                infos["final_observation"] = final_observations
+                infos["_final_observation"] = dones
+        return infos
+
     def call_async(self, name: str, *args, **kwargs):
         """Calls the method with name asynchronously and apply args and kwargs to the method.
 
@@ -400,8 +933,132 @@ class AsyncVectorEnv(VectorEnv):
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
+        if self.shared_step_buffers:
+            return tuple(
+                result for worker_results in results for result in worker_results
+            )
         return results
 
+    def call_batch(self, name: str, result_space: gym.Space, *args, **kwargs):
+        """Call a method, or get a property, from each parallel environment, and batch the results.
+
+        The workers write their results straight into a shared batch array instead of pickling them back
+        through the pipes (see :meth:`call_batch_async`).
+
+        Args:
+            name: Name of the method or property to call.
+            result_space: The space of the result of a single environment.
+            *args: Arguments to apply to the method call.
+            **kwargs: Keyword arguments to apply to the method call.
+
+        Returns:
+            The batch of the results of the individual calls, with the layout of :func:`create_empty_array`
+        """
+        self.call_batch_async(name, result_space, *args, **kwargs)
+        return self.call_batch_wait()
+
+    def call_batch_async(self, name: str, result_space: gym.Space, *args, **kwargs):
+        """Calls the method with name asynchronously, and writes the results in a shared batch array.
+
+        The results must be in the declared ``result_space``, e.g. ``Box(0, 255, (H, W, 3), np.uint8)``
+        for the ``"rgb_array"`` renders. The shared batch array of each result space is allocated on its first
+        call, and reused by the following calls. With Python < 3.8 (without :class:`SharedMemoryArena`),
+        the results are pickled through the pipes and batched in the main process.
+
+        Args:
+            name: Name of the method or property to call.
+            result_space: The space of the result of a single environment.
+            *args: Arguments to apply to the method call.
+            **kwargs: Keyword arguments to apply to the method call.
+
+        Raises:
+            ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
+            AlreadyPendingCallError: Calling `call_batch_async` while waiting for a pending call to complete
+            CustomSpaceError: If ``result_space`` is a custom space, which cannot be shared
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.DEFAULT:
+            raise AlreadyPendingCallError(
+                "Calling `call_batch_async` while waiting "
+                f"for a pending call to `{self._state.value}` to complete.",
+                self._state.value,
+            )
+
+        self._call_batch_space = result_space
+        self._call_buffer = self._get_call_buffer(result_space)
+        if self._call_buffer is None:
+            for pipe in self.parent_pipes:
+                pipe.send(("_call", (name, args, kwargs)))
+        else:
+            _, _, shared_memory, _ = self._call_buffer
+            for pipe in self.parent_pipes:
+                pipe.send(
+                    ("_call_batch", (name, args, kwargs, result_space, shared_memory))
+                )
+        self._state = AsyncState.WAITING_CALL_BATCH
+
+    def call_batch_wait(self, timeout: Optional[Union[int, float]] = None):
+        """Waits for the calls triggered by :meth:`call_batch_async` to finish and returns the batch of results.
+
+        Args:
+            timeout: Number of seconds before the call to `call_batch_wait` times out.
+                If `None` (default), the call to `call_batch_wait` never times out.
+
+        Returns:
+            The batch of the results of the individual calls, a copy of the shared batch array if ``copy=True``
+
+        Raises:
+            NoAsyncCallError: Calling `call_batch_wait` without any prior call to `call_batch_async`.
+            TimeoutError: The call to `call_batch_wait` has timed out after timeout second(s).
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.WAITING_CALL_BATCH:
+            raise NoAsyncCallError(
+                "Calling `call_batch_wait` without any prior call to `call_batch_async`.",
+                AsyncState.WAITING_CALL_BATCH.value,
+            )
+
+        if not self._poll(timeout):
+            self._state = AsyncState.DEFAULT
+            raise mp.TimeoutError(
+                f"The call to `call_batch_wait` has timed out after {timeout} second(s)."
+            )
+
+        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._raise_if_errors(successes)
+        self._state = AsyncState.DEFAULT
+
+        if self._call_buffer is None:
+            if self.shared_step_buffers:
+                results = [
+                    result for worker_results in results for result in worker_results
+                ]
+            return concatenate(
+                self._call_batch_space,
+                results,
+                create_empty_array(
+                    self._call_batch_space, n=self.num_envs, fn=np.zeros
+                ),
+            )
+        batch = self._call_buffer[3]
+        return deepcopy(batch) if self.copy else batch
+
+    def _get_call_buffer(self, result_space: gym.Space):
+        """Returns the shared batch array of ``result_space``, allocated on its first call (``None`` if unsupported)."""
+        for call_buffer in self._call_buffers:
+            if call_buffer[0] == result_space:
+                return call_buffer
+        try:
+            arena = SharedMemoryArena()
+        except RuntimeError:  # Python < 3.8, the results are pickled through the pipes
+            return None
+        shared_memory = create_shared_memory(result_space, n=self.num_envs, ctx=arena)
+        arena.allocate()
+        batch = read_from_shared_memory(result_space, shared_memory, n=self.num_envs)
+        call_buffer = (result_space, arena, shared_memory, batch)
+        self._call_buffers.append(call_buffer)
+        return call_buffer
+
     def set_attr(self, name: str, values: Union[list, tuple, object]):
         """Sets an attribute of the sub-environments.
 
@@ -432,11 +1089,97 @@ class AsyncVectorEnv(VectorEnv):
                 self._state.value,
             )
 
-        for pipe, value in zip(self.parent_pipes, values):
-            pipe.send(("_setattr", (name, value)))
+        if self.shared_step_buffers:
+            for pipe, env_indices in zip(self.parent_pipes, self.worker_env_indices):
+                pipe.send(("_setattr", (name, {i: values[i] for i in env_indices})))
+        else:
+            for pipe, value in zip(self.parent_pipes, values):
+                pipe.send(("_setattr", (name, value)))
         _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
         self._raise_if_errors(successes)
 
+    def _seed_envs(self, seed_seqs: List[np.random.SeedSequence]):
+        self._worker_call("_seed_envs", seed_seqs)
+
+    def _get_env_rng_states(self) -> List[dict]:
+        return self._worker_call("_get_rng_states", [None] * self.num_envs)
+
+    def _set_env_rng_states(self, states: List[dict]):
+        self._worker_call("_set_rng_states", states)
+
+    def _get_env_states(self) -> List[bytes]:
+        return self._worker_call("_get_state", [None] * self.num_envs)
+
+    def _set_env_states(self, states: List[bytes]):
+        self._worker_call("_set_state", states)
+
+    def truncate_envs(self, indices: Sequence[int]):
+        """Truncates the sub-environments ``indices`` on their next step, see :meth:`VectorEnv.truncate_envs`."""
+        truncate = np.zeros(self.num_envs, dtype=np.bool_)
+        truncate[np.asarray(indices, dtype=np.int64)] = True
+        self._worker_call("_truncate", truncate.tolist())
+
+    def _worker_call(self, command: str, values: list) -> list:
+        """Sends ``command`` with the value of each sub-environment to all the workers at once, and returns the result of each sub-environment.
+
+        Raises:
+            AlreadyPendingCallError: Calling while waiting for a pending call to complete.
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.DEFAULT:
+            raise AlreadyPendingCallError(
+                f"Calling `{command}` while waiting "
+                f"for a pending call to `{self._state.value}` to complete.",
+                self._state.value,
+            )
+
+        if self.shared_step_buffers:
+            for pipe, env_indices in zip(self.parent_pipes, self.worker_env_indices):
+                pipe.send((command, {i: values[i] for i in env_indices}))
+        else:
+            for pipe, value in zip(self.parent_pipes, values):
+                pipe.send((command, value))
+        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._raise_if_errors(successes)
+        if self.shared_step_buffers:
+            return [
+                None if result is None else result[i]
+                for result, env_indices in zip(results, self.worker_env_indices)
+                for i in env_indices
+            ]
+        return list(results)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the timing counters enabled by :meth:`enable_stats`, empty if they are disabled.
+
+        With the default workers, and if no call is pending, the counters also include the time spent by each worker
+        resetting and stepping its sub-environments in ``"workers"`` (one dictionary per worker). The difference with
+        the ``"ipc_recv"`` time is the overhead of the pipes and of the scheduling of the processes.
+
+        Returns:
+            A dictionary mapping the name of each stage to its number of calls ``"count"``, total time ``"total"``
+            and mean time ``"mean"`` (in seconds)
+        """
+        stats = super().get_stats()
+        if (
+            not stats
+            or self.closed
+            or self._state != AsyncState.DEFAULT
+            or self._worker_target
+            not in (_worker, _worker_shared_memory, _worker_shared_step_buffers)
+        ):
+            return stats
+
+        for pipe in self.parent_pipes:
+            pipe.send(("_get_stats", None))
+        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._raise_if_errors(successes)
+        stats["workers"] = [
+            {name: _summarize_counter(counter) for name, counter in result.items()}
+            for result in results
+        ]
+        return stats
+
     def close_extras(
         self, timeout: Optional[Union[int, float]] = None, terminate: bool = False
     ):
@@ -479,14 +1222,36 @@ class AsyncVectorEnv(VectorEnv):
                 pipe.close()
         for process in self.processes:
             process.join()
-
-    def _poll(self, timeout=None):
+        if self.shared_memory_arena is not None:
+            self.shared_memory_arena.unlink()
+        for _, arena, _, _ in self._call_buffers:
+            arena.unlink()
+
+    def _get_worker_cpus(self, cpu_affinity):
+        if cpu_affinity is None or cpu_affinity is False:
+            return None
+        if not hasattr(os, "sched_setaffinity"):
+            raise ValueError(
+                "Using `cpu_affinity` in `AsyncVectorEnv` requires `os.sched_setaffinity` (Linux only)."
+            )
+        if cpu_affinity is True:
+            cpu_affinity = sorted(os.sched_getaffinity(0))
+        cpu_affinity = [
+            {cpus} if isinstance(cpus, (int, np.integer)) else set(cpus)
+            for cpus in cpu_affinity
+        ]
+        return [
+            cpu_affinity[worker % len(cpu_affinity)]
+            for worker in range(self.num_workers)
+        ]
+
+    def _poll(self, timeout=None, pipes=None):
         self._assert_is_running()
         if timeout is None:
             return True
         end_time = time.perf_counter() + timeout
         delta = None
-        for pipe in self.parent_pipes:
+        for pipe in self.parent_pipes if pipes is None else pipes:
             delta = max(end_time - time.perf_counter(), 0)
             if pipe is None:
                 return False
@@ -496,7 +1261,12 @@ class AsyncVectorEnv(VectorEnv):
 
     def _check_spaces(self):
         self._assert_is_running()
-        spaces = (self.single_observation_space, self.single_action_space)
+        # The workers first touch their slices of the shared buffers only if they are pinned to CPU cores
+        spaces = (
+            self.single_observation_space,
+            self.single_action_space,
+            self.worker_cpus is not None,
+        )
         for pipe in self.parent_pipes:
             pipe.send(("_check_spaces", spaces))
         results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
@@ -525,16 +1295,25 @@ class AsyncVectorEnv(VectorEnv):
         if all(successes):
             return
 
-        num_errors = self.num_envs - sum(successes)
+        num_errors = len(successes) - sum(successes)
         assert num_errors > 0
+        if self.respawn_workers:
+            self.respawned_env_indices = []
         for i in range(num_errors):
             index, exctype, value = self.error_queue.get()
             logger.error(
                 f"Received the following error from Worker-{index}: {exctype.__name__}: {value}"
             )
-            logger.error(f"Shutting down Worker-{index}.")
             self.parent_pipes[index].close()
-            self.parent_pipes[index] = None
+            if self.respawn_workers:
+                logger.error(f"Respawning Worker-{index}.")
+                self._respawn_worker(index)
+                self.respawned_env_indices.extend(self.worker_env_indices[index])
+                if not any(self._pending_steps):
+                    self._state = AsyncState.DEFAULT
+            else:
+                logger.error(f"Shutting down Worker-{index}.")
+                self.parent_pipes[index] = None
 
             if i == num_errors - 1:
                 logger.error("Raising the last exception back to the main process.")
@@ -548,62 +1327,52 @@ class AsyncVectorEnv(VectorEnv):
 
 def _worker(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
     assert shared_memory is None
-    env = env_fn()
+    worker = _SingleEnvWorker(index, env_fn())
+    env = worker.env
     parent_pipe.close()
+    handlers = worker.handlers()
     try:
         while True:
             command, data = pipe.recv()
+            start = time.perf_counter()
             if command == "reset":
                 observation, info = env.reset(**data)
+                worker.autoreset = worker.truncate = False
+                _add_time(worker.stats, "env_reset", start)
                 pipe.send(((observation, info), True))
 
             elif command == "step":
-                (
-                    observation,
-                    reward,
-                    terminated,
-                    truncated,
-                    info,
-                ) = env.step(data)
-                if terminated or truncated:
-                    old_observation = observation
+                if worker.autoreset:
                     observation, info = env.reset()
-                    info["final_observation"] = old_observation
+                    reward, terminated, truncated = 0.0, False, False
+                    worker.autoreset = worker.truncate = False
+                else:
+                    (
+                        observation,
+                        reward,
+                        terminated,
+                        truncated,
+                        info,
+                    ) = env.step(data)
+                    truncated, worker.truncate = truncated or worker.truncate, False
+                    if (terminated or truncated) and (
+                        worker.autoreset_mode == "same-step"
+                    ):
+                        old_observation = observation
+                        observation, info = env.reset()
+                        info["final_observation"] = old_observation
+                    elif terminated or truncated:
+                        worker.autoreset = worker.autoreset_mode == "next-step"
+                _add_time(worker.stats, "env_step", start)
                 pipe.send(((observation, reward, terminated, truncated, info), True))
-            elif command == "seed":
-                env.seed(data)
-                pipe.send((None, True))
             elif command == "close":
                 pipe.send((None, True))
                 break
-            elif command == "_call":
-                name, args, kwargs = data
-                if name in ["reset", "step", "seed", "close"]:
-                    raise ValueError(
-                        f"Trying to call function `{name}` with "
-                        f"`_call`. Use `{name}` directly instead."
-                    )
-                function = getattr(env, name)
-                if callable(function):
-                    pipe.send((function(*args, **kwargs), True))
-                else:
-                    pipe.send((function, True))
-            elif command == "_setattr":
-                name, value = data
-                setattr(env, name, value)
-                pipe.send((None, True))
-            elif command == "_check_spaces":
-                pipe.send(
-                    (
-                        (data[0] == env.observation_space, data[1] == env.action_space),
-                        True,
-                    )
-                )
+            elif command in handlers:
+                pipe.send((handlers[command](data), True))
             else:
-                raise RuntimeError(
-                    f"Received unknown command `{command}`. Must "
-                    "be one of {`reset`, `step`, `seed`, `close`, `_call`, "
-                    "`_setattr`, `_check_spaces`}."
+                raise _unknown_command_error(
+                    command, ["reset", "step", "close", *handlers]
                 )
     except (KeyboardInterrupt, Exception):
         error_queue.put((index,) + sys.exc_info()[:2])
@@ -614,70 +1383,440 @@ def _worker(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
 
 def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
     assert shared_memory is not None
-    env = env_fn()
+    worker = _SingleEnvWorker(index, env_fn())
+    env = worker.env
     observation_space = env.observation_space
     parent_pipe.close()
+    handlers = worker.handlers()
     try:
         while True:
             command, data = pipe.recv()
+            start = time.perf_counter()
             if command == "reset":
                 observation, info = env.reset(**data)
+                worker.autoreset = worker.truncate = False
                 write_to_shared_memory(
                     observation_space, index, observation, shared_memory
                 )
+                _add_time(worker.stats, "env_reset", start)
                 pipe.send(((None, info), True))
 
             elif command == "step":
-                (
-                    observation,
-                    reward,
-                    terminated,
-                    truncated,
-                    info,
-                ) = env.step(data)
-                if terminated or truncated:
-                    old_observation = observation
+                if worker.autoreset:
                     observation, info = env.reset()
-                    info["final_observation"] = old_observation
+                    reward, terminated, truncated = 0.0, False, False
+                    worker.autoreset = worker.truncate = False
+                else:
+                    (
+                        observation,
+                        reward,
+                        terminated,
+                        truncated,
+                        info,
+                    ) = env.step(data)
+                    truncated, worker.truncate = truncated or worker.truncate, False
+                    if (terminated or truncated) and (
+                        worker.autoreset_mode == "same-step"
+                    ):
+                        old_observation = observation
+                        observation, info = env.reset()
+                        info["final_observation"] = old_observation
+                    elif terminated or truncated:
+                        worker.autoreset = worker.autoreset_mode == "next-step"
 
                 write_to_shared_memory(
                     observation_space, index, observation, shared_memory
                 )
+                _add_time(worker.stats, "env_step", start)
                 pipe.send(((None, reward, terminated, truncated, info), True))
-            elif command == "seed":
-                env.seed(data)
-                pipe.send((None, True))
             elif command == "close":
                 pipe.send((None, True))
                 break
-            elif command == "_call":
-                name, args, kwargs = data
-                if name in ["reset", "step", "seed", "close"]:
-                    raise ValueError(
-                        f"Trying to call function `{name}` with "
-                        f"`_call`. Use `{name}` directly instead."
-                    )
-                function = getattr(env, name)
-                if callable(function):
-                    pipe.send((function(*args, **kwargs), True))
-                else:
-                    pipe.send((function, True))
-            elif command == "_setattr":
-                name, value = data
-                setattr(env, name, value)
-                pipe.send((None, True))
-            elif command == "_check_spaces":
-                pipe.send(
-                    ((data[0] == observation_space, data[1] == env.action_space), True)
-                )
+            elif command in handlers:
+                pipe.send((handlers[command](data), True))
             else:
-                raise RuntimeError(
-                    f"Received unknown command `{command}`. Must "
-                    "be one of {`reset`, `step`, `seed`, `close`, `_call`, "
-                    "`_setattr`, `_check_spaces`}."
+                raise _unknown_command_error(
+                    command, ["reset", "step", "close", *handlers]
                 )
     except (KeyboardInterrupt, Exception):
         error_queue.put((index,) + sys.exc_info()[:2])
         pipe.send((None, False))
     finally:
         env.close()
+
+
+def _pin_env_fn(env_fn, cpus):
+    """Returns an `env_fn` that pins the current process to the `cpus` before creating the environment."""
+
+    def _env_fn():
+        os.sched_setaffinity(0, cpus)
+        return env_fn()
+
+    return _env_fn
+
+
+def _transform_env_fn(env_fn, transform, observation_space):
+    """Returns an `env_fn` whose environment transforms its observations with `transform`, in `observation_space`."""
+
+    def _env_fn():
+        env = TransformObservation(env_fn(), transform)
+        env.observation_space = observation_space
+        return env
+
+    return _env_fn
+
+
+def _first_touch(observation_space, env_indices, shared_memory):
+    """Writes to the slices of the shared buffers of the sub-environments, such that the pages are allocated locally."""
+    observation = create_empty_array(observation_space, n=None, fn=np.zeros)
+    for i in env_indices:
+        write_to_shared_memory(
+            observation_space, i, observation, shared_memory["observations"]
+        )
+        write_to_shared_memory(
+            observation_space, i, observation, shared_memory["final_observations"]
+        )
+
+
+def _write_shared_info(index, info, shared_infos):
+    """Writes the info keys with a shared buffer to shared memory, and returns the remaining info."""
+    if not shared_infos:
+        return info
+    info = dict(info)
+    for key, (values, mask) in shared_infos.items():
+        mask[index] = key in info
+        if mask[index]:
+            values[index] = info.pop(key)
+    return info
+
+
+def _call_env(env, name, args, kwargs):
+    """Calls the method ``name`` of a sub-environment, or gets its property ``name``."""
+    if name in ["reset", "step", "seed", "close"]:
+        raise ValueError(
+            f"Trying to call function `{name}` with "
+            f"`_call_batch`. Use `{name}` directly instead."
+        )
+    function = getattr(env, name)
+    if callable(function):
+        return function(*args, **kwargs)
+    return function
+
+
+def _add_time(stats, name, start):
+    """Adds the time elapsed since ``start`` to the counter ``name`` of a worker."""
+    counter = stats[name]
+    counter[0] += 1
+    counter[1] += time.perf_counter() - start
+
+
+def _unknown_command_error(command, commands):
+    """Returns the error raised by a worker receiving the unknown ``command``, listing the known ``commands``."""
+    return RuntimeError(
+        f"Received unknown command `{command}`. Must be one of "
+        f"{{{', '.join(f'`{name}`' for name in commands)}}}."
+    )
+
+
+class _SingleEnvWorker:
+    """The sub-environment hosted by a worker without ``shared_step_buffers``, with its autoreset state and statistics.
+
+    :meth:`handlers` returns the handlers of the commands shared by :func:`_worker` and :func:`_worker_shared_memory`,
+    which only handle ``reset``, ``step`` and ``close`` themselves. Each handler takes the data of the command and
+    returns the result sent back to the main process.
+    """
+
+    def __init__(self, index: int, env: gym.Env):
+        self.index = index
+        self.env = env
+        self.stats = {"env_reset": [0, 0.0], "env_step": [0, 0.0]}
+        # If the sub-environment is reset on its next step, with the "next-step" autoreset mode
+        self.autoreset_mode, self.autoreset = "same-step", False
+        # If the sub-environment is truncated on its next step, see `truncate_envs`
+        self.truncate = False
+
+    def handlers(self) -> dict:
+        return {
+            "seed": self.seed,
+            "_call": self.call,
+            "_call_batch": self.call_batch,
+            "_setattr": self.setattr,
+            "_set_autoreset_mode": self.set_autoreset_mode,
+            "_get_stats": self.get_stats,
+            "_truncate": self.truncate_env,
+            "_seed_envs": self.seed_env,
+            "_get_rng_states": self.get_rng_state,
+            "_set_rng_states": self.set_rng_state,
+            "_get_state": self.get_state,
+            "_set_state": self.set_state,
+            "_check_spaces": self.check_spaces,
+        }
+
+    def seed(self, data):
+        self.env.seed(data)
+
+    def call(self, data):
+        name, args, kwargs = data
+        if name in ["reset", "step", "seed", "close"]:
+            raise ValueError(
+                f"Trying to call function `{name}` with "
+                f"`_call`. Use `{name}` directly instead."
+            )
+        function = getattr(self.env, name)
+        if callable(function):
+            return function(*args, **kwargs)
+        return function
+
+    def call_batch(self, data):
+        name, args, kwargs, result_space, call_memory = data
+        result = _call_env(self.env, name, args, kwargs)
+        write_to_shared_memory(result_space, self.index, result, call_memory)
+
+    def setattr(self, data):
+        name, value = data
+        setattr(self.env, name, value)
+
+    def set_autoreset_mode(self, data):
+        self.autoreset_mode = data
+
+    def get_stats(self, data):
+        return self.stats
+
+    def truncate_env(self, data):
+        self.truncate = data
+
+    def seed_env(self, data):
+        seed_env(self.env, data)
+
+    def get_rng_state(self, data):
+        return get_env_rng_state(self.env)
+
+    def set_rng_state(self, data):
+        set_env_rng_state(self.env, data)
+
+    def get_state(self, data):
+        return dump_env_state(self.env, self.autoreset)
+
+    def set_state(self, data):
+        self.autoreset = load_env_state(self.env, data)
+
+    def check_spaces(self, data):
+        return (
+            data[0] == self.env.observation_space,
+            data[1] == self.env.action_space,
+        )
+
+
+class _SharedStepBuffers:
+    """The sub-environments hosted by a worker with ``shared_step_buffers``, with one handler per command of the worker.
+
+    Each handler takes the data of the command and returns the result sent back to the main process.
+    """
+
+    def __init__(self, envs: "OrderedDict[int, gym.Env]", shared_memory: dict):
+        self.envs = envs
+        self.shared_memory = shared_memory
+        self.observation_space = next(iter(envs.values())).observation_space
+        self.action_space = next(iter(envs.values())).action_space
+
+        self.actions = None
+        self.stats = {"env_reset": [0, 0.0], "env_step": [0, 0.0]}
+        # The sub-environments to reset on their next step, with the "next-step" autoreset mode
+        self.autoreset_mode, self.autoreset = "same-step", set()
+        # The sub-environments truncated on their next step, see `truncate_envs`
+        self.truncate = set()
+        self.shared_infos = read_info_from_shared_memory(shared_memory["infos"])
+        self.rewards = np.frombuffer(
+            shared_memory["rewards"].get_obj(), dtype=np.float64
+        )
+        self.terminateds = np.frombuffer(
+            shared_memory["terminateds"].get_obj(), dtype=np.bool_
+        )
+        self.truncateds = np.frombuffer(
+            shared_memory["truncateds"].get_obj(), dtype=np.bool_
+        )
+
+    def _write_observation(self, i, observation, name="observations"):
+        write_to_shared_memory(
+            self.observation_space, i, observation, self.shared_memory[name]
+        )
+
+    def reset(self, data):
+        start = time.perf_counter()
+        infos = {}
+        for i, kwargs in data.items():
+            observation, info = self.envs[i].reset(**kwargs)
+            self.autoreset.discard(i)
+            self.truncate.discard(i)
+            self._write_observation(i, observation)
+            info = _write_shared_info(i, info, self.shared_infos)
+            if info:
+                infos[i] = info
+        _add_time(self.stats, "env_reset", start)
+        return infos
+
+    def step(self, data):
+        start = time.perf_counter()
+        if self.actions is None:
+            # The action space is only known to match after `_check_spaces`
+            self.actions = read_from_shared_memory(
+                self.action_space, self.shared_memory["actions"], n=len(self.rewards)
+            )
+        rewards, terminateds, truncateds = (
+            self.rewards,
+            self.terminateds,
+            self.truncateds,
+        )
+        infos = {}
+        for i in self.envs.keys() if data is None else data:
+            env = self.envs[i]
+            if i in self.autoreset:
+                observation, info = env.reset()
+                rewards[i], terminateds[i], truncateds[i] = 0.0, False, False
+                self.autoreset.discard(i)
+            else:
+                (
+                    observation,
+                    rewards[i],
+                    terminateds[i],
+                    truncateds[i],
+                    info,
+                ) = env.step(get_batch_item(self.actions, i))
+                truncateds[i] |= i in self.truncate
+            self.truncate.discard(i)
+            if (terminateds[i] or truncateds[i]) and (
+                self.autoreset_mode == "same-step"
+            ):
+                self._write_observation(i, observation, "final_observations")
+                observation, info = env.reset()
+            elif (terminateds[i] or truncateds[i]) and (
+                self.autoreset_mode == "next-step"
+            ):
+                self.autoreset.add(i)
+
+            self._write_observation(i, observation)
+            info = _write_shared_info(i, info, self.shared_infos)
+            if info:
+                infos[i] = info
+        _add_time(self.stats, "env_step", start)
+        return infos
+
+    def call(self, data):
+        name, args, kwargs = data
+        if name in ["reset", "step", "seed", "close"]:
+            raise ValueError(
+                f"Trying to call function `{name}` with "
+                f"`_call`. Use `{name}` directly instead."
+            )
+        results = []
+        for env in self.envs.values():
+            function = getattr(env, name)
+            if callable(function):
+                results.append(function(*args, **kwargs))
+            else:
+                results.append(function)
+        return results
+
+    def call_batch(self, data):
+        name, args, kwargs, result_space, call_memory = data
+        for i, env in self.envs.items():
+            result = _call_env(env, name, args, kwargs)
+            write_to_shared_memory(result_space, i, result, call_memory)
+
+    def setattr(self, data):
+        name, values = data
+        for i, env in self.envs.items():
+            setattr(env, name, values[i])
+
+    def set_autoreset_mode(self, data):
+        self.autoreset_mode = data
+
+    def get_stats(self, data):
+        return self.stats
+
+    def truncate_envs(self, data):
+        for i, truncate in data.items():
+            if truncate:
+                self.truncate.add(i)
+            else:
+                self.truncate.discard(i)
+
+    def seed_envs(self, data):
+        for i, seed_seq in data.items():
+            seed_env(self.envs[i], seed_seq)
+
+    def get_rng_states(self, data):
+        return {i: get_env_rng_state(env) for i, env in self.envs.items()}
+
+    def set_rng_states(self, data):
+        for i, state in data.items():
+            set_env_rng_state(self.envs[i], state)
+
+    def get_state(self, data):
+        return {
+            i: dump_env_state(env, i in self.autoreset) for i, env in self.envs.items()
+        }
+
+    def set_state(self, data):
+        for i, state in data.items():
+            if load_env_state(self.envs[i], state):
+                self.autoreset.add(i)
+            else:
+                self.autoreset.discard(i)
+
+    def check_spaces(self, data):
+        same_observation_spaces = all(
+            data[0] == env.observation_space for env in self.envs.values()
+        )
+        same_action_spaces = all(
+            data[1] == env.action_space for env in self.envs.values()
+        )
+        if same_observation_spaces and data[2]:
+            _first_touch(self.observation_space, self.envs.keys(), self.shared_memory)
+        return same_observation_spaces, same_action_spaces
+
+    def close(self):
+        for env in self.envs.values():
+            env.close()
+
+
+def _worker_shared_step_buffers(
+    index, env_fn, pipe, parent_pipe, shared_memory, error_queue
+):
+    assert shared_memory is not None
+    # `env_fn` wraps an ordered mapping from the indices of the sub-environments hosted by this worker to their `env_fn`
+    worker = _SharedStepBuffers(
+        OrderedDict([(i, fn()) for i, fn in env_fn.fn.items()]), shared_memory
+    )
+    parent_pipe.close()
+    handlers = {
+        "reset": worker.reset,
+        "step": worker.step,
+        "_call": worker.call,
+        "_call_batch": worker.call_batch,
+        "_setattr": worker.setattr,
+        "_set_autoreset_mode": worker.set_autoreset_mode,
+        "_get_stats": worker.get_stats,
+        "_truncate": worker.truncate_envs,
+        "_seed_envs": worker.seed_envs,
+        "_get_rng_states": worker.get_rng_states,
+        "_set_rng_states": worker.set_rng_states,
+        "_get_state": worker.get_state,
+        "_set_state": worker.set_state,
+        "_check_spaces": worker.check_spaces,
+    }
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "close":
+                pipe.send((None, True))
+                break
+            elif command in handlers:
+                pipe.send((handlers[command](data), True))
+            else:
+                raise _unknown_command_error(command, ["close", *handlers])
+    except (KeyboardInterrupt, Exception):
+        error_queue.put((index,) + sys.exc_info()[:2])
+        pipe.send((None, False))
+    finally:
+        worker.close()
@@ -0,0 +1,139 @@
+"""A vector environment wrapper that steps two halves of the sub-environments alternately."""
+from typing import Optional, Union
+
+import numpy as np
+
+from gym.vector.async_vector_env import AsyncState, AsyncVectorEnv
+from gym.vector.utils import batch_space, get_batch_item
+from gym.vector.vector_env import VectorEnvWrapper
+
+__all__ = ["DoubleBatchVectorEnv"]
+
+
+class DoubleBatchVectorEnv(VectorEnvWrapper):
+    """Splits the sub-environments of an :class:`AsyncVectorEnv` in two halves A and B, which are stepped alternately.
+
+    Each call to :meth:`step` sends the actions of one half, and returns the results of the other half without
+    waiting for the half that was just sent. The caller can then compute the actions of the other half while the
+    workers step the first half, overlapping the policy inference with the environment steps.
+    The indices of the sub-environments of each half-batch are in ``info["env_id"]``.
+
+    Example::
+
+        >>> env = DoubleBatchVectorEnv(AsyncVectorEnv([...] * 8, shared_step_buffers=True))
+        >>> observations, infos = env.reset()  # the observations of half A
+        >>> observations, rewards, terminateds, truncateds, infos = env.step(policy(observations))
+        >>> # steps half A and returns the (reset) observations of half B, with zero rewards
+        >>> observations, rewards, terminateds, truncateds, infos = env.step(policy(observations))
+        >>> # steps half B and returns the results of the step of half A
+    """
+
+    def __init__(self, env: AsyncVectorEnv):
+        """Splits the sub-environments of ``env`` in two halves stepped alternately.
+
+        Args:
+            env: The vector environment, with ``shared_step_buffers`` (or ``envs_per_worker`` greater than 1)
+                and an even number of sub-environments.
+
+        Raises:
+            ValueError: If ``env`` is not an :class:`AsyncVectorEnv` with ``shared_step_buffers``, if its number
+                of sub-environments is odd, or if a worker hosts sub-environments of both halves (which could not be
+                stepped concurrently, e.g. with 6 sub-environments and ``envs_per_worker=2``).
+        """
+        super().__init__(env)
+        if not getattr(env.unwrapped, "shared_step_buffers", False):
+            raise ValueError(
+                "`DoubleBatchVectorEnv` requires an `AsyncVectorEnv` with `shared_step_buffers=True`."
+            )
+        if env.num_envs % 2 != 0:
+            raise ValueError(
+                f"`DoubleBatchVectorEnv` requires an even number of sub-environments, actual value: {env.num_envs}"
+            )
+        self.num_envs = env.num_envs // 2
+        for env_indices in env.unwrapped.worker_env_indices:
+            if env_indices[0] < self.num_envs <= env_indices[-1]:
+                raise ValueError(
+                    f"`DoubleBatchVectorEnv` requires the halves of the sub-environments to be hosted by different "
+                    f"workers, actual sub-environments of a worker: {env_indices}"
+                )
+        self.observation_space = batch_space(
+            env.single_observation_space, n=self.num_envs
+        )
+        self.action_space = batch_space(env.single_action_space, n=self.num_envs)
+        self.half_env_ids = (
+            np.arange(self.num_envs),
+            np.arange(self.num_envs, env.num_envs),
+        )
+
+        # The half whose actions are taken by the next step, and the reset results of the other half
+        self._half = 0
+        self._reset_results = None
+
+    def reset_async(self, **kwargs):
+        """Waits for the pending step of the last half sent, and resets all the sub-environments.
+
+        Args:
+            **kwargs: Keyword arguments passed to :meth:`AsyncVectorEnv.reset_async`
+        """
+        self._wait_pending_step()
+        return self.env.reset_async(**kwargs)
+
+    def reset_wait(self, **kwargs):
+        """Resets all the sub-environments, and returns the observations and infos of half A."""
+        observations, infos = self.env.reset_wait(**kwargs)
+        self._half = 0
+        self._reset_results = self._get_half(observations, infos, self.half_env_ids[1])
+        return self._get_half(observations, infos, self.half_env_ids[0])
+
+    def step_async(self, actions):
+        """Sends the actions of the current half to its sub-environments, without waiting for the other half."""
+        self.env.step_async(actions, env_ids=self.half_env_ids[self._half])
+
+    def step_wait(self, timeout: Optional[Union[int, float]] = None):
+        """Returns the results of the other half, whose actions are expected by the next step.
+
+        After a reset, the first call returns the reset observations of half B, with zero rewards.
+
+        Args:
+            timeout: Number of seconds before the call times out. If ``None``, the call never times out.
+
+        Returns:
+            The step results (obs, reward, terminated, truncated, info) of the other half
+        """
+        self._half = 1 - self._half
+        if self._reset_results is not None:
+            (observations, infos), self._reset_results = self._reset_results, None
+            zeros = np.zeros(self.num_envs, dtype=np.bool_)
+            return (
+                observations,
+                np.zeros(self.num_envs, dtype=np.float64),
+                zeros,
+                np.copy(zeros),
+                infos,
+            )
+        return self.env.step_wait(
+            timeout=timeout, env_ids=self.half_env_ids[self._half]
+        )
+
+    def close(self, **kwargs):
+        """Waits for the pending steps of the last half sent, and closes the vector environment.
+
+        Args:
+            **kwargs: Keyword arguments passed to :meth:`AsyncVectorEnv.close`
+        """
+        if not self.env.closed and not kwargs.get("terminate", False):
+            self._wait_pending_step(timeout=kwargs.get("timeout"))
+        return self.env.close(**kwargs)
+
+    def _wait_pending_step(self, timeout: Optional[Union[int, float]] = None):
+        """Waits for (and discards) the results of the half sent by the last step, if it is still pending."""
+        if self.env.unwrapped._state == AsyncState.WAITING_STEP:
+            self.env.step_wait(
+                timeout=timeout, env_ids=self.half_env_ids[1 - self._half]
+            )
+
+    def _get_half(self, observations, infos: dict, env_ids: np.ndarray):
+        """Returns the observations and infos of the sub-environments ``env_ids``."""
+        infos = {key: value[env_ids] for key, value in infos.items()}
+        infos["env_id"], infos["_env_id"] = env_ids, np.ones(len(env_ids), np.bool_)
+        return get_batch_item(observations, env_ids), infos
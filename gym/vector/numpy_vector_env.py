@@ -0,0 +1,197 @@
+"""A base class for the vector environments stepped with numpy operations on the whole batch."""
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import gym
+from gym.utils import seeding
+from gym.vector.vector_env import AUTORESET_MODES, VectorEnv
+
+__all__ = ["NumpyVectorEnv"]
+
+
+class NumpyVectorEnv(VectorEnv):
+    """Base class for the natively vectorized environments, which hold the state of all the sub-environments in an array.
+
+    Instead of stepping ``num_envs`` environments one at a time (like :class:`SyncVectorEnv`), the subclasses step
+    the rows of :attr:`state` (with shape ``(num_envs, d)``) all together with numpy operations.
+    The sub-environments are reset per row, according to ``autoreset_mode`` (see :class:`SyncVectorEnv`), and
+    are truncated after ``max_episode_steps`` steps (like the :class:`TimeLimit` wrapper).
+
+    Subclasses implement :meth:`_reset_state`, :meth:`_step_state` and :meth:`_get_obs`.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        observation_space: gym.Space,
+        action_space: gym.Space,
+        max_episode_steps: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+    ):
+        """Initialises the batch of sub-environments, whose state is set by :meth:`reset`.
+
+        Args:
+            num_envs: Number of sub-environments.
+            observation_space: Observation space of a single environment.
+            action_space: Action space of a single environment.
+            max_episode_steps: If not ``None``, the sub-environments are truncated after this many steps.
+            autoreset_mode: When the sub-environments are reset after termination or truncation, one of
+                ``"same-step"``, ``"next-step"`` or ``"disabled"`` (see :class:`SyncVectorEnv`).
+
+        Raises:
+            ValueError: If ``autoreset_mode`` is unknown.
+        """
+        if autoreset_mode not in AUTORESET_MODES:
+            raise ValueError(
+                f"Expected `autoreset_mode` to be one of {AUTORESET_MODES}, actual value: {autoreset_mode}"
+            )
+        super().__init__(num_envs, observation_space, action_space)
+        self.max_episode_steps = max_episode_steps
+        self.autoreset_mode = autoreset_mode
+
+        self.state = None
+        self._actions = None
+        self._elapsed_steps = np.zeros(self.num_envs, dtype=np.int64)
+        self._autoreset_envs = np.zeros(self.num_envs, dtype=np.bool_)
+        # The sub-environments truncated on their next step, see `truncate_envs`
+        self._truncate_envs = np.zeros(self.num_envs, dtype=np.bool_)
+
+    def reset_wait(
+        self,
+        seed: Optional[Union[int, List[int]]] = None,
+        options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
+    ):
+        """Resets the rows of the state of all the sub-environments (or the ones in ``indices``).
+
+        Args:
+            seed: If not ``None``, the random number generator of the batch is seeded with ``seed`` (an int).
+            options: Reset options, with the same keys as the single environment.
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset.
+
+        Returns:
+            The batch of observations and the (empty) infos
+
+        Raises:
+            ValueError: If ``seed`` is not an int, as the sub-environments share a random number generator.
+        """
+        if seed is not None:
+            if not isinstance(seed, (int, np.integer)):
+                raise ValueError(
+                    f"Expected `seed` to be an int seeding the sub-environments of `{type(self).__name__}` together, actual value: {seed}"
+                )
+            self._np_random, seed = seeding.np_random(int(seed))
+
+        if indices is None or self.state is None:
+            indices = np.arange(self.num_envs)
+        indices = np.asarray(indices, dtype=np.int64)
+
+        state = self._reset_state(len(indices), options)
+        if self.state is None:
+            self.state = state
+        else:
+            self.state[indices] = state
+        self._elapsed_steps[indices] = 0
+        self._autoreset_envs[indices] = False
+        self._truncate_envs[indices] = False
+        return self._get_obs(self.state), {}
+
+    def step_async(self, actions):
+        """Sets the batch of actions used by :meth:`step_wait`."""
+        self._actions = np.asarray(actions)
+
+    def step_wait(self):
+        """Steps all the rows of the state together, resetting them according to the autoreset mode.
+
+        Returns:
+            The batched environment step results
+        """
+        assert self.state is not None, "Call reset before using step method."
+        autoreset = self._autoreset_envs
+        self.state, rewards, terminateds = self._step_state(self.state, self._actions)
+        self._elapsed_steps += 1
+
+        if autoreset.any():
+            # With the "next-step" autoreset mode, the sub-environments that ended on the last step are only reset
+            self.state[autoreset] = self._reset_state(int(autoreset.sum()), None)
+            rewards[autoreset], terminateds[autoreset] = 0.0, False
+            self._elapsed_steps[autoreset] = 0
+
+        if self.max_episode_steps is None:
+            truncateds = np.zeros(self.num_envs, dtype=np.bool_)
+        else:
+            truncateds = self._elapsed_steps >= self.max_episode_steps
+        truncateds |= self._truncate_envs & ~autoreset
+        self._truncate_envs[:] = False
+        observations = self._get_obs(self.state)
+
+        infos = {}
+        dones = terminateds | truncateds
+        self._autoreset_envs = np.zeros(self.num_envs, dtype=np.bool_)
+        if dones.any():
+            if self.autoreset_mode == "same-step":
+                final_observations = np.empty(self.num_envs, dtype=object)
+                for i in np.flatnonzero(dones):
+                    final_observations[i] = observations[i].copy()
+                infos["final_observation"], infos["_final_observation"] = (
+                    final_observations,
+                    dones,
+                )
+
+                self.state[dones] = self._reset_state(int(dones.sum()), None)
+                self._elapsed_steps[dones] = 0
+                observations[dones] = self._get_obs(self.state[dones])
+            elif self.autoreset_mode == "next-step":
+                self._autoreset_envs = dones
+
+        return observations, rewards, terminateds, truncateds, infos
+
+    def truncate_envs(self, indices: Sequence[int]):
+        """Truncates the sub-environments ``indices`` on their next step, see :meth:`VectorEnv.truncate_envs`."""
+        self._truncate_envs[np.asarray(indices, dtype=np.int64)] = True
+
+    def _seed_envs(self, seed_seqs: List[np.random.SeedSequence]):
+        # The sub-environments share the random number generator of the batch, seeded with the first stream
+        self._np_random = seeding.RandomNumberGenerator(np.random.PCG64(seed_seqs[0]))
+
+    def _get_env_rng_states(self) -> List[dict]:
+        return [{"np_random": self.np_random.bit_generator.state}]
+
+    def _set_env_rng_states(self, states: List[dict]):
+        self.np_random.bit_generator.state = states[0]["np_random"]
+
+    def _get_env_states(self) -> List[dict]:
+        # The rows of the batch are snapshot together
+        return [
+            {
+                "state": self.state,
+                "elapsed_steps": self._elapsed_steps,
+                "autoreset_envs": self._autoreset_envs,
+                "np_random": self.np_random.bit_generator.state,
+            }
+        ]
+
+    def _set_env_states(self, states: List[dict]):
+        self.state = np.copy(states[0]["state"])
+        self._elapsed_steps[:] = states[0]["elapsed_steps"]
+        self._autoreset_envs[:] = states[0]["autoreset_envs"]
+        self.np_random.bit_generator.state = states[0]["np_random"]
+
+    def _reset_state(self, n: int, options: Optional[dict]) -> np.ndarray:
+        """Returns ``n`` new rows of the state, sampled with :attr:`np_random` from the initial state distribution."""
+        raise NotImplementedError
+
+    def _step_state(
+        self, state: np.ndarray, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Steps all the rows of ``state`` with the batch of ``actions``.
+
+        Returns:
+            The next state, the rewards (float64) and the terminated flags (bool) of all the rows
+        """
+        raise NotImplementedError
+
+    def _get_obs(self, state: np.ndarray) -> np.ndarray:
+        """Returns the observations of the rows of ``state``, as a new array."""
+        raise NotImplementedError
@@ -0,0 +1,167 @@
+"""A rollout collector stepping a vector environment into preallocated ``(T, N, ...)`` arrays."""
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from gym.vector.utils import create_empty_array, get_batch_item, set_batch_item
+from gym.vector.vector_env import VectorEnv
+
+__all__ = ["Rollout", "RolloutCollector"]
+
+
+@dataclass
+class Rollout:
+    """The ``T`` steps of the ``N`` sub-environments collected by :class:`RolloutCollector`, as ``(T, N, ...)`` arrays.
+
+    * observations: The observations the actions were taken from, with the (nested) layout of :func:`create_empty_array`
+    * actions: The actions taken
+    * rewards: The rewards (float64)
+    * terminateds: The terminated flags
+    * truncateds: The truncated flags
+    * final_observations: An object array with the terminal observation of the sub-environments that were reset within
+      the step (with the ``"same-step"`` autoreset mode), ``None`` elsewhere. Used to bootstrap the truncated episodes.
+    * final_observation_mask: If the sub-environment has a terminal observation in ``final_observations``
+    * next_observations: The ``(N, ...)`` observations after the last step, used to bootstrap the rollout
+    """
+
+    observations: Any
+    actions: Any
+    rewards: np.ndarray
+    terminateds: np.ndarray
+    truncateds: np.ndarray
+    final_observations: np.ndarray
+    final_observation_mask: np.ndarray
+    next_observations: Any
+
+
+class RolloutCollector:
+    """Steps a vector environment ``num_steps`` times, writing the results in place into preallocated arrays.
+
+    The storage of the rollouts is allocated once with :func:`create_empty_array` (from the batched spaces of the
+    environment), and each step is written into it with one assignment per array. The rollouts are kept in a ring of
+    ``num_buffers`` storages: :meth:`collect` returns views of the storage (without copying them), which stay valid for
+    the following ``num_buffers - 1`` calls to :meth:`collect`, and are overwritten after.
+    The episodes continue from one rollout to the next.
+
+    To write the observations straight from the shared memory of an :class:`AsyncVectorEnv` (or from the batch of a
+    :class:`SyncVectorEnv`), create the environment with ``copy=False``.
+
+    Example::
+
+        >>> envs = gym.vector.make("CartPole-v1", num_envs=8, vector_kwargs={"copy": False})
+        >>> collector = RolloutCollector(envs, num_steps=128)
+        >>> collector.reset(seed=42)
+        >>> rollout = collector.collect(lambda observations: envs.action_space.sample())
+        >>> rollout.observations.shape, rollout.rewards.shape
+        ((128, 8, 4), (128, 8))
+    """
+
+    def __init__(self, env: VectorEnv, num_steps: int, num_buffers: int = 1):
+        """Allocates the storage of the rollouts.
+
+        Args:
+            env: The vector environment to step.
+            num_steps: The number of steps ``T`` of each rollout.
+            num_buffers: The number of rollouts kept in the ring of storages.
+
+        Raises:
+            ValueError: If ``num_steps`` or ``num_buffers`` is lower than 1.
+        """
+        if num_steps < 1:
+            raise ValueError(
+                f"Expected `num_steps` to be at least 1, actual value: {num_steps}"
+            )
+        if num_buffers < 1:
+            raise ValueError(
+                f"Expected `num_buffers` to be at least 1, actual value: {num_buffers}"
+            )
+        self.env = env
+        self.num_envs = env.num_envs
+        self.num_steps = num_steps
+        self.num_buffers = num_buffers
+
+        self._rollouts = [self._create_rollout() for _ in range(num_buffers)]
+        self._rollout_index = 0
+        # The observations the next rollout starts from, `None` until the environment is reset
+        self._observations = None
+
+    def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
+        """Resets the vector environment, such that the next rollout starts new episodes.
+
+        Args:
+            seed: The reset seed of the vector environment.
+            options: The reset options of the vector environment.
+
+        Returns:
+            The batch of observations and infos returned by the reset
+        """
+        observations, infos = self.env.reset(seed=seed, options=options)
+        self._observations = create_empty_array(
+            self.env.single_observation_space, n=self.num_envs, fn=np.zeros
+        )
+        set_batch_item(self._observations, slice(None), observations)
+        return observations, infos
+
+    def collect(self, policy: Callable[[Any], Union[np.ndarray, Any]]) -> Rollout:
+        """Steps the vector environment ``num_steps`` times with the actions of ``policy``.
+
+        The environment is reset first if :meth:`reset` was not called before.
+
+        Args:
+            policy: A function returning the batch of actions from a batch of observations. The observations are
+                views of the storage of the rollout, and are only valid during the call.
+
+        Returns:
+            The next rollout of the ring, whose arrays are views of the storage
+        """
+        if self._observations is None:
+            self.reset()
+        rollout = self._rollouts[self._rollout_index]
+        self._rollout_index = (self._rollout_index + 1) % self.num_buffers
+
+        rollout.final_observations[:] = None
+        rollout.final_observation_mask[:] = False
+        set_batch_item(rollout.observations, 0, self._observations)
+        for t in range(self.num_steps):
+            actions = policy(get_batch_item(rollout.observations, t, copy=False))
+            set_batch_item(rollout.actions, t, actions)
+            (
+                observations,
+                rollout.rewards[t],
+                rollout.terminateds[t],
+                rollout.truncateds[t],
+                infos,
+            ) = self.env.step(actions)
+
+            if "final_observation" in infos:
+                mask = infos["_final_observation"]
+                rollout.final_observation_mask[t] = mask
+                rollout.final_observations[t, mask] = infos["final_observation"][mask]
+            if t + 1 < self.num_steps:
+                set_batch_item(rollout.observations, t + 1, observations)
+            else:
+                set_batch_item(rollout.next_observations, slice(None), observations)
+
+        self._observations = rollout.next_observations
+        return rollout
+
+    def _create_rollout(self) -> Rollout:
+        """Allocates the ``(T, N, ...)`` arrays of a rollout."""
+        shape = (self.num_steps, self.num_envs)
+        return Rollout(
+            observations=create_empty_array(
+                self.env.observation_space, n=self.num_steps, fn=np.zeros
+            ),
+            actions=create_empty_array(
+                self.env.action_space, n=self.num_steps, fn=np.zeros
+            ),
+            rewards=np.zeros(shape, dtype=np.float64),
+            terminateds=np.zeros(shape, dtype=np.bool_),
+            truncateds=np.zeros(shape, dtype=np.bool_),
+            final_observations=np.full(shape, None, dtype=object),
+            final_observation_mask=np.zeros(shape, dtype=np.bool_),
+            next_observations=create_empty_array(
+                self.env.single_observation_space, n=self.num_envs, fn=np.zeros
+            ),
+        )
@@ -6,8 +6,19 @@ import numpy as np
 
 from gym import Env
 from gym.spaces import Space
-from gym.vector.utils import concatenate, create_empty_array, iterate
-from gym.vector.vector_env import VectorEnv
+from gym.vector.utils import (
+    concatenate,
+    copy_batch,
+    create_empty_array,
+    dump_env_state,
+    get_env_rng_state,
+    iterate,
+    load_env_state,
+    scatter,
+    seed_env,
+    set_env_rng_state,
+)
+from gym.vector.vector_env import AUTORESET_MODES, VectorEnv
 
 __all__ = ["SyncVectorEnv"]
 
@@ -33,6 +44,8 @@ class SyncVectorEnv(VectorEnv):
         observation_space: Space = None,
         action_space: Space = None,
         copy: bool = True,
+        num_observation_buffers: Optional[int] = None,
+        autoreset_mode: str = "same-step",
     ):
         """Vectorized environment that serially runs multiple environments.
 
@@ -43,8 +56,20 @@ class SyncVectorEnv(VectorEnv):
             action_space: Action space of a single environment. If ``None``,
                 then the action space of the first environment is taken.
             copy: If ``True``, then the :meth:`reset` and :meth:`step` methods return a copy of the observations.
+                If ``False``, the arrays of the infos are also reused between steps.
+            num_observation_buffers: If not ``None``, the observations are written in a ring of this many
+                preallocated buffers, and :meth:`reset` and :meth:`step` return the current buffer instead of a copy
+                (regardless of ``copy``). The returned observations stay valid for the following
+                ``num_observation_buffers - 1`` calls to :meth:`reset` and :meth:`step`, and are overwritten after.
+            autoreset_mode: When the sub-environments are reset after termination or truncation. With ``"same-step"``,
+                they are reset within the same step and the terminal observation is in ``info["final_observation"]``.
+                With ``"next-step"``, they are reset on the following step (ignoring their action, with a zero reward)
+                and the terminal observation is returned in the batch of observations. With ``"disabled"``, they are
+                only reset by :meth:`reset` (e.g. with ``indices``).
 
         Raises:
+            ValueError: If ``num_observation_buffers`` is less than 1.
+            ValueError: If ``autoreset_mode`` is not one of ``"same-step"``, ``"next-step"`` or ``"disabled"``.
             RuntimeError: If the observation space of some sub-environment does not match observation_space
                 (or, by default, the observation space of the first sub-environment).
         """
@@ -63,12 +88,33 @@ class SyncVectorEnv(VectorEnv):
         )
 
         self._check_spaces()
+        if num_observation_buffers is not None and num_observation_buffers < 1:
+            raise ValueError(
+                f"`num_observation_buffers` must be at least 1, got {num_observation_buffers}."
+            )
+        if autoreset_mode not in AUTORESET_MODES:
+            raise ValueError(
+                f"`autoreset_mode` must be one of {AUTORESET_MODES}, got {autoreset_mode!r}."
+            )
+        self.autoreset_mode = autoreset_mode
+        self.num_observation_buffers = num_observation_buffers
+        self._observation_buffers = [
+            create_empty_array(
+                self.single_observation_space, n=self.num_envs, fn=np.zeros
+            )
+            for _ in range(num_observation_buffers or 0)
+        ]
+        self._observation_buffer_index = 0
         self.observations = create_empty_array(
             self.single_observation_space, n=self.num_envs, fn=np.zeros
         )
         self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
         self._terminateds = np.zeros((self.num_envs,), dtype=np.bool_)
         self._truncateds = np.zeros((self.num_envs,), dtype=np.bool_)
+        # The sub-environments to reset on their next step, with the "next-step" autoreset mode
+        self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        # The sub-environments truncated on their next step, see `truncate_envs`
+        self._truncate_envs = np.zeros((self.num_envs,), dtype=np.bool_)
         self._actions = None
 
     def seed(self, seed: Optional[Union[int, Sequence[int]]] = None):
@@ -91,42 +137,66 @@ class SyncVectorEnv(VectorEnv):
         self,
         seed: Optional[Union[int, List[int]]] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ):
         """Waits for the calls triggered by :meth:`reset_async` to finish and returns the results.
 
         Args:
             seed: The reset environment seed
             options: Option information for the environment reset
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset,
+                otherwise only their rows of the observations are updated.
 
         Returns:
             The reset observation of the environment and reset information
         """
+        partial_reset = indices is not None
+        indices = list(range(self.num_envs) if indices is None else indices)
         if seed is None:
-            seed = [None for _ in range(self.num_envs)]
+            seed = [None for _ in indices]
         if isinstance(seed, int):
-            seed = [seed + i for i in range(self.num_envs)]
-        assert len(seed) == self.num_envs
-
-        self._terminateds[:] = False
-        self._truncateds[:] = False
-        observations = []
-        infos = {}
-        for i, (env, single_seed) in enumerate(zip(self.envs, seed)):
-
+            seed = [seed + i for i in indices]
+        assert len(seed) == len(indices)
+        if len(indices) == 0:
+            # E.g. none of the sub-environments ended, with the "disabled" autoreset mode
+            return self._get_observations(), {}
+
+        self._terminateds[indices] = False
+        self._truncateds[indices] = False
+        self._autoreset_envs[indices] = False
+        self._truncate_envs[indices] = False
+        reset_kwargs = []
+        for single_seed in seed:
             kwargs = {}
             if single_seed is not None:
                 kwargs["seed"] = single_seed
             if options is not None:
                 kwargs["options"] = options
+            reset_kwargs.append(kwargs)
 
-            observation, info = env.reset(**kwargs)
-            observations.append(observation)
-            infos = self._add_info(infos, info, i)
-
-        self.observations = concatenate(
-            self.single_observation_space, observations, self.observations
-        )
-        return (deepcopy(self.observations) if self.copy else self.observations), infos
+        with self._timer("env_reset"):
+            observations, infos = zip(
+                *self._map(self._reset_env, indices, reset_kwargs)
+            )
+        with self._timer("add_info"):
+            infos = self._batch_infos(dict(zip(indices, infos)))
+
+        with self._timer("concatenate"):
+            out = self._observations_out()
+            if partial_reset:
+                if out is not self.observations:
+                    out = copy_batch(
+                        self.single_observation_space, self.observations, out
+                    )
+                self.observations = scatter(
+                    self.single_observation_space, observations, indices, out
+                )
+            else:
+                self.observations = concatenate(
+                    self.single_observation_space, observations, out
+                )
+            observations = self._get_observations()
+        return observations, infos
 
     def step_async(self, actions):
         """Sets :attr:`_actions` for use by the :meth:`step_wait` by converting the ``actions`` to an iterable version."""
@@ -138,35 +208,78 @@ class SyncVectorEnv(VectorEnv):
         Returns:
             The batched environment step results
         """
-        observations, infos = [], {}
-        for i, (env, action) in enumerate(zip(self.envs, self._actions)):
-
-            (
-                observation,
-                self._rewards[i],
-                self._terminateds[i],
-                self._truncateds[i],
-                info,
-            ) = env.step(action)
-
-            if self._terminateds[i] or self._truncateds[i]:
-                old_observation = observation
-                observation, info = env.reset()
-                info["final_observation"] = old_observation
-            observations.append(observation)
-            infos = self._add_info(infos, info, i)
-        self.observations = concatenate(
-            self.single_observation_space, observations, self.observations
-        )
+        with self._timer("env_step"):
+            observations, infos = zip(
+                *self._map(self._step_env, range(self.num_envs), self._actions)
+            )
+        with self._timer("add_info"):
+            infos = self._batch_infos(infos)
+        with self._timer("concatenate"):
+            self.observations = concatenate(
+                self.single_observation_space, observations, self._observations_out()
+            )
+            observations = self._get_observations()
 
         return (
-            deepcopy(self.observations) if self.copy else self.observations,
+            observations,
             np.copy(self._rewards),
             np.copy(self._terminateds),
             np.copy(self._truncateds),
             infos,
         )
 
+    def _observations_out(self):
+        """Returns the batch the observations are written to, the next buffer of the ring if there is one."""
+        if not self._observation_buffers:
+            return self.observations
+        out = self._observation_buffers[self._observation_buffer_index]
+        self._observation_buffer_index = (
+            self._observation_buffer_index + 1
+        ) % self.num_observation_buffers
+        return out
+
+    def _get_observations(self):
+        """Returns the batched observations, a copy if ``copy`` is set and there is no ring of buffers."""
+        if self.copy and not self._observation_buffers:
+            return deepcopy(self.observations)
+        return self.observations
+
+    def _map(self, function: Callable, *iterables) -> Iterator:
+        """Applies ``function`` to each sub-environment (serially), overridden by vector environments that parallelize it."""
+        return map(function, *iterables)
+
+    def _reset_env(self, index: int, kwargs: dict) -> tuple:
+        """Resets the sub-environment ``index``, returning its observation and info."""
+        return self.envs[index].reset(**kwargs)
+
+    def _step_env(self, index: int, action) -> tuple:
+        """Steps the sub-environment ``index`` (resetting it according to the autoreset mode), returning its observation and info."""
+        env = self.envs[index]
+        truncate, self._truncate_envs[index] = self._truncate_envs[index], False
+        if self._autoreset_envs[index]:
+            self._rewards[index] = 0.0
+            self._terminateds[index], self._truncateds[index] = False, False
+            self._autoreset_envs[index] = False
+            return env.reset()
+
+        (
+            observation,
+            self._rewards[index],
+            self._terminateds[index],
+            self._truncateds[index],
+            info,
+        ) = env.step(action)
+        self._truncateds[index] |= truncate
+
+        if self._terminateds[index] or self._truncateds[index]:
+            if self.autoreset_mode == "same-step":
+                old_observation = observation
+                observation, info = env.reset()
+                info["final_observation"] = old_observation
+            else:
+                self._autoreset_envs[index] = self.autoreset_mode == "next-step"
+        return observation, info
+
     def call(self, name, *args, **kwargs) -> tuple:
         """Calls the method with name and applies args and kwargs.
 
@@ -212,6 +325,27 @@ class SyncVectorEnv(VectorEnv):
         for env, value in zip(self.envs, values):
             setattr(env, name, value)
 
+    def _seed_envs(self, seed_seqs: List[np.random.SeedSequence]):
+        for env, seed_seq in zip(self.envs, seed_seqs):
+            seed_env(env, seed_seq)
+
+    def _get_env_rng_states(self) -> List[dict]:
+        return [get_env_rng_state(env) for env in self.envs]
+
+    def _set_env_rng_states(self, states: List[dict]):
+        for env, state in zip(self.envs, states):
+            set_env_rng_state(env, state)
+
+    def truncate_envs(self, indices: Sequence[int]):
+        """Truncates the sub-environments ``indices`` on their next step, see :meth:`VectorEnv.truncate_envs`."""
+        self._truncate_envs[np.asarray(indices, dtype=np.int64)] = True
+
+    def _get_env_states(self) -> List[bytes]:
+        return list(self._map(dump_env_state, self.envs, self._autoreset_envs))
+
+    def _set_env_states(self, states: List[bytes]):
+        self._autoreset_envs[:] = list(self._map(load_env_state, self.envs, states))
+
     def close_extras(self, **kwargs):
         """Close the environments."""
         [env.close() for env in self.envs]
@@ -0,0 +1,91 @@
+"""A threaded vector environment."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+from gym import Env
+from gym.spaces import Space
+from gym.vector.sync_vector_env import SyncVectorEnv
+
+__all__ = ["ThreadedVectorEnv"]
+
+
+class ThreadedVectorEnv(SyncVectorEnv):
+    """Vectorized environment that runs multiple environments in parallel threads.
+
+    The sub-environments are stepped by a thread pool, and the results are batched in the same way as
+    :class:`SyncVectorEnv`. As the environments live in the main process, there is no process startup,
+    pickling or duplicated model memory. This is efficient for simulators that release the GIL
+    while stepping (e.g. ``mujoco.mj_step`` for the MuJoCo environments); for pure Python environments,
+    the threads are serialized by the GIL and :class:`SyncVectorEnv` is usually faster.
+
+    Example::
+
+        >>> import gym
+        >>> env = gym.vector.ThreadedVectorEnv([
+        ...     lambda: gym.make("Pendulum-v1", g=9.81),
+        ...     lambda: gym.make("Pendulum-v1", g=1.62)
+        ... ])
+        >>> env.reset()
+        array([[-0.8286432 ,  0.5597771 ,  0.90249056],
+               [-0.85009176,  0.5266346 ,  0.60007906]], dtype=float32)
+    """
+
+    def __init__(
+        self,
+        env_fns: Iterator[Callable[[], Env]],
+        observation_space: Space = None,
+        action_space: Space = None,
+        copy: bool = True,
+        num_observation_buffers: Optional[int] = None,
+        autoreset_mode: str = "same-step",
+        num_threads: Optional[int] = None,
+    ):
+        """Vectorized environment that runs multiple environments in parallel threads.
+
+        Args:
+            env_fns: iterable of callable functions that create the environments.
+            observation_space: Observation space of a single environment. If ``None``,
+                then the observation space of the first environment is taken.
+            action_space: Action space of a single environment. If ``None``,
+                then the action space of the first environment is taken.
+            copy: If ``True``, then the :meth:`reset` and :meth:`step` methods return a copy of the observations.
+                If ``False``, the arrays of the infos are also reused between steps.
+            num_observation_buffers: If not ``None``, the observations are written in a ring of this many
+                preallocated buffers, and :meth:`reset` and :meth:`step` return the current buffer instead of a copy
+                (regardless of ``copy``). The returned observations stay valid for the following
+                ``num_observation_buffers - 1`` calls to :meth:`reset` and :meth:`step`, and are overwritten after.
+            autoreset_mode: When the sub-environments are reset after termination or truncation, one of
+                ``"same-step"``, ``"next-step"`` or ``"disabled"`` (see :class:`SyncVectorEnv`).
+            num_threads: The number of threads of the pool. If ``None``, then the minimum of the number of
+                environments and the number of CPUs is used.
+
+        Raises:
+            ValueError: If ``num_observation_buffers`` is less than 1.
+            ValueError: If ``autoreset_mode`` is not one of ``"same-step"``, ``"next-step"`` or ``"disabled"``.
+            RuntimeError: If the observation space of some sub-environment does not match observation_space
+                (or, by default, the observation space of the first sub-environment).
+        """
+        super().__init__(
+            env_fns,
+            observation_space=observation_space,
+            action_space=action_space,
+            copy=copy,
+            num_observation_buffers=num_observation_buffers,
+            autoreset_mode=autoreset_mode,
+        )
+        self.num_threads = num_threads or min(self.num_envs, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_threads,
+            thread_name_prefix=f"Worker<{type(self).__name__}>",
+        )
+
+    def _map(self, function: Callable, *iterables) -> Iterator:
+        """Applies ``function`` to each sub-environment in the thread pool, the results are in order."""
+        return self._executor.map(function, *iterables)
+
+    def close_extras(self, **kwargs):
+        """Shuts down the thread pool and closes the environments."""
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=True)
+        super().close_extras(**kwargs)
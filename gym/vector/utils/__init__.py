@@ -1,9 +1,32 @@
 """Module for gym vector utils."""
-from gym.vector.utils.misc import CloudpickleWrapper, clear_mpi_env_vars
-from gym.vector.utils.numpy_utils import concatenate, create_empty_array
+from gym.vector.utils.misc import (
+    CloudpickleWrapper,
+    clear_mpi_env_vars,
+    dump_env_state,
+    load_env_state,
+)
+from gym.vector.utils.numpy_utils import (
+    concatenate,
+    copy_batch,
+    create_empty_array,
+    get_batch_item,
+    scatter,
+    set_batch_item,
+)
+from gym.vector.utils.rng import (
+    get_env_rng_state,
+    get_space_rng_state,
+    seed_env,
+    seed_space,
+    set_env_rng_state,
+    set_space_rng_state,
+)
 from gym.vector.utils.shared_memory import (
+    SharedMemoryArena,
+    create_shared_info_memory,
     create_shared_memory,
     read_from_shared_memory,
+    read_info_from_shared_memory,
     write_to_shared_memory,
 )
 from gym.vector.utils.spaces import _BaseGymSpaces  # pyright: reportPrivateUsage=false
@@ -12,12 +35,27 @@ from gym.vector.utils.spaces import BaseGymSpaces, batch_space, iterate
 __all__ = [
     "CloudpickleWrapper",
     "clear_mpi_env_vars",
+    "dump_env_state",
+    "load_env_state",
+    "SharedMemoryArena",
     "concatenate",
+    "copy_batch",
+    "scatter",
+    "get_batch_item",
+    "set_batch_item",
     "create_empty_array",
     "create_shared_memory",
     "read_from_shared_memory",
     "write_to_shared_memory",
+    "create_shared_info_memory",
+    "read_info_from_shared_memory",
     "BaseGymSpaces",
     "batch_space",
     "iterate",
+    "seed_space",
+    "get_space_rng_state",
+    "set_space_rng_state",
+    "seed_env",
+    "get_env_rng_state",
+    "set_env_rng_state",
 ]
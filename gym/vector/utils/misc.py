@@ -1,8 +1,17 @@
 """Miscellaneous utilities."""
 import contextlib
 import os
+import pickle
 
-__all__ = ["CloudpickleWrapper", "clear_mpi_env_vars"]
+import gym
+from gym.vector.utils.rng import get_env_rng_state, set_env_rng_state
+
+__all__ = [
+    "CloudpickleWrapper",
+    "clear_mpi_env_vars",
+    "dump_env_state",
+    "load_env_state",
+]
 
 
 class CloudpickleWrapper:
@@ -53,3 +62,35 @@ def clear_mpi_env_vars():
         yield
     finally:
         os.environ.update(removed_environment)
+
+
+def dump_env_state(env: gym.Env, autoreset: bool = False) -> bytes:
+    """Serializes the snapshot of ``env`` (see :meth:`Env.save_state`) with the states of its random number generators.
+
+    Args:
+        env: The environment to snapshot
+        autoreset: If the environment is reset on its next step, with the ``"next-step"`` autoreset mode
+
+    Returns:
+        The pickled snapshot, restored by :func:`load_env_state`
+    """
+    return pickle.dumps(
+        (env.save_state(), get_env_rng_state(env), autoreset),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def load_env_state(env: gym.Env, state: bytes) -> bool:
+    """Restores ``env`` and the states of its random number generators from a snapshot of :func:`dump_env_state`.
+
+    Args:
+        env: The environment to restore
+        state: The pickled snapshot returned by :func:`dump_env_state`
+
+    Returns:
+        If the environment is reset on its next step, with the ``"next-step"`` autoreset mode
+    """
+    env_state, rng_state, autoreset = pickle.loads(state)
+    env.load_state(env_state)
+    set_env_rng_state(env, rng_state)
+    return autoreset
@@ -1,13 +1,21 @@
-"""Numpy utility functions: concatenate space samples and create empty array."""
+"""Numpy utility functions: concatenate space samples, copy batches, scatter samples, index batches and create empty array."""
 from collections import OrderedDict
+from copy import deepcopy
 from functools import singledispatch
-from typing import Iterable, Union
+from typing import Iterable, Sequence, Union
 
 import numpy as np
 
 from gym.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Space, Tuple
 
-__all__ = ["concatenate", "create_empty_array"]
+__all__ = [
+    "concatenate",
+    "copy_batch",
+    "scatter",
+    "get_batch_item",
+    "set_batch_item",
+    "create_empty_array",
+]
 
 
 @singledispatch
@@ -73,6 +81,199 @@ def _concatenate_custom(space, items, out):
     return tuple(items)
 
 
+@singledispatch
+def copy_batch(
+    space: Space,
+    batch: Union[tuple, dict, np.ndarray],
+    out: Union[tuple, dict, np.ndarray],
+) -> Union[tuple, dict, np.ndarray]:
+    """Copy a batch of samples from space into a preallocated object, without allocating new arrays.
+
+    Example::
+
+        >>> from gym.spaces import Box
+        >>> space = Box(low=0, high=1, shape=(3,), dtype=np.float32)
+        >>> batch = np.ones((2, 3), dtype=np.float32)
+        >>> out = np.zeros((2, 3), dtype=np.float32)
+        >>> copy_batch(space, batch, out)
+        array([[1., 1., 1.],
+               [1., 1., 1.]], dtype=float32)
+
+    Args:
+        space: Observation space of a single environment in the vectorized environment.
+        batch: The batch of samples to copy, e.g. from :func:`concatenate` or :func:`read_from_shared_memory`.
+        out: The output object, e.g. from :func:`create_empty_array`.
+
+    Returns:
+        The output object. This object is a (possibly nested) numpy array.
+
+    Raises:
+        ValueError: Space is not a valid :class:`gym.Space` instance
+    """
+    raise ValueError(
+        f"Space of type `{type(space)}` is not a valid `gym.Space` instance."
+    )
+
+
+@copy_batch.register(Box)
+@copy_batch.register(Discrete)
+@copy_batch.register(MultiDiscrete)
+@copy_batch.register(MultiBinary)
+def _copy_batch_base(space, batch, out):
+    np.copyto(out, batch)
+    return out
+
+
+@copy_batch.register(Tuple)
+def _copy_batch_tuple(space, batch, out):
+    return tuple(
+        copy_batch(subspace, batch[i], out[i])
+        for (i, subspace) in enumerate(space.spaces)
+    )
+
+
+@copy_batch.register(Dict)
+def _copy_batch_dict(space, batch, out):
+    return OrderedDict(
+        [
+            (key, copy_batch(subspace, batch[key], out[key]))
+            for (key, subspace) in space.spaces.items()
+        ]
+    )
+
+
+@copy_batch.register(Space)
+def _copy_batch_custom(space, batch, out):
+    return deepcopy(batch)
+
+
+@singledispatch
+def scatter(
+    space: Space,
+    items: Iterable,
+    indices: Sequence[int],
+    out: Union[tuple, dict, np.ndarray],
+) -> Union[tuple, dict, np.ndarray]:
+    """Write multiple samples from space into the rows ``indices`` of a batch, leaving the other rows untouched.
+
+    Example::
+
+        >>> from gym.spaces import Box
+        >>> space = Box(low=0, high=1, shape=(3,), dtype=np.float32)
+        >>> out = np.zeros((3, 3), dtype=np.float32)
+        >>> scatter(space, [np.ones(3, dtype=np.float32)], [1], out)
+        array([[0., 0., 0.],
+               [1., 1., 1.],
+               [0., 0., 0.]], dtype=float32)
+
+    Args:
+        space: Observation space of a single environment in the vectorized environment.
+        items: Samples to be written, one for each index in ``indices``.
+        indices: The rows of the batch the samples are written to.
+        out: The output object. This object is a (possibly nested) numpy array.
+
+    Returns:
+        The output object. This object is a (possibly nested) numpy array.
+
+    Raises:
+        ValueError: Space is not a valid :class:`gym.Space` instance
+    """
+    raise ValueError(
+        f"Space of type `{type(space)}` is not a valid `gym.Space` instance."
+    )
+
+
+@scatter.register(Box)
+@scatter.register(Discrete)
+@scatter.register(MultiDiscrete)
+@scatter.register(MultiBinary)
+def _scatter_base(space, items, indices, out):
+    for index, item in zip(indices, items):
+        out[index] = item
+    return out
+
+
+@scatter.register(Tuple)
+def _scatter_tuple(space, items, indices, out):
+    return tuple(
+        scatter(subspace, [item[i] for item in items], indices, out[i])
+        for (i, subspace) in enumerate(space.spaces)
+    )
+
+
+@scatter.register(Dict)
+def _scatter_dict(space, items, indices, out):
+    return OrderedDict(
+        [
+            (key, scatter(subspace, [item[key] for item in items], indices, out[key]))
+            for (key, subspace) in space.spaces.items()
+        ]
+    )
+
+
+@scatter.register(Space)
+def _scatter_custom(space, items, indices, out):
+    out = list(out)
+    for index, item in zip(indices, items):
+        out[index] = item
+    return tuple(out)
+
+
+def get_batch_item(batch, index, copy: bool = True):
+    """Returns the ``index``-th element(s) of a (possibly nested) batch of numpy arrays.
+
+    Example::
+
+        >>> batch = OrderedDict([("position", np.zeros((4, 2))), ("velocity", np.ones((4, 2)))])
+        >>> get_batch_item(batch, [3, 1])
+        OrderedDict([('position', array([[0., 0.], [0., 0.]])), ('velocity', array([[1., 1.], [1., 1.]]))])
+
+    Args:
+        batch: The (possibly nested) batch of numpy arrays, e.g. from :func:`create_empty_array`
+        index: The index of the elements, any numpy index of the first axis (an integer, a slice or an array)
+        copy: If ``False``, an integer or a slice ``index`` returns views of the arrays of ``batch``.
+            Otherwise, the elements are copied.
+
+    Returns:
+        The elements of the batch, with the same nesting as ``batch``
+    """
+    if isinstance(batch, dict):
+        return OrderedDict(
+            [(key, get_batch_item(value, index, copy)) for key, value in batch.items()]
+        )
+    elif isinstance(batch, tuple):
+        return tuple(get_batch_item(value, index, copy) for value in batch)
+    item = batch[index]
+    if (
+        copy
+        and isinstance(index, (int, np.integer, slice))
+        and isinstance(item, np.ndarray)
+    ):
+        # Basic indexing returns a view, whereas advanced indexing already copies
+        return item.copy()
+    return item
+
+
+def set_batch_item(batch, index, value):
+    """Writes ``value`` to the ``index``-th element(s) of a (possibly nested) batch of numpy arrays.
+
+    Each array of the batch is written with a single assignment.
+
+    Args:
+        batch: The (possibly nested) batch of numpy arrays, e.g. from :func:`create_empty_array`
+        index: The index of the elements, any numpy index of the first axis (an integer, a slice or an array)
+        value: The elements to write, with the same nesting as ``batch``
+    """
+    if isinstance(batch, dict):
+        for key, subbatch in batch.items():
+            set_batch_item(subbatch, index, value[key])
+    elif isinstance(batch, tuple):
+        for subbatch, subvalue in zip(batch, value):
+            set_batch_item(subbatch, index, subvalue)
+    else:
+        batch[index] = value
+
+
 @singledispatch
 def create_empty_array(
     space: Space, n: int = 1, fn: callable = np.zeros
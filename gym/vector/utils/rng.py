@@ -0,0 +1,188 @@
+"""Utility functions to seed the environments and their spaces from a `SeedSequence`, and to snapshot their RNG states."""
+from collections import OrderedDict
+from functools import singledispatch
+from typing import Any, Dict
+
+import numpy as np
+
+import gym
+from gym.spaces import Dict as DictSpace
+from gym.spaces import Sequence, Space, Tuple
+from gym.utils.seeding import RandomNumberGenerator
+
+__all__ = [
+    "seed_space",
+    "get_space_rng_state",
+    "set_space_rng_state",
+    "seed_env",
+    "get_env_rng_state",
+    "set_env_rng_state",
+]
+
+
+@singledispatch
+def seed_space(space: Space, seed_seq: np.random.SeedSequence):
+    """Seeds the random number generator of ``space`` (and of its subspaces) with a child stream of ``seed_seq``.
+
+    Unlike :meth:`Space.seed`, the subspaces are seeded with independent streams spawned from ``seed_seq``.
+
+    Example::
+
+        >>> space = Tuple((Discrete(2), Box(0, 1, (2,))))
+        >>> seed_space(space, np.random.SeedSequence(42))
+
+    Args:
+        space: The space to seed
+        seed_seq: The seed sequence from which the random number generators are created
+    """
+    space._np_random = RandomNumberGenerator(np.random.PCG64(seed_seq))
+
+
+@seed_space.register(Tuple)
+def _seed_space_tuple(space, seed_seq):
+    seed_seq, *subseed_seqs = seed_seq.spawn(len(space.spaces) + 1)
+    space._np_random = RandomNumberGenerator(np.random.PCG64(seed_seq))
+    for subspace, subseed_seq in zip(space.spaces, subseed_seqs):
+        seed_space(subspace, subseed_seq)
+
+
+@seed_space.register(DictSpace)
+def _seed_space_dict(space, seed_seq):
+    seed_seq, *subseed_seqs = seed_seq.spawn(len(space.spaces) + 1)
+    space._np_random = RandomNumberGenerator(np.random.PCG64(seed_seq))
+    for subspace, subseed_seq in zip(space.spaces.values(), subseed_seqs):
+        seed_space(subspace, subseed_seq)
+
+
+@seed_space.register(Sequence)
+def _seed_space_sequence(space, seed_seq):
+    seed_seq, feature_seed_seq = seed_seq.spawn(2)
+    space._np_random = RandomNumberGenerator(np.random.PCG64(seed_seq))
+    seed_space(space.feature_space, feature_seed_seq)
+
+
+@singledispatch
+def get_space_rng_state(space: Space) -> Any:
+    """Returns the state of the random number generator of ``space`` (and of its subspaces).
+
+    Example::
+
+        >>> state = get_space_rng_state(space)
+        >>> a = space.sample()
+        >>> set_space_rng_state(space, state)
+        >>> b = space.sample()  # equal to `a`
+
+    Args:
+        space: The space whose random number generators are snapshot
+
+    Returns:
+        The state of the bit generator of ``space``, nested with the states of its subspaces for composite spaces
+    """
+    return space.np_random.bit_generator.state
+
+
+@get_space_rng_state.register(Tuple)
+def _get_space_rng_state_tuple(space):
+    return (
+        space.np_random.bit_generator.state,
+        tuple(get_space_rng_state(subspace) for subspace in space.spaces),
+    )
+
+
+@get_space_rng_state.register(DictSpace)
+def _get_space_rng_state_dict(space):
+    return (
+        space.np_random.bit_generator.state,
+        OrderedDict(
+            [
+                (key, get_space_rng_state(subspace))
+                for key, subspace in space.spaces.items()
+            ]
+        ),
+    )
+
+
+@get_space_rng_state.register(Sequence)
+def _get_space_rng_state_sequence(space):
+    return (
+        space.np_random.bit_generator.state,
+        get_space_rng_state(space.feature_space),
+    )
+
+
+@singledispatch
+def set_space_rng_state(space: Space, state: Any):
+    """Restores the state of the random number generator of ``space`` returned by :func:`get_space_rng_state`.
+
+    Args:
+        space: The space whose random number generators are restored
+        state: The state returned by :func:`get_space_rng_state` for the same space
+    """
+    space.np_random.bit_generator.state = state
+
+
+@set_space_rng_state.register(Tuple)
+def _set_space_rng_state_tuple(space, state):
+    space.np_random.bit_generator.state, substates = state
+    for subspace, substate in zip(space.spaces, substates):
+        set_space_rng_state(subspace, substate)
+
+
+@set_space_rng_state.register(DictSpace)
+def _set_space_rng_state_dict(space, state):
+    space.np_random.bit_generator.state, substates = state
+    for key, subspace in space.spaces.items():
+        set_space_rng_state(subspace, substates[key])
+
+
+@set_space_rng_state.register(Sequence)
+def _set_space_rng_state_sequence(space, state):
+    space.np_random.bit_generator.state, feature_state = state
+    set_space_rng_state(space.feature_space, feature_state)
+
+
+def seed_env(env: gym.Env, seed_seq: np.random.SeedSequence):
+    """Seeds the random number generator of ``env`` and of its spaces with independent child streams of ``seed_seq``.
+
+    The environment keeps this generator on its next :meth:`reset` without a ``seed``.
+
+    Args:
+        env: The environment to seed
+        seed_seq: The seed sequence from which the random number generators are spawned
+    """
+    env_seed_seq, observation_seed_seq, action_seed_seq = seed_seq.spawn(3)
+    env.np_random = RandomNumberGenerator(np.random.PCG64(env_seed_seq))
+    seed_space(env.observation_space, observation_seed_seq)
+    seed_space(env.action_space, action_seed_seq)
+
+
+def get_env_rng_state(env: gym.Env) -> Dict[str, Any]:
+    """Returns the states of the random number generators of ``env`` and of its spaces.
+
+    Note:
+        Only :attr:`Env.np_random` is snapshot, not the random number generators created by the environment itself
+        (e.g. by a physics engine or an emulator).
+
+    Args:
+        env: The environment whose random number generators are snapshot
+
+    Returns:
+        A dictionary with the states of ``"np_random"``, ``"observation_space"`` and ``"action_space"``
+    """
+    return {
+        "np_random": env.np_random.bit_generator.state,
+        "observation_space": get_space_rng_state(env.observation_space),
+        "action_space": get_space_rng_state(env.action_space),
+    }
+
+
+def set_env_rng_state(env: gym.Env, state: Dict[str, Any]):
+    """Restores the states of the random number generators of ``env`` returned by :func:`get_env_rng_state`.
+
+    Args:
+        env: The environment whose random number generators are restored
+        state: The states returned by :func:`get_env_rng_state` for the same environment
+    """
+    env.np_random.bit_generator.state = state["np_random"]
+    set_space_rng_state(env.observation_space, state["observation_space"])
+    set_space_rng_state(env.action_space, state["action_space"])
@@ -3,6 +3,7 @@ import multiprocessing as mp
 from collections import OrderedDict
 from ctypes import c_bool
 from functools import singledispatch
+from typing import Dict as TypingDict
 from typing import Union
 
 import numpy as np
@@ -10,7 +11,140 @@ import numpy as np
 from gym.error import CustomSpaceError
 from gym.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Space, Tuple
 
-__all__ = ["create_shared_memory", "read_from_shared_memory", "write_to_shared_memory"]
+try:
+    from multiprocessing import shared_memory as mp_shared_memory
+except ImportError:  # Python < 3.8
+    mp_shared_memory = None
+
+__all__ = [
+    "SharedMemoryArena",
+    "create_shared_memory",
+    "read_from_shared_memory",
+    "write_to_shared_memory",
+    "create_shared_info_memory",
+    "read_info_from_shared_memory",
+]
+
+
+class SharedMemoryArena:
+    """A single contiguous shared memory block, holding many lock-free arrays at aligned offsets.
+
+    The arena is used in place of the multiprocess module (the ``ctx`` argument) by :func:`create_shared_memory`
+    and :func:`create_shared_info_memory`: every call to :meth:`Array` reserves a leaf array in the arena.
+    Once all the arrays are reserved, :meth:`allocate` creates the page-aligned
+    :class:`multiprocessing.shared_memory.SharedMemory` block. The leaf arrays can then be pickled to
+    any process (including with the ``spawn`` and ``forkserver`` contexts), which attaches to the block by name.
+
+    Example::
+
+        >>> from gym.spaces import Box, Dict
+        >>> space = Dict({"position": Box(0, 1, (3,)), "velocity": Box(0, 1, (2,))})
+        >>> arena = SharedMemoryArena()
+        >>> shared_memory = create_shared_memory(space, n=4, ctx=arena)
+        >>> arena.allocate()
+        >>> read_from_shared_memory(space, shared_memory, n=4)["position"].shape
+        (4, 3)
+        >>> arena.unlink()
+    """
+
+    alignment = 64
+
+    def __init__(self):
+        """Creates an empty arena, arrays must be reserved with :meth:`Array` before calling :meth:`allocate`."""
+        if mp_shared_memory is None:
+            raise RuntimeError(
+                "`SharedMemoryArena` requires `multiprocessing.shared_memory` (Python 3.8 or later)."
+            )
+        self.arrays = []
+        self.nbytes = 0
+        self._shm = None
+
+    def Array(self, typecode, size: int) -> "SharedMemoryArenaArray":
+        """Reserves an array in the arena, with the same arguments as :func:`multiprocessing.Array`."""
+        if self._shm is not None:
+            raise RuntimeError("Cannot reserve an array in an allocated arena.")
+        typecode = "?" if typecode is c_bool else typecode
+        array = SharedMemoryArenaArray(typecode, size, self.nbytes)
+        self.arrays.append(array)
+        nbytes = size * np.dtype(typecode).itemsize
+        self.nbytes += -(-nbytes // self.alignment) * self.alignment
+        return array
+
+    def allocate(self):
+        """Creates the shared memory block holding all the reserved arrays."""
+        self._shm = _SharedMemory(create=True, size=max(self.nbytes, 1))
+        for array in self.arrays:
+            array.attach(self._shm)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block, to attach to it from other processes."""
+        return self._shm.name
+
+    def unlink(self):
+        """Releases the shared memory block, its memory is freed once no process uses it anymore."""
+        if self._shm is not None:
+            self._shm.unlink()
+            try:
+                self._shm.close()
+            except BufferError:
+                # Some numpy arrays still point to the shared memory
+                pass
+            self._shm = None
+
+
+class SharedMemoryArenaArray:
+    """An array of a :class:`SharedMemoryArena`, with the interface of :func:`multiprocessing.Array` used by gym."""
+
+    def __init__(self, typecode: str, size: int, offset: int):
+        """Reserves an array of ``size`` elements with type ``typecode``, at ``offset`` bytes in the arena."""
+        self.typecode = typecode
+        self.size = size
+        self.offset = offset
+        self.shm_name = None
+        self._shm = None
+
+    def attach(self, shm):
+        """Attaches the array to the shared memory block of the arena."""
+        self.shm_name = shm.name
+        self._shm = shm
+
+    def get_obj(self) -> memoryview:
+        """Returns the memory of the array."""
+        if self._shm is None:
+            self._shm = _attach_shared_memory(self.shm_name)
+        nbytes = self.size * np.dtype(self.typecode).itemsize
+        return self._shm.buf[self.offset : self.offset + nbytes].cast(self.typecode)
+
+    def __len__(self) -> int:
+        """The number of elements of the array."""
+        return self.size
+
+    def __getstate__(self):
+        """Only pickles the name of the shared memory block, such that other processes attach to it."""
+        state = self.__dict__.copy()
+        state["_shm"] = None
+        return state
+
+
+if mp_shared_memory is not None:
+
+    class _SharedMemory(mp_shared_memory.SharedMemory):
+        def __del__(self):
+            # Numpy arrays that point to the shared memory can outlive this object
+            try:
+                self.close()
+            except (BufferError, OSError):
+                pass
+
+
+_attached_shared_memory = {}
+
+
+def _attach_shared_memory(name: str):
+    if name not in _attached_shared_memory:
+        _attached_shared_memory[name] = _SharedMemory(name=name)
+    return _attached_shared_memory[name]
 
 
 @singledispatch
@@ -24,7 +158,7 @@ def create_shared_memory(
     Args:
         space: Observation space of a single environment in the vectorized environment.
         n: Number of environments in the vectorized environment (i.e. the number of processes).
-        ctx: The multiprocess module
+        ctx: The multiprocess module, or a :class:`SharedMemoryArena` to reserve the arrays in
 
     Returns:
         shared_memory for the shared object across processes.
@@ -180,3 +314,67 @@ def _write_tuple_to_shared_memory(space, index, values, shared_memory):
 def _write_dict_to_shared_memory(space, index, values, shared_memory):
     for key, subspace in space.spaces.items():
         write_to_shared_memory(subspace, index, values[key], shared_memory[key])
+
+
+# The numpy type characters of the info values, which are also typecodes of `multiprocessing.Array` (or `c_bool`)
+_INFO_TYPECODES = "?bBhHiIlLqQfd"
+
+
+def create_shared_info_memory(
+    info_dtypes: TypingDict[str, np.dtype], n: int = 1, ctx=mp
+) -> OrderedDict:
+    """Create a shared memory object for numeric info keys, to be shared across processes.
+
+    Each info key is given a typed array of values and a boolean array (the mask) indicating whether
+    or not each environment has this key in its info, such that the infos skip pickling entirely.
+
+    Args:
+        info_dtypes: The numeric (or boolean) data type of each info key declared up front.
+        n: Number of environments in the vectorized environment (i.e. the number of processes).
+        ctx: The multiprocess module, or a :class:`SharedMemoryArena` to reserve the arrays in
+
+    Returns:
+        shared_memory for the shared info keys across processes.
+
+    Raises:
+        ValueError: The data type of an info key is not boolean, nor an integer or float type with a ctypes typecode
+            (e.g. ``float16`` or ``complex64``)
+    """
+    info_dtypes = OrderedDict(
+        [(key, np.dtype(dtype)) for key, dtype in info_dtypes.items()]
+    )
+    for key, dtype in info_dtypes.items():
+        if dtype.char not in _INFO_TYPECODES:
+            raise ValueError(
+                f"Expected the data type of info key `{key}` to be boolean, or an integer or float type with a ctypes "
+                f"typecode ({', '.join(dict.fromkeys(np.dtype(char).name for char in _INFO_TYPECODES))}), actual data type: {dtype}"
+            )
+
+    shared_memory = OrderedDict()
+    for key, dtype in info_dtypes.items():
+        typecode = c_bool if dtype.char == "?" else dtype.char
+        shared_memory[key] = (ctx.Array(typecode, n), ctx.Array(c_bool, n))
+    return shared_memory
+
+
+def read_info_from_shared_memory(shared_memory: OrderedDict) -> OrderedDict:
+    """Read the batch of info values and masks from shared memory as numpy arrays.
+
+    ..notes::
+        Similarly to `read_from_shared_memory`, the numpy arrays share the memory of `shared_memory`.
+
+    Args:
+        shared_memory: Shared object across processes, created with `create_shared_info_memory`.
+
+    Returns:
+        Ordered dictionary mapping each info key to its batch of values and its boolean mask.
+    """
+    return OrderedDict(
+        [
+            (
+                key,
+                (np.asarray(values.get_obj()), np.asarray(mask.get_obj())),
+            )
+            for key, (values, mask) in shared_memory.items()
+        ]
+    )
@@ -1,13 +1,35 @@
 """Base class for vectorized environments."""
-from typing import Any, List, Optional, Tuple, Union
+import json
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 import gym
+from gym.vector.utils.numpy_utils import concatenate, create_empty_array
+from gym.vector.utils.rng import get_space_rng_state, seed_space, set_space_rng_state
 from gym.vector.utils.spaces import batch_space
 
 __all__ = ["VectorEnv"]
 
+# The autoreset modes of the sub-environments:
+# - "same-step": a terminated or truncated sub-environment is reset within the same step, and its terminal
+#   observation is returned in `info["final_observation"]`.
+# - "next-step": a terminated or truncated sub-environment is reset on the following step (ignoring its action),
+#   and its terminal observation is returned in the batch of observations.
+# - "disabled": the sub-environments are never reset automatically, but with `reset(indices=...)`.
+AUTORESET_MODES = ("same-step", "next-step", "disabled")
+
+# The spaces of a vectorized environment whose random number generators are seeded by `spawn_seeds`
+_RNG_SPACE_NAMES = (
+    "observation_space",
+    "action_space",
+    "single_observation_space",
+    "single_action_space",
+)
+
 
 class VectorEnv(gym.Env):
     """Base class for vectorized environments. Runs multiple independent copies of the same environment in parallel.
@@ -22,6 +44,12 @@ class VectorEnv(gym.Env):
         In other words, a vector of multiple different environments is not supported.
     """
 
+    # The timing counters, disabled by default (see `enable_stats`)
+    _stats: Optional[Dict[str, List[float]]] = None
+    _stats_file: Optional[str] = None
+    _stats_interval: float = 60.0
+    _stats_last_dump: float = 0.0
+
     def __init__(
         self,
         num_envs: int,
@@ -42,6 +70,7 @@ class VectorEnv(gym.Env):
 
         self.closed = False
         self.viewer = None
+        self._info_buffers = {}
 
         # The observation and action spaces of a single environment are
         # kept in separate properties
@@ -52,6 +81,7 @@ class VectorEnv(gym.Env):
         self,
         seed: Optional[Union[int, List[int]]] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ):
         """Reset the sub-environments asynchronously.
 
@@ -61,6 +91,7 @@ class VectorEnv(gym.Env):
         Args:
             seed: The reset seed
             options: Reset options
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset.
         """
         pass
 
@@ -68,6 +99,7 @@ class VectorEnv(gym.Env):
         self,
         seed: Optional[Union[int, List[int]]] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ):
         """Retrieves the results of a :meth:`reset_async` call.
 
@@ -76,6 +108,7 @@ class VectorEnv(gym.Env):
         Args:
             seed: The reset seed
             options: Reset options
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset.
 
         Returns:
             The results from :meth:`reset_async`
@@ -90,18 +123,25 @@ class VectorEnv(gym.Env):
         *,
         seed: Optional[Union[int, List[int]]] = None,
         options: Optional[dict] = None,
+        indices: Optional[Sequence[int]] = None,
     ):
-        """Reset all parallel environments and return a batch of initial observations.
+        """Reset all parallel environments (or the ones in ``indices``) and return a batch of initial observations.
 
         Args:
-            seed: The environment reset seeds
+            seed: The environment reset seeds. If an int, the sub-environment ``i`` is reset with the seed ``seed + i``.
             options: If to return the options
+            indices: The indices of the sub-environments to reset. If ``None``, all the sub-environments are reset.
+                Otherwise, only the rows ``indices`` of the batch of observations are updated, the infos only
+                contain the reset sub-environments, and ``seed`` (if a list) has one seed for each index.
 
         Returns:
             A batch of observations from the vectorized environment.
         """
-        self.reset_async(seed=seed, options=options)
-        return self.reset_wait(seed=seed, options=options)
+        kwargs = {"seed": seed, "options": options}
+        if indices is not None:
+            kwargs["indices"] = indices
+        self.reset_async(**kwargs)
+        return self.reset_wait(**kwargs)
 
     def step_async(self, actions):
         """Asynchronously performs steps in the sub-environments.
@@ -134,7 +174,59 @@ class VectorEnv(gym.Env):
             Batch of (observations, rewards, terminated, truncated, infos) or (observations, rewards, dones, infos)
         """
         self.step_async(actions)
-        return self.step_wait()
+        results = self.step_wait()
+        # The counters are held by the unwrapped vector environment, also when stepping through a wrapper
+        env = self.unwrapped
+        if (
+            env._stats_file is not None
+            and time.perf_counter() - env._stats_last_dump >= env._stats_interval
+        ):
+            env._dump_stats()
+        return results
+
+    def enable_stats(self, stats_file: Optional[str] = None, interval: float = 60.0):
+        """Enables the timing counters of the vectorized environment, returned by :meth:`get_stats`.
+
+        The counters accumulate the number of calls and the total time (in seconds) spent in the stages of
+        :meth:`reset` and :meth:`step`, e.g. stepping the environments, sending and receiving through the pipes,
+        batching the observations and the infos. Calling this method again resets the counters.
+
+        Args:
+            stats_file: If not ``None``, the path of a JSON lines file to which :meth:`get_stats` is appended
+                (with a ``"time"`` key) every ``interval`` seconds, checked at the end of :meth:`step`.
+            interval: The number of seconds between two dumps to ``stats_file``.
+        """
+        self._stats = OrderedDict()
+        self._stats_file, self._stats_interval = stats_file, interval
+        self._stats_last_dump = time.perf_counter()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the timing counters enabled by :meth:`enable_stats`, empty if they are disabled.
+
+        Returns:
+            A dictionary mapping the name of each stage to its number of calls ``"count"``, total time ``"total"``
+            and mean time ``"mean"`` (in seconds)
+        """
+        if self._stats is None:
+            return {}
+        return OrderedDict(
+            [
+                (name, _summarize_counter(counter))
+                for name, counter in self._stats.items()
+            ]
+        )
+
+    def _timer(self, name: str):
+        """Returns a context manager adding the time spent in its block to the counter ``name``, if enabled."""
+        if self._stats is None:
+            return _NULL_TIMER
+        return _Timer(self._stats, name)
+
+    def _dump_stats(self):
+        """Appends the timing counters to the JSON lines :attr:`_stats_file`."""
+        self._stats_last_dump = time.perf_counter()
+        with open(self._stats_file, "a") as file:
+            file.write(json.dumps({"time": time.time(), **self.get_stats()}) + "\n")
 
     def call_async(self, name, *args, **kwargs):
         """Calls a method name for each parallel environment asynchronously."""
@@ -167,6 +259,28 @@ class VectorEnv(gym.Env):
         """
         return self.call(name)
 
+    def call_batch(self, name: str, result_space: gym.Space, *args, **kwargs):
+        """Call a method, or get a property, from each parallel environment, and batch the results.
+
+        The results must be in the declared ``result_space``, e.g. ``Box(0, 255, (H, W, 3), np.uint8)``
+        for the ``"rgb_array"`` renders, such that they are batched in a single array (see :func:`concatenate`).
+
+        Args:
+            name (str): Name of the method or property to call.
+            result_space: The space of the result of a single environment.
+            *args: Arguments to apply to the method call.
+            **kwargs: Keyword arguments to apply to the method call.
+
+        Returns:
+            The batch of the results of the individual calls, with the layout of :func:`create_empty_array`
+        """
+        results = self.call(name, *args, **kwargs)
+        return concatenate(
+            result_space,
+            results,
+            create_empty_array(result_space, n=self.num_envs, fn=np.zeros),
+        )
+
     def set_attr(self, name: str, values: Union[list, tuple, object]):
         """Set a property in each sub-environment.
 
@@ -177,6 +291,138 @@ class VectorEnv(gym.Env):
                 is set for all environments.
         """
 
+    def spawn_seeds(
+        self, seed: Optional[Union[int, np.random.SeedSequence]] = None
+    ) -> np.random.SeedSequence:
+        """Seeds the sub-environments and their spaces with independent streams spawned from a single seed.
+
+        Unlike ``reset(seed=seed)``, which seeds the sub-environment ``i`` with ``seed + i`` (and leaves the spaces
+        seeded from the OS entropy), the child streams of the sub-environments, of their spaces and of the spaces of
+        the vectorized environment are all spawned at once with :meth:`numpy.random.SeedSequence.spawn`.
+        The sub-environments keep these streams on their next :meth:`reset` without a ``seed``.
+
+        Example::
+
+            >>> envs = gym.vector.make("CartPole-v1", num_envs=3)
+            >>> seed_seq = envs.spawn_seeds(42)
+            >>> observations, infos = envs.reset()
+
+        Args:
+            seed: The root seed (or seed sequence). If ``None``, fresh entropy is used, see ``seed_seq.entropy``.
+
+        Returns:
+            The root seed sequence, whose ``entropy`` reproduces the streams
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        seed_seqs = seed.spawn(self.num_envs + 1)
+        for space, seed_seq in zip(self._rng_spaces(), seed_seqs[-1].spawn(4)):
+            seed_space(space, seed_seq)
+        self._seed_envs(seed_seqs[:-1])
+        return seed
+
+    def get_rng_states(self) -> Dict[str, Any]:
+        """Returns the states of the random number generators of the sub-environments and of the spaces.
+
+        The states are restored by :meth:`set_rng_states`, e.g. to resume a run exactly from a checkpoint.
+
+        Returns:
+            A dictionary with the states of the spaces of the vectorized environment, and the list of the states
+            of the sub-environments (see :func:`get_env_rng_state`) in ``"envs"``
+        """
+        states = self._get_space_rng_states()
+        states["envs"] = self._get_env_rng_states()
+        return states
+
+    def set_rng_states(self, states: Dict[str, Any]):
+        """Restores the states of the random number generators returned by :meth:`get_rng_states`.
+
+        Args:
+            states: The states returned by :meth:`get_rng_states` for the same vectorized environment
+        """
+        self._set_space_rng_states(states)
+        self._set_env_rng_states(states["envs"])
+
+    def get_state(self) -> bytes:
+        """Returns a snapshot of all the sub-environments mid-episode, restored by :meth:`set_state`.
+
+        The snapshot of each sub-environment (see :meth:`Env.save_state`) is serialized with the states of its random
+        number generators and its pending ``"next-step"`` autoreset. Restoring the snapshot, e.g. after a restart,
+        replaces replaying the actions from the start of the episodes. The observations are not included, keep the
+        last batch of observations returned with the snapshot.
+
+        Returns:
+            The snapshot, as a single pickled buffer
+        """
+        state = self._get_space_rng_states()
+        state["envs"] = self._get_env_states()
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def set_state(self, state: bytes):
+        """Restores all the sub-environments from a snapshot returned by :meth:`get_state`.
+
+        Args:
+            state: The snapshot returned by :meth:`get_state`, for the same number of sub-environments
+        """
+        state = pickle.loads(state)
+        self._set_space_rng_states(state)
+        self._set_env_states(state["envs"])
+
+    def truncate_envs(self, indices: Sequence[int]):
+        """Truncates the sub-environments ``indices`` on their next step.
+
+        The next step still steps them, but returns ``truncated=True`` for them, such that they are reset following
+        :attr:`autoreset_mode` like the episodes ended by the sub-environments themselves. This is used by
+        :class:`gym.vector.wrappers.TimeLimit`.
+
+        Args:
+            indices: The indices of the sub-environments to truncate
+        """
+        raise NotImplementedError
+
+    def _rng_spaces(self) -> Tuple[gym.Space, ...]:
+        """Returns the spaces of the vectorized environment, in the order of ``_RNG_SPACE_NAMES``."""
+        return (
+            self.observation_space,
+            self.action_space,
+            self.single_observation_space,
+            self.single_action_space,
+        )
+
+    def _get_space_rng_states(self) -> Dict[str, Any]:
+        """Returns the states of the random number generators of the spaces, keyed by ``_RNG_SPACE_NAMES``."""
+        return OrderedDict(
+            [
+                (name, get_space_rng_state(space))
+                for name, space in zip(_RNG_SPACE_NAMES, self._rng_spaces())
+            ]
+        )
+
+    def _set_space_rng_states(self, states: Dict[str, Any]):
+        """Restores the states of the random number generators of the spaces."""
+        for name, space in zip(_RNG_SPACE_NAMES, self._rng_spaces()):
+            set_space_rng_state(space, states[name])
+
+    def _seed_envs(self, seed_seqs: List[np.random.SeedSequence]):
+        """Seeds each sub-environment with its seed sequence, see :func:`seed_env`."""
+        raise NotImplementedError
+
+    def _get_env_rng_states(self) -> List[Dict[str, Any]]:
+        """Returns the states of the random number generators of the sub-environments."""
+        raise NotImplementedError
+
+    def _set_env_rng_states(self, states: List[Dict[str, Any]]):
+        """Restores the states of the random number generators of the sub-environments."""
+        raise NotImplementedError
+
+    def _get_env_states(self) -> List[Any]:
+        """Returns the serialized snapshots of the sub-environments, see :func:`dump_env_state`."""
+        raise NotImplementedError
+
+    def _set_env_states(self, states: List[Any]):
+        """Restores the sub-environments from their serialized snapshots."""
+        raise NotImplementedError
+
     def close_extras(self, **kwargs):
         """Clean up the extra resources e.g. beyond what's in this base class."""
         pass
@@ -232,6 +478,58 @@ class VectorEnv(gym.Env):
             infos[k], infos[f"_{k}"] = info_array, array_mask
         return infos
 
+    def _batch_infos(self, infos: Union[Sequence[dict], Dict[int, dict]]) -> dict:
+        """Batch the infos of the sub-environments into the info dictionary of the vectorized environment.
+
+        This is equivalent to calling :meth:`_add_info` for every sub-environment, but the arrays of each `key`
+        are filled column-wise, with a single assignment for all the sub-environments with this `key`.
+        The type of each `key` is learned the first time it is seen, and its `key` and `_key` arrays are
+        allocated once and reused in the following steps. If ``self.copy`` is ``False``, the reused arrays
+        are returned directly, and are overwritten by the next call.
+
+        Args:
+            infos: the infos coming from the sub-environments, either a sequence with the info of every
+                sub-environment or a dictionary mapping the index of a sub-environment to its info.
+
+        Returns:
+            infos (dict): the infos of the vectorized environment
+        """
+        items = infos.items() if isinstance(infos, dict) else enumerate(infos)
+        env_infos = {env_num: info for env_num, info in items if info}
+        keys = {}
+        for info in env_infos.values():
+            keys.update(dict.fromkeys(info))
+
+        copy = getattr(self, "copy", True)
+        batched_infos = {}
+        for k in keys:
+            env_nums = [env_num for env_num, info in env_infos.items() if k in info]
+            values = [env_infos[env_num][k] for env_num in env_nums]
+
+            dtype = type(values[0])
+            buffers = self._info_buffers.get(k)
+            if buffers is None or buffers[2] is not dtype:
+                buffers = self._info_buffers[k] = (
+                    *self._init_info_arrays(dtype),
+                    dtype,
+                )
+            info_array, array_mask, _ = buffers
+
+            array_mask[:] = False
+            array_mask[env_nums] = True
+            if info_array.dtype == object:
+                info_array[:] = None
+                for env_num, value in zip(env_nums, values):
+                    info_array[env_num] = value
+            else:
+                info_array[:] = 0
+                info_array[env_nums] = values
+
+            if copy:
+                info_array, array_mask = np.copy(info_array), np.copy(array_mask)
+            batched_infos[k], batched_infos[f"_{k}"] = info_array, array_mask
+        return batched_infos
+
     def _init_info_arrays(self, dtype: type) -> Tuple[np.ndarray, np.ndarray]:
         """Initialize the info array.
 
@@ -297,11 +595,11 @@ class VectorEnvWrapper(VectorEnv):
     def reset_wait(self, **kwargs):
         return self.env.reset_wait(**kwargs)
 
-    def step_async(self, actions):
-        return self.env.step_async(actions)
+    def step_async(self, actions, **kwargs):
+        return self.env.step_async(actions, **kwargs)
 
-    def step_wait(self):
-        return self.env.step_wait()
+    def step_wait(self, **kwargs):
+        return self.env.step_wait(**kwargs)
 
     def close(self, **kwargs):
         return self.env.close(**kwargs)
@@ -312,9 +610,36 @@ class VectorEnvWrapper(VectorEnv):
     def call(self, name, *args, **kwargs):
         return self.env.call(name, *args, **kwargs)
 
+    def call_batch(self, name, result_space, *args, **kwargs):
+        return self.env.call_batch(name, result_space, *args, **kwargs)
+
+    def enable_stats(self, stats_file: Optional[str] = None, interval: float = 60.0):
+        return self.env.enable_stats(stats_file=stats_file, interval=interval)
+
+    def get_stats(self):
+        return self.env.get_stats()
+
     def set_attr(self, name, values):
         return self.env.set_attr(name, values)
 
+    def spawn_seeds(self, seed=None):
+        return self.env.spawn_seeds(seed)
+
+    def get_rng_states(self):
+        return self.env.get_rng_states()
+
+    def set_rng_states(self, states):
+        return self.env.set_rng_states(states)
+
+    def get_state(self):
+        return self.env.get_state()
+
+    def set_state(self, state):
+        return self.env.set_state(state)
+
+    def truncate_envs(self, indices):
+        return self.env.truncate_envs(indices)
+
     # implicitly forward all other methods and attributes to self.env
     def __getattr__(self, name):
         if name.startswith("_"):
@@ -330,3 +655,41 @@ class VectorEnvWrapper(VectorEnv):
 
     def __del__(self):
         self.env.__del__()
+
+
+class _Timer:
+    """Adds the time spent in the block to the counter ``name`` (its number of calls and total time)."""
+
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats: Dict[str, List[float]], name: str):
+        self.stats, self.name = stats, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        counter = self.stats.setdefault(self.name, [0, 0.0])
+        counter[0] += 1
+        counter[1] += time.perf_counter() - self.start
+
+
+class _NullTimer:
+    """A timer that does nothing, used when the timing counters are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def _summarize_counter(counter: List[float]) -> Dict[str, float]:
+    """Returns the number of calls, total and mean time of a counter."""
+    count, total = counter
+    return {"count": count, "total": total, "mean": total / count if count else 0.0}
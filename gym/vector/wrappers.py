@@ -0,0 +1,315 @@
+"""Wrappers operating once on the batched arrays of a vector environment, rather than on each sub-environment."""
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+import gym
+from gym import spaces
+from gym.vector.utils import (
+    batch_space,
+    concatenate,
+    create_empty_array,
+    get_batch_item,
+)
+from gym.vector.vector_env import VectorEnv, VectorEnvWrapper
+from gym.wrappers.normalize import RunningMeanStd
+
+__all__ = [
+    "ClipAction",
+    "NormalizeObservation",
+    "NormalizeReward",
+    "RescaleAction",
+    "TimeLimit",
+    "TransformObservation",
+]
+
+
+class TransformObservation(VectorEnvWrapper):
+    """Transforms the batch of observations via an arbitrary function :attr:`f`, called once per step.
+
+    The terminal observations in ``info["final_observation"]`` are also transformed, each as a batch of one.
+
+    Example:
+        >>> envs = gym.vector.make("CartPole-v1", num_envs=3)
+        >>> envs = TransformObservation(envs, lambda obs: obs * 2)
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        f: Callable[[Any], Any],
+        observation_space: Optional[gym.Space] = None,
+    ):
+        """Initializes the :class:`TransformObservation` wrapper with a vector environment and a batched transform.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            f: A function that transforms a batch of observations
+            observation_space: The observation space of a single environment after the transform.
+                If ``None``, the observation space of ``env`` is kept.
+        """
+        super().__init__(env)
+        assert callable(f)
+        self.f = f
+        if observation_space is not None:
+            self.single_observation_space = observation_space
+            self.observation_space = batch_space(observation_space, n=env.num_envs)
+
+    def reset_wait(self, **kwargs):
+        """Resets the vector environment and transforms the batch of observations."""
+        observations, infos = self.env.reset_wait(**kwargs)
+        return self.f(observations), infos
+
+    def step_wait(self, **kwargs):
+        """Steps the vector environment and transforms the batch of observations and the terminal observations."""
+        observations, rewards, terminateds, truncateds, infos = self.env.step_wait(
+            **kwargs
+        )
+        _transform_final_observations(infos, self.f, self.env.single_observation_space)
+        return self.f(observations), rewards, terminateds, truncateds, infos
+
+
+class NormalizeObservation(VectorEnvWrapper):
+    """Normalizes the observations such that each coordinate is centered with unit variance.
+
+    The running mean and variance are shared by all the sub-environments, and updated once per step with the whole
+    ``(num_envs, *obs_shape)`` batch of observations.
+
+    Note:
+        The normalization depends on past trajectories and observations will not be normalized correctly if the wrapper was
+        newly instantiated or the policy was changed recently.
+    """
+
+    def __init__(self, env: VectorEnv, epsilon: float = 1e-8):
+        """Initializes the running mean and variance of the observations.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            epsilon: A stability parameter that is used when scaling the observations.
+        """
+        super().__init__(env)
+        self.obs_rms = RunningMeanStd(shape=env.single_observation_space.shape)
+        self.epsilon = epsilon
+
+    def reset_wait(self, **kwargs):
+        """Resets the vector environment, and normalizes the observations (updating the statistics with the reset ones)."""
+        observations, infos = self.env.reset_wait(**kwargs)
+        indices = kwargs.get("indices")
+        self.obs_rms.update(
+            observations if indices is None else observations[np.asarray(indices)]
+        )
+        return self._normalize(observations), infos
+
+    def step_wait(self, **kwargs):
+        """Steps the vector environment, and normalizes the observations and the terminal observations."""
+        observations, rewards, terminateds, truncateds, infos = self.env.step_wait(
+            **kwargs
+        )
+        self.obs_rms.update(observations)
+        _transform_final_observations(
+            infos, self._normalize, self.env.single_observation_space
+        )
+        return self._normalize(observations), rewards, terminateds, truncateds, infos
+
+    def _normalize(self, observations):
+        """Normalizes a batch of observations with the running mean and variance, without updating them."""
+        return (observations - self.obs_rms.mean) / np.sqrt(
+            self.obs_rms.var + self.epsilon
+        )
+
+
+class NormalizeReward(VectorEnvWrapper):
+    r"""Normalizes the rewards such that their exponential moving average has a fixed variance.
+
+    The exponential moving average will have variance :math:`(1 - \gamma)^2`. The running variance of the returns
+    is shared by all the sub-environments, and updated once per step with the batch of returns.
+
+    Note:
+        The scaling depends on past trajectories and rewards will not be scaled correctly if the wrapper was newly
+        instantiated or the policy was changed recently.
+    """
+
+    def __init__(self, env: VectorEnv, gamma: float = 0.99, epsilon: float = 1e-8):
+        """Initializes the running variance and the discounted returns of the sub-environments.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            gamma: The discount factor that is used in the exponential moving average.
+            epsilon: A stability parameter
+        """
+        super().__init__(env)
+        self.return_rms = RunningMeanStd(shape=())
+        self.returns = np.zeros(env.num_envs)
+        self.gamma = gamma
+        self.epsilon = epsilon
+
+    def step_wait(self, **kwargs):
+        """Steps the vector environment, normalizing the batch of rewards."""
+        observations, rewards, terminateds, truncateds, infos = self.env.step_wait(
+            **kwargs
+        )
+        self.returns = self.returns * self.gamma + rewards
+        self.return_rms.update(self.returns)
+        rewards = rewards / np.sqrt(self.return_rms.var + self.epsilon)
+        self.returns[np.logical_or(terminateds, truncateds)] = 0.0
+        return observations, rewards, terminateds, truncateds, infos
+
+
+class ClipAction(VectorEnvWrapper):
+    """Clips the batch of continuous actions within the bounds of the :class:`Box` action space, in one operation.
+
+    Example:
+        >>> envs = gym.vector.make("BipedalWalker-v3", num_envs=3)
+        >>> envs = ClipAction(envs)
+        >>> envs.step(np.full((3, 4), 5.0))
+        # Executes the actions np.ones((3, 4)) in the sub-environments
+    """
+
+    def __init__(self, env: VectorEnv):
+        """A wrapper for clipping the batch of continuous actions within the valid bounds.
+
+        Args:
+            env: The vector environment to apply the wrapper
+        """
+        assert isinstance(env.single_action_space, spaces.Box)
+        super().__init__(env)
+
+    def step_async(self, actions, **kwargs):
+        """Clips the batch of actions and sends it to the vector environment."""
+        return self.env.step_async(
+            np.clip(
+                actions, self.single_action_space.low, self.single_action_space.high
+            ),
+            **kwargs,
+        )
+
+
+class RescaleAction(VectorEnvWrapper):
+    """Affinely rescales the continuous actions of the sub-environments from the range [min_action, max_action].
+
+    The rescaling is applied once to the whole batch of actions. The base environment must have a :class:`Box`
+    action space.
+
+    Example:
+        >>> envs = gym.vector.make("BipedalWalker-v3", num_envs=3)
+        >>> envs = RescaleAction(envs, min_action=0.0, max_action=1.0)
+        >>> envs.single_action_space
+        Box(0.0, 1.0, (4,), float32)
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        min_action: Union[float, int, np.ndarray],
+        max_action: Union[float, int, np.ndarray],
+    ):
+        """Initializes the :class:`RescaleAction` wrapper.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            min_action: The min values for each action of a sub-environment. This may be a numpy array or a scalar.
+            max_action: The max values for each action of a sub-environment. This may be a numpy array or a scalar.
+        """
+        single_action_space = env.single_action_space
+        assert isinstance(
+            single_action_space, spaces.Box
+        ), f"expected Box action space, got {type(single_action_space)}"
+        assert np.less_equal(min_action, max_action).all(), (min_action, max_action)
+        super().__init__(env)
+        self.min_action = (
+            np.zeros(single_action_space.shape, dtype=single_action_space.dtype)
+            + min_action
+        )
+        self.max_action = (
+            np.zeros(single_action_space.shape, dtype=single_action_space.dtype)
+            + max_action
+        )
+        self.single_action_space = spaces.Box(
+            low=min_action,
+            high=max_action,
+            shape=single_action_space.shape,
+            dtype=single_action_space.dtype,
+        )
+        self.action_space = batch_space(self.single_action_space, n=env.num_envs)
+
+    def step_async(self, actions, **kwargs):
+        """Rescales the batch of actions to the action space of the base environment, and sends it."""
+        low = self.env.single_action_space.low
+        high = self.env.single_action_space.high
+        actions = low + (high - low) * (
+            (actions - self.min_action) / (self.max_action - self.min_action)
+        )
+        return self.env.step_async(np.clip(actions, low, high), **kwargs)
+
+
+class TimeLimit(VectorEnvWrapper):
+    """Truncates the sub-environments after ``max_episode_steps`` steps, counted with one array of elapsed steps.
+
+    Before each step, the sub-environments reaching ``max_episode_steps`` with it are passed to
+    :meth:`VectorEnv.truncate_envs`, such that the step returns them as truncated and the vector environment resets
+    them with its own autoreset, following its ``autoreset_mode``: with ``"same-step"``, within the same step (adding
+    their terminal observation to ``info["final_observation"]``), and with ``"next-step"``, on the following step
+    (with a zero reward).
+    """
+
+    def __init__(self, env: VectorEnv, max_episode_steps: int):
+        """Initializes the :class:`TimeLimit` wrapper with a vector environment and the number of steps after which truncation will occur.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            max_episode_steps: The number of steps after which the sub-environments are truncated
+        """
+        super().__init__(env)
+        self.max_episode_steps = max_episode_steps
+        self.autoreset_mode = getattr(env, "autoreset_mode", "same-step")
+        self._elapsed_steps = np.zeros(env.num_envs, dtype=np.int64)
+        # With the "next-step" autoreset mode, the sub-environments ended on the last step, reset by the next step
+        self._autoreset_envs = np.zeros(env.num_envs, dtype=np.bool_)
+
+    def reset_wait(self, **kwargs):
+        """Resets the vector environment, and the elapsed steps of the reset sub-environments."""
+        indices = kwargs.get("indices")
+        indices = slice(None) if indices is None else np.asarray(indices)
+        self._elapsed_steps[indices] = 0
+        self._autoreset_envs[indices] = False
+        return self.env.reset_wait(**kwargs)
+
+    def step_async(self, actions):
+        """Truncates the sub-environments reaching ``max_episode_steps`` with this step, and steps the vector environment."""
+        # The step resetting the sub-environments with the "next-step" autoreset mode does not count
+        limits = ~self._autoreset_envs & (
+            self._elapsed_steps + 1 >= self.max_episode_steps
+        )
+        if np.any(limits):
+            self.env.truncate_envs(np.flatnonzero(limits))
+        return self.env.step_async(actions)
+
+    def step_wait(self, **kwargs):
+        """Steps the vector environment, and updates the elapsed steps of the sub-environments."""
+        observations, rewards, terminateds, truncateds, infos = self.env.step_wait(
+            **kwargs
+        )
+        self._elapsed_steps += 1
+        dones = np.logical_or(terminateds, truncateds)
+        if self.autoreset_mode == "same-step":
+            self._elapsed_steps[dones] = 0
+        elif self.autoreset_mode == "next-step":
+            # The sub-environments ended on the last step were reset by this step
+            self._elapsed_steps[self._autoreset_envs] = 0
+            self._autoreset_envs = dones
+        return observations, rewards, terminateds, truncateds, infos
+
+
+def _transform_final_observations(infos: dict, f: Callable, single_space: gym.Space):
+    """Applies the batched transform ``f`` to each terminal observation in ``infos``, as a batch of one."""
+    if "final_observation" not in infos:
+        return
+    final_observations = np.copy(infos["final_observation"])
+    for i in np.flatnonzero(infos["_final_observation"]):
+        batch = concatenate(
+            single_space,
+            [final_observations[i]],
+            create_empty_array(single_space, n=1, fn=np.zeros),
+        )
+        final_observations[i] = get_batch_item(f(batch), 0)
+    infos["final_observation"] = final_observations
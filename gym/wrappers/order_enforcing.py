@@ -41,6 +41,11 @@ class OrderEnforcing(gym.Wrapper):
         self._has_reset = True
         return self.env.reset(**kwargs)
 
+    def load_state(self, state):
+        """Restores the environment from a snapshot, which counts as a reset."""
+        self._has_reset = True
+        return self.env.load_state(state)
+
     def render(self, *args, **kwargs):
         """Renders the environment with `kwargs`."""
         if not self._disable_render_order_enforcing and not self._has_reset:
@@ -66,3 +66,12 @@ class TimeLimit(gym.Wrapper):
         """
         self._elapsed_steps = 0
         return self.env.reset(**kwargs)
+
+    def save_state(self):
+        """Returns a snapshot of the environment, with the number of steps elapsed."""
+        return {"env": self.env.save_state(), "elapsed_steps": self._elapsed_steps}
+
+    def load_state(self, state):
+        """Restores the environment and the number of steps elapsed from a snapshot."""
+        self.env.load_state(state["env"])
+        self._elapsed_steps = state["elapsed_steps"]
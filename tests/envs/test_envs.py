@@ -196,3 +196,42 @@ def test_pickle_env(env: gym.Env):
     data_equivalence(env.step(action), pickled_env.step(action))
     env.close()
     pickled_env.close()
+
+
+SNAPSHOT_ENV_SPECS = [
+    env_spec
+    for env_spec in all_testing_env_specs
+    if any(
+        f"gym.envs.{module}" in env_spec.entry_point
+        for module in ["classic_control", "toy_text", "mujoco"]
+    )
+]
+
+
+@pytest.mark.parametrize(
+    "env_spec", SNAPSHOT_ENV_SPECS, ids=[env.id for env in SNAPSHOT_ENV_SPECS]
+)
+def test_env_save_load_state(env_spec: EnvSpec):
+    """Restores a snapshot taken mid-episode in a new environment, and checks that both environments step identically."""
+    env = env_spec.make(disable_env_checker=True)
+    env.reset(seed=SEED)
+    env.action_space.seed(SEED)
+    for _ in range(5):
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            env.reset()
+
+    state = pickle.loads(pickle.dumps(env.save_state()))
+    rng_state = env.np_random.bit_generator.state
+    actions = [env.action_space.sample() for _ in range(10)]
+
+    restored_env = env_spec.make(disable_env_checker=True)
+    restored_env.load_state(state)
+    restored_env.np_random.bit_generator.state = rng_state
+    for action in actions:
+        results = env.step(action)
+        assert data_equivalence(results, restored_env.step(action))
+        if results[2] or results[3]:
+            break
+    env.close()
+    restored_env.close()
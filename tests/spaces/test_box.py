@@ -1,3 +1,4 @@
+import pickle
 import re
 import warnings
 
@@ -281,6 +282,7 @@ def test_legacy_state_pickling():
     b.__setstate__(legacy_state)
     assert b.low_repr == "0.0"
     assert b.high_repr == "1.0"
+    assert b.sample() in b
 
 
 def test_get_inf():
@@ -314,3 +316,61 @@ def test_sample_mask():
         match=re.escape("Box.sample cannot be provided a mask, actual value: "),
     ):
         space.sample(mask=np.array([0, 1, 0], dtype=np.int8))
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Box(low=-1, high=1, shape=(2, 3), dtype=np.float32),
+        Box(low=-1, high=1, shape=(2, 3), dtype=np.float64),
+        Box(low=-1, high=1, shape=(2, 3), dtype=np.float16),
+        Box(low=0, high=255, shape=(2, 3), dtype=np.uint8),
+        Box(
+            low=np.array([-np.inf, 0, -np.inf, -1]),
+            high=np.array([np.inf, np.inf, 1, 1]),
+            dtype=np.float32,
+        ),
+        Box(
+            low=np.array([-np.inf, 0, -np.inf, -1]),
+            high=np.array([np.inf, np.inf, 1, 1]),
+            dtype=np.int64,
+        ),
+        Box(low=-3e38, high=3e38, shape=(2,), dtype=np.float32),
+    ],
+)
+def test_sample_out(space: Box, n: int = 5):
+    """Tests that the samples are written in the `out` array and are the same as without `out`."""
+    space.seed(0)
+    sample = space.sample()
+    batch = space.sample_batch(n)
+    assert sample.dtype == space.dtype and batch.dtype == space.dtype
+    assert sample in space and all(item in space for item in batch)
+
+    space.seed(0)
+    out_sample = np.empty(space.shape, dtype=space.dtype)
+    out_batch = np.empty((n,) + space.shape, dtype=space.dtype)
+    assert space.sample(out=out_sample) is out_sample
+    assert space.sample_batch(n, out=out_batch) is out_batch
+    assert np.all(sample == out_sample) and np.all(batch == out_batch)
+
+    with pytest.raises(AssertionError, match="Expect `out` to be a contiguous"):
+        space.sample(out=np.empty(space.shape, dtype=np.complex64))
+    with pytest.raises(AssertionError, match="Expect `out` to be a contiguous"):
+        space.sample_batch(n, out=np.empty(space.shape, dtype=space.dtype))
+
+
+def test_sample_reassigned_bounds(n: int = 100):
+    """Tests that the samples follow the bounds reassigned after the box is created and sampled."""
+    space = Box(low=0, high=1, shape=(3,), dtype=np.float32)
+    assert space.sample() in space
+
+    space.low = np.full(3, 5, dtype=np.float32)
+    space.high = np.full(3, 6, dtype=np.float32)
+    assert all(sample in space for sample in space.sample_batch(n))
+
+    space.bounded_above = np.zeros(3, dtype=np.bool_)
+    space.high = np.full(3, np.finfo(np.float32).max, dtype=np.float32)
+    assert np.any(space.sample_batch(n) > 6)
+
+    unpickled = pickle.loads(pickle.dumps(space))
+    assert all(sample in unpickled for sample in unpickled.sample_batch(n))
@@ -133,3 +133,18 @@ def test_edge_space_sample():
 def test_not_contains(sample):
     space = Graph(node_space=Discrete(2), edge_space=Discrete(2))
     assert sample not in space
+
+
+@pytest.mark.parametrize("num_edges", [None, 0, 4])
+def test_sample_is_batch_of_one(num_edges):
+    space = Graph(node_space=Discrete(3), edge_space=Discrete(3), seed=0)
+    batch_space = Graph(node_space=Discrete(3), edge_space=Discrete(3), seed=0)
+    for _ in range(10):
+        sample = space.sample(num_nodes=4, num_edges=num_edges)
+        (batch_sample,) = batch_space.sample_batch(1, num_nodes=4, num_edges=num_edges)
+        assert np.array_equal(sample.nodes, batch_sample.nodes)
+        if sample.edges is None:
+            assert batch_sample.edges is None and batch_sample.edge_links is None
+        else:
+            assert np.array_equal(sample.edges, batch_sample.edges)
+            assert np.array_equal(sample.edge_links, batch_sample.edge_links)
@@ -8,9 +8,21 @@ from typing import List, Union
 import numpy as np
 import pytest
 
-from gym.spaces import Box, Discrete, MultiBinary, MultiDiscrete, Space, Text
+import gym.spaces
+from gym.spaces import (
+    Box,
+    Dict,
+    Discrete,
+    MultiBinary,
+    MultiDiscrete,
+    Space,
+    Text,
+    Tuple,
+)
+from gym.spaces.space import VALIDATION_CONTAINS, VALIDATION_NONE
 from gym.utils import seeding
 from gym.utils.env_checker import data_equivalence
+from gym.vector.utils import batch_space, create_empty_array, iterate
 from tests.spaces.utils import (
     TESTING_FUNDAMENTAL_SPACES,
     TESTING_FUNDAMENTAL_SPACES_IDS,
@@ -478,3 +490,185 @@ def test_space_pickling(space):
     file_unpickled_sample = file_unpickled_space.sample()
     assert data_equivalence(space_sample, unpickled_sample)
     assert data_equivalence(space_sample, file_unpickled_sample)
+
+
+def _assert_batch_layout(batch, expected_batch):
+    """Asserts that a batch of samples has the layout of `create_empty_array`."""
+    if expected_batch is None:
+        # The custom spaces have no batched layout, the samples are returned as a tuple
+        assert isinstance(batch, tuple)
+    elif isinstance(expected_batch, np.ndarray):
+        assert isinstance(batch, np.ndarray)
+        assert batch.shape == expected_batch.shape
+        assert batch.dtype == expected_batch.dtype
+    elif isinstance(expected_batch, dict):
+        assert type(batch) is type(expected_batch)
+        assert batch.keys() == expected_batch.keys()
+        for key in expected_batch:
+            _assert_batch_layout(batch[key], expected_batch[key])
+    else:
+        assert type(batch) is type(expected_batch)
+        assert len(batch) == len(expected_batch)
+        for item, expected_item in zip(batch, expected_batch):
+            _assert_batch_layout(item, expected_item)
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_sample_batch(space: Space, n: int = 10):
+    """Tests that `sample_batch` returns `n` samples contained in the space, in the layout of `create_empty_array`."""
+    batch = space.sample_batch(n)
+    _assert_batch_layout(batch, create_empty_array(space, n=n))
+    for sample in iterate(batch_space(space, n=n), batch):
+        assert sample in space
+
+
+@pytest.mark.parametrize(
+    "space,mask",
+    [
+        (Discrete(3), np.array([1, 1, 0], dtype=np.int8)),
+        (Discrete(3, start=-1), np.array([0, 0, 0], dtype=np.int8)),
+        (
+            MultiDiscrete([[2, 3], [3, 2]]),
+            (
+                (np.array([1, 0], dtype=np.int8), np.array([0, 1, 1], dtype=np.int8)),
+                (np.array([1, 1, 0], dtype=np.int8), np.array([0, 0], dtype=np.int8)),
+            ),
+        ),
+        (MultiBinary([2, 3]), np.array([[0, 1, 2], [0, 2, 1]], dtype=np.int8)),
+        (Text(5), (3, np.array([1, 1] + [0] * 60, dtype=np.int8))),
+    ],
+)
+def test_sample_batch_mask(space: Space, mask, n: int = 100):
+    """Tests that the batches of samples with a mask only contain the samples possible with the mask."""
+    space.seed(0)
+    batch = space.sample_batch(n, mask)
+    possible_samples = {
+        str(space.to_jsonable([space.sample(mask)])) for _ in range(1_000)
+    }
+    samples = {
+        str(space.to_jsonable([sample]))
+        for sample in iterate(batch_space(space, n=n), batch)
+    }
+    assert samples == possible_samples
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_contains_batch(space: Space, n: int = 10):
+    """Tests that `contains_batch` returns for each sample of a batch if it is contained in the space."""
+    batch = space.sample_batch(n)
+    contained = space.contains_batch(batch)
+    assert isinstance(contained, np.ndarray) and contained.dtype == np.bool_
+    assert contained.shape == (n,) and np.all(contained)
+
+
+@pytest.mark.parametrize(
+    "space,batch,expected_contained",
+    [
+        (Discrete(3, start=1), np.array([0, 1, 3, 4]), [False, True, True, False]),
+        (Discrete(3), np.array([0.0, 1.0]), [False, False]),
+        (
+            Box(low=-1, high=1, shape=(2,)),
+            np.array([[0, 0], [0, 2], [-2, 0]], dtype=np.float32),
+            [True, False, False],
+        ),
+        (Box(low=-1, high=1, shape=(2,)), np.zeros((3, 3)), [False, False, False]),
+        (MultiBinary(2), np.array([[0, 1], [1, 2]]), [True, False]),
+        (
+            MultiDiscrete([2, 3]),
+            np.array([[1, 2], [2, 0], [0, -1]]),
+            [True, False, False],
+        ),
+        (
+            Tuple((Discrete(2), MultiBinary(2))),
+            (np.array([0, 2, 1]), np.array([[0, 1], [0, 1], [2, 1]])),
+            [True, False, False],
+        ),
+        (
+            Dict(a=Discrete(2), b=Text(3)),
+            {"a": np.array([0, 1, 2]), "b": ("abc", "abcd", "a")},
+            [True, False, False],
+        ),
+    ],
+)
+def test_contains_batch_invalid(space: Space, batch, expected_contained):
+    """Tests that `contains_batch` matches `contains` for batches with invalid samples."""
+    assert np.all(space.contains_batch(batch) == np.array(expected_contained))
+    for sample, contained in zip(
+        iterate(batch_space(space, len(expected_contained)), batch), expected_contained
+    ):
+        assert space.contains(sample) == contained
+
+
+@pytest.mark.parametrize(
+    "space,batch",
+    [
+        (Discrete(3), np.array(1)),
+        (Box(low=-1, high=1, shape=()), np.array(0.0)),
+        (MultiBinary(2), np.array(1)),
+        (MultiDiscrete([2, 3]), np.array(1)),
+        (Text(3), "abc"),
+        (Tuple((Discrete(2), MultiBinary(2))), np.zeros((3, 2))),
+        (Tuple((Discrete(2), MultiBinary(2))), (np.array([0, 1, 1]),)),
+        (Tuple((Discrete(2), Box(low=-1, high=1))), (np.array(1), np.array(0.0))),
+        (Dict(a=Discrete(2), b=Discrete(2)), (np.array([0, 1]), np.array([0, 1]))),
+        (Dict(a=Discrete(2), b=Discrete(2)), {"a": np.array([0, 1])}),
+    ],
+)
+def test_contains_batch_invalid_structure(space: Space, batch, n: int = 3):
+    """Tests that `contains_batch` returns `False` for the batches whose structure does not match the space."""
+    contained = space.contains_batch(batch)
+    assert contained.dtype == np.bool_ and contained.shape == () and not contained
+    contained = space.contains_batch(batch, n=n)
+    assert contained.dtype == np.bool_ and contained.shape == (n,)
+    assert not np.any(contained)
+
+
+@pytest.mark.parametrize(
+    "space,batch",
+    [
+        (Discrete(3), [1, [2, 3]]),
+        (Box(low=-1, high=1, shape=(2,)), [[0, 1], [1]]),
+        (MultiBinary(2), [[0, 1], [1]]),
+        (MultiDiscrete([2, 3]), [[0, 1], [1]]),
+    ],
+)
+def test_contains_batch_ragged(space: Space, batch):
+    """Tests that `contains_batch` returns `False` for each sample of a ragged batch, instead of raising."""
+    contained = space.contains_batch(batch)
+    assert contained.dtype == np.bool_ and contained.shape == (2,)
+    assert not np.any(contained)
+    assert not np.any(space.contains_batch(batch, n=2))
+
+
+def test_contains_batch_inconsistent_lengths():
+    """Tests that `contains_batch` returns `False` if the batches of the subspaces have a different number of samples."""
+    space = Tuple((Discrete(2), MultiBinary(2), Dict(a=Discrete(2))))
+    batch = (np.array([0, 1]), np.zeros((3, 2)), {"a": np.array([0])})
+    assert np.all(space.contains_batch(batch) == [False, False])
+    assert np.all(space.contains_batch(batch, n=3) == [False, False, False])
+
+
+@pytest.mark.parametrize("space", [Tuple([]), Dict({})])
+def test_contains_batch_empty(space: Space, n: int = 3):
+    """Tests that `contains_batch` returns an array of length `n` for the spaces without subspaces."""
+    contained = space.contains_batch(space.sample_batch(n), n=n)
+    assert contained.shape == (n,) and np.all(contained)
+    # Within a space with other subspaces, `n` is inferred from their batches
+    nested_space = Tuple((Discrete(2), space))
+    contained = nested_space.contains_batch(nested_space.sample_batch(n))
+    assert contained.shape == (n,) and np.all(contained)
+
+
+def test_validation_level():
+    """Tests that `Space.check` is a no-op with the `VALIDATION_NONE` validation level."""
+    space = Discrete(2)
+    assert space.check(1) and not space.check(2)
+    try:
+        gym.spaces.set_validation_level(VALIDATION_NONE)
+        assert space.check(1) and space.check(2)
+    finally:
+        gym.spaces.set_validation_level(VALIDATION_CONTAINS)
+    assert not space.check(2)
+
+    with pytest.raises(AssertionError, match="Expect the validation level to be"):
+        gym.spaces.set_validation_level(2)
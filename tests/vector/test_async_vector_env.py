@@ -1,12 +1,16 @@
+import os
 import re
+from collections import OrderedDict
 from multiprocessing import TimeoutError
 
 import numpy as np
 import pytest
 
+import gym
 from gym.error import AlreadyPendingCallError, ClosedEnvironmentError, NoAsyncCallError
 from gym.spaces import Box, Discrete, MultiDiscrete, Tuple
 from gym.vector.async_vector_env import AsyncVectorEnv
+from gym.vector.sync_vector_env import SyncVectorEnv
 from tests.vector.utils import (
     CustomSpace,
     make_custom_space_env,
@@ -121,6 +125,31 @@ def test_call_async_vector_env(shared_memory):
         assert gravity[i] == 9.8
 
 
+@pytest.mark.parametrize(
+    "vector_kwargs",
+    [{"shared_memory": True}, {"shared_memory": False}, {"envs_per_worker": 2}],
+)
+def test_call_batch_async_vector_env(vector_kwargs):
+    env_fns = [make_env("CartPole-v1", i, render_mode="rgb_array") for i in range(4)]
+    render_space = Box(0, 255, (400, 600, 3), np.uint8)
+    gravity_space = Box(-np.inf, np.inf, (), np.float64)
+
+    env = AsyncVectorEnv(env_fns, **vector_kwargs)
+    env.reset()
+    images = env.call_batch("render", render_space)
+    expected_images = env.call("render")
+    gravity = env.call_batch("gravity", gravity_space)
+    env.step(env.action_space.sample())
+    assert env.call_batch("render", render_space) is not images
+    assert len(env._call_buffers) == 2
+    env.close()
+
+    assert images.shape == (4, 400, 600, 3) and images.dtype == np.uint8
+    for image, expected_image in zip(images, expected_images):
+        assert np.array_equal(image, expected_image)
+    assert np.array_equal(gravity, np.full(4, 9.8))
+
+
 @pytest.mark.parametrize("shared_memory", [True, False])
 def test_set_attr_async_vector_env(shared_memory):
     env_fns = [make_env("CartPole-v1", i) for i in range(4)]
@@ -157,6 +186,28 @@ def test_no_copy_async_vector_env(shared_memory):
     env.close()
 
 
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_observation_buffers_async_vector_env(shared_memory):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = AsyncVectorEnv(
+        env_fns, shared_memory=shared_memory, num_observation_buffers=2
+    )
+    observations, _ = env.reset(seed=0)
+    first_observations = np.copy(observations)
+
+    step_observations, _, _, _, _ = env.step(env.action_space.sample())
+    assert step_observations is not observations
+    assert np.all(observations == first_observations)
+
+    next_observations, _, _, _, _ = env.step(env.action_space.sample())
+    assert next_observations is observations
+    assert np.all(next_observations == env.observations)
+    env.close()
+
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, num_observation_buffers=0)
+
+
 @pytest.mark.parametrize("shared_memory", [True, False])
 def test_reset_timeout_async_vector_env(shared_memory):
     env_fns = [make_slow_env(0.3, i) for i in range(4)]
@@ -306,3 +357,535 @@ def test_custom_space_async_vector_env_shared_memory():
     with pytest.raises(ValueError):
         env = AsyncVectorEnv(env_fns, shared_memory=True)
         env.close(terminate=True)
+
+
+def test_shared_step_buffers_async_vector_env():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns, shared_step_buffers=True)
+    sync_env = SyncVectorEnv(env_fns)
+
+    observations, _ = env.reset(seed=123)
+    sync_observations, _ = sync_env.reset(seed=123)
+    assert np.all(observations == sync_observations)
+
+    for _ in range(100):
+        actions = env.action_space.sample()
+        observations, rewards, terminateds, truncateds, infos = env.step(actions)
+        (
+            sync_observations,
+            sync_rewards,
+            sync_terminateds,
+            sync_truncateds,
+            sync_infos,
+        ) = sync_env.step(actions)
+
+        assert np.all(observations == sync_observations)
+        assert rewards.dtype == sync_rewards.dtype
+        assert np.all(rewards == sync_rewards)
+        assert terminateds.dtype == np.bool_
+        assert np.all(terminateds == sync_terminateds)
+        assert truncateds.dtype == np.bool_
+        assert np.all(truncateds == sync_truncateds)
+        assert infos.keys() == sync_infos.keys()
+
+    env.close()
+    sync_env.close()
+
+
+def test_shared_step_buffers_requires_shared_memory():
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, shared_memory=False, shared_step_buffers=True)
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 3, 8])
+def test_envs_per_worker_async_vector_env(envs_per_worker):
+    env_fns = [make_env("CartPole-v1", i) for i in range(8)]
+
+    env = AsyncVectorEnv(env_fns, envs_per_worker=envs_per_worker)
+    sync_env = SyncVectorEnv(env_fns)
+    assert env.shared_step_buffers is (envs_per_worker > 1)
+    assert env.num_workers == len(env.processes) == -(-8 // envs_per_worker)
+    assert sorted(sum(env.worker_env_indices, [])) == list(range(8))
+
+    observations, _ = env.reset(seed=123)
+    sync_observations, _ = sync_env.reset(seed=123)
+    assert np.all(observations == sync_observations)
+
+    for _ in range(100):
+        actions = env.action_space.sample()
+        observations, rewards, terminateds, truncateds, infos = env.step(actions)
+        (
+            sync_observations,
+            sync_rewards,
+            sync_terminateds,
+            sync_truncateds,
+            sync_infos,
+        ) = sync_env.step(actions)
+
+        assert np.all(observations == sync_observations)
+        assert np.all(rewards == sync_rewards)
+        assert np.all(terminateds == sync_terminateds)
+        assert np.all(truncateds == sync_truncateds)
+        assert infos.keys() == sync_infos.keys()
+        if "final_observation" in infos:
+            assert np.all(
+                infos["_final_observation"] == sync_infos["_final_observation"]
+            )
+
+    gravities = [float(i) for i in range(8)]
+    env.set_attr("gravity", gravities)
+    assert env.get_attr("gravity") == tuple(gravities)
+
+    env.close()
+    sync_env.close()
+
+
+def test_envs_per_worker_requires_shared_memory():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, shared_memory=False, envs_per_worker=2)
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, envs_per_worker=0)
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_step_min_ready_async_vector_env(envs_per_worker):
+    env_fns = [make_slow_env(0.0, i) for i in range(4)]
+
+    env = AsyncVectorEnv(
+        env_fns, shared_step_buffers=True, envs_per_worker=envs_per_worker
+    )
+    env.reset()
+    env.step_async(np.array([0.0, 0.0, 0.5, 0.5], dtype=np.float32))
+    observations, rewards, terminateds, truncateds, infos = env.step_wait(min_ready=2)
+    assert set(infos["env_id"]) == {0, 1}
+    assert observations.shape == (2,) + env.single_observation_space.shape
+    assert rewards.shape == terminateds.shape == truncateds.shape == (2,)
+
+    # The ready sub-environments can be stepped again while the others are pending
+    env.step_async(np.array([0.0], dtype=np.float32), env_ids=[0])
+    with pytest.raises(ValueError):
+        env.step_async(np.array([0.0], dtype=np.float32), env_ids=[2])
+
+    observations, rewards, terminateds, truncateds, infos = env.step_wait()
+    assert sorted(infos["env_id"]) == [0, 2, 3]
+    assert observations.shape == (3,) + env.single_observation_space.shape
+    assert np.all(infos["_env_id"])
+
+    with pytest.raises(NoAsyncCallError):
+        env.step_wait()
+    env.close()
+
+
+def test_step_env_ids_requires_shared_step_buffers():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(env_fns)
+    env.reset()
+    with pytest.raises(ValueError):
+        env.step_async(np.array([0, 1]), env_ids=[0, 1])
+    env.close()
+
+
+class InfoWrapper(gym.Wrapper):
+    def reset(self, **kwargs):
+        obs, info = self.env.reset(**kwargs)
+        return obs, {"x_position": float(obs[0]), **info}
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        info = {"x_position": float(obs[0]), "steps": len(info), **info}
+        return obs, reward, terminated, truncated, info
+
+
+def make_info_env(seed):
+    def _make():
+        return InfoWrapper(make_env("CartPole-v1", seed)())
+
+    return _make
+
+
+@pytest.mark.parametrize("shared_info_dtypes", [None, {"x_position": np.float64}])
+def test_shared_infos_async_vector_env(shared_info_dtypes):
+    env_fns = [make_info_env(i) for i in range(4)]
+
+    env = AsyncVectorEnv(
+        env_fns, shared_step_buffers=True, shared_info_dtypes=shared_info_dtypes
+    )
+    sync_env = SyncVectorEnv(env_fns)
+
+    _, infos = env.reset(seed=123)
+    _, sync_infos = sync_env.reset(seed=123)
+    assert np.all(infos["x_position"] == sync_infos["x_position"])
+
+    num_final_observations = 0
+    for _ in range(100):
+        actions = env.action_space.sample()
+        _, _, _, _, infos = env.step(actions)
+        _, _, _, _, sync_infos = sync_env.step(actions)
+
+        assert infos.keys() == sync_infos.keys()
+        for key in infos.keys():
+            assert infos[key].dtype == sync_infos[key].dtype
+            if key != "final_observation":
+                assert np.all(infos[key] == sync_infos[key])
+        if "final_observation" in infos:
+            num_final_observations += 1
+            for obs, sync_obs in zip(
+                infos["final_observation"], sync_infos["final_observation"]
+            ):
+                assert np.all(obs == sync_obs)
+    assert num_final_observations > 0
+
+    env.close()
+    sync_env.close()
+
+
+@pytest.mark.parametrize("context", ["fork", "spawn", "forkserver"])
+def test_shared_memory_arena_async_vector_env(context):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = AsyncVectorEnv(
+        env_fns, context=context, shared_step_buffers=True, envs_per_worker=2
+    )
+    sync_env = SyncVectorEnv(env_fns)
+    assert env.shared_memory_arena is not None
+
+    observations, _ = env.reset(seed=123)
+    sync_observations, _ = sync_env.reset(seed=123)
+    assert np.all(observations == sync_observations)
+    for _ in range(10):
+        actions = env.action_space.sample()
+        observations, rewards, _, _, _ = env.step(actions)
+        sync_observations, sync_rewards, _, _, _ = sync_env.step(actions)
+        assert np.all(observations == sync_observations)
+        assert np.all(rewards == sync_rewards)
+
+    env.close()
+    sync_env.close()
+
+
+class CpuAffinityWrapper(gym.Wrapper):
+    @property
+    def cpu_affinity(self):
+        return os.sched_getaffinity(0)
+
+
+def make_cpu_affinity_env(seed):
+    def _make():
+        return CpuAffinityWrapper(make_env("CartPole-v1", seed)())
+
+    return _make
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="Requires `os.sched_setaffinity`"
+)
+@pytest.mark.parametrize("shared_step_buffers", [True, False])
+def test_cpu_affinity_async_vector_env(shared_step_buffers):
+    env_fns = [make_cpu_affinity_env(i) for i in range(4)]
+    cpus = sorted(os.sched_getaffinity(0))
+
+    env = AsyncVectorEnv(
+        env_fns,
+        shared_step_buffers=shared_step_buffers,
+        envs_per_worker=2 if shared_step_buffers else 1,
+        cpu_affinity=True,
+    )
+    expected = [{cpus[worker % len(cpus)]} for worker in range(env.num_workers)]
+    assert env.worker_cpus == expected
+    assert env.get_attr("cpu_affinity") == tuple(
+        expected[worker]
+        for worker, env_indices in enumerate(env.worker_env_indices)
+        for _ in env_indices
+    )
+    env.reset()
+    env.step(env.action_space.sample())
+    env.close()
+
+    env = AsyncVectorEnv(env_fns, cpu_affinity=[cpus[-1:]])
+    assert env.get_attr("cpu_affinity") == tuple({cpus[-1]} for _ in range(4))
+    env.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"shared_memory": False},
+        {"shared_memory": True},
+        {"shared_info_dtypes": {"x_position": np.float64}},
+        {"envs_per_worker": 3},
+    ],
+)
+def test_partial_reset_async_vector_env(kwargs):
+    env_fns = [make_info_env(i) for i in range(4)]
+    env = AsyncVectorEnv(env_fns, **kwargs)
+    sync_env = SyncVectorEnv(env_fns)
+
+    for vector_env in (env, sync_env):
+        vector_env.reset(seed=0)
+        vector_env.step(np.ones(4, dtype=np.int64))
+    observations, _, _, _, _ = sync_env.step(np.ones(4, dtype=np.int64))
+    env.step(np.ones(4, dtype=np.int64))
+
+    async_observations, async_infos = env.reset(seed=[10, 13], indices=[1, 3])
+    sync_observations, sync_infos = sync_env.reset(seed=[10, 13], indices=[1, 3])
+    for vector_env in (env, sync_env):
+        empty_observations, empty_infos = vector_env.reset(seed=0, indices=[])
+        assert np.all(empty_observations == sync_observations) and empty_infos == {}
+    env.close()
+    sync_env.close()
+
+    assert np.all(async_observations == sync_observations)
+    assert np.all(async_observations[[0, 2]] == observations[[0, 2]])
+    for index, seed in [(1, 10), (3, 13)]:
+        single_observation, _ = make_info_env(0)().reset(seed=seed)
+        assert np.all(async_observations[index] == single_observation)
+
+    for infos in (async_infos, sync_infos):
+        assert np.all(infos["_x_position"] == [False, True, False, True])
+        assert np.all(infos["x_position"][[1, 3]] == async_observations[[1, 3], 0])
+
+
+def make_parent_only_env(calls):
+    def _make():
+        calls.append(os.getpid())
+        return make_env("CartPole-v1", 0)()
+
+    return _make
+
+
+def test_async_vector_env_without_dummy_env():
+    calls = []
+    single_env = make_env("CartPole-v1", 0)()
+    env = AsyncVectorEnv(
+        [make_parent_only_env(calls) for _ in range(2)],
+        observation_space=single_env.observation_space,
+        action_space=single_env.action_space,
+        context="fork",
+    )
+    assert calls == []
+    assert env.metadata == single_env.metadata
+    env.close()
+    single_env.close()
+
+
+def test_forkserver_preload_async_vector_env():
+    env = AsyncVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(2)],
+        context="forkserver",
+        preload_modules=["gym.envs.classic_control"],
+    )
+    observations, _ = env.reset(seed=0)
+    assert observations.shape == (2, 4)
+    env.close()
+
+
+def test_vector_make_caches_spaces(monkeypatch):
+    monkeypatch.setattr(gym.vector, "_single_spaces", OrderedDict())
+    env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    assert gym.vector._single_spaces[("CartPole-v1", None, "[]")] == (
+        gym.spec("CartPole-v1"),
+        env.single_observation_space,
+        env.single_action_space,
+    )
+    env.close()
+
+    env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    observations, _ = env.reset(seed=0)
+    assert observations in env.observation_space
+    assert env.metadata["render_fps"] == 50
+    env.close()
+
+
+def test_vector_make_cached_spaces_are_copied(monkeypatch):
+    monkeypatch.setattr(gym.vector, "_single_spaces", OrderedDict())
+    env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    other_env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    third_env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    assert env.single_action_space is not other_env.single_action_space
+    assert other_env.single_action_space is not third_env.single_action_space
+
+    # Seeding the spaces of an environment does not change the samples of the others
+    other_env.action_space.seed(0)
+    third_env.action_space.seed(0)
+    expected = [third_env.action_space.sample() for _ in range(10)]
+    env.action_space.seed(1)
+    env.spawn_seeds(1)
+    assert np.array_equal(
+        [other_env.action_space.sample() for _ in range(10)], expected
+    )
+    for vector_env in (env, other_env, third_env):
+        vector_env.close()
+
+
+def test_vector_make_cache_max_size(monkeypatch):
+    monkeypatch.setattr(gym.vector, "_single_spaces", OrderedDict())
+    monkeypatch.setattr(gym.vector, "_SINGLE_SPACES_MAX_SIZE", 2)
+    for env_id in ["CartPole-v1", "Acrobot-v1", "CartPole-v1", "Pendulum-v1"]:
+        gym.vector.make(env_id, num_envs=1, disable_env_checker=True).close()
+    # The least recently used entry is dropped
+    assert [key[0] for key in gym.vector._single_spaces] == [
+        "CartPole-v1",
+        "Pendulum-v1",
+    ]
+
+
+def test_vector_make_does_not_cache_given_spaces(monkeypatch):
+    monkeypatch.setattr(gym.vector, "_single_spaces", OrderedDict())
+    env = gym.vector.make(
+        "CartPole-v1",
+        num_envs=2,
+        disable_env_checker=True,
+        vector_kwargs={
+            "observation_space": Box(-np.inf, np.inf, (2,), np.float32),
+            "observation_transform": lambda observation: observation[:2],
+        },
+    )
+    assert env.single_observation_space.shape == (2,)
+    assert gym.vector._single_spaces == {}
+    env.close()
+
+    env = gym.vector.make("CartPole-v1", num_envs=2, disable_env_checker=True)
+    observations, _ = env.reset(seed=0)
+    assert observations.shape == (2, 4)
+    env.close()
+
+
+def test_vector_make_cache_reregistered_id(monkeypatch):
+    monkeypatch.setattr(gym.vector, "_single_spaces", OrderedDict())
+    env_id = "test/CachedSpaces-v0"
+    try:
+        gym.register(env_id, entry_point="gym.envs.classic_control:CartPoleEnv")
+        env = gym.vector.make(env_id, num_envs=2, disable_env_checker=True)
+        assert env.single_observation_space.shape == (4,)
+        env.close()
+
+        with pytest.warns(UserWarning, match="Overriding environment"):
+            gym.register(env_id, entry_point="gym.envs.classic_control:PendulumEnv")
+        env = gym.vector.make(env_id, num_envs=2, disable_env_checker=True)
+        assert env.single_observation_space.shape == (3,)
+        observations, _ = env.reset(seed=0)
+        assert observations.shape == (2, 3)
+        env.close()
+    finally:
+        del gym.envs.registration.registry[env_id]
+
+
+class RaiseOnActionWrapper(gym.Wrapper):
+    def step(self, action):
+        if action == 0:
+            raise ValueError("Invalid action")
+        return self.env.step(action)
+
+
+def make_raise_env(seed):
+    def _make():
+        return RaiseOnActionWrapper(make_env("CartPole-v1", seed)())
+
+    return _make
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_respawn_workers_async_vector_env(envs_per_worker):
+    env = AsyncVectorEnv(
+        [make_raise_env(i) for i in range(4)],
+        envs_per_worker=envs_per_worker,
+        respawn_workers=True,
+    )
+    env.reset(seed=0)
+    with pytest.raises(ValueError, match="Invalid action"):
+        env.step(np.array([1, 1, 0, 1]))
+    assert env.respawned_env_indices == ([2] if envs_per_worker == 1 else [2, 3])
+
+    env.reset(seed=0, indices=env.respawned_env_indices)
+    observations, rewards, _, _, _ = env.step(np.ones(4, dtype=np.int64))
+    assert observations.shape == (4, 4)
+    assert all(process.is_alive() for process in env.processes)
+    env.close()
+
+
+def _raise_first_touch(*args):
+    raise RuntimeError("First touch")
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="Requires `os.sched_setaffinity`"
+)
+def test_first_touch_async_vector_env(monkeypatch):
+    # The forked workers inherit the patched `_first_touch`
+    monkeypatch.setattr(gym.vector.async_vector_env, "_first_touch", _raise_first_touch)
+    env_fns = [make_raise_env(i) for i in range(4)]
+    env = AsyncVectorEnv(env_fns, envs_per_worker=2, context="fork")
+    env.close()
+    with pytest.raises(RuntimeError, match="First touch"):
+        AsyncVectorEnv(env_fns, envs_per_worker=2, cpu_affinity=True, context="fork")
+    monkeypatch.undo()
+
+    env = AsyncVectorEnv(
+        env_fns,
+        envs_per_worker=2,
+        cpu_affinity=True,
+        respawn_workers=True,
+        context="fork",
+    )
+    env.reset(seed=0)
+    # The respawned worker does not touch the shared buffers again
+    monkeypatch.setattr(gym.vector.async_vector_env, "_first_touch", _raise_first_touch)
+    with pytest.raises(ValueError, match="Invalid action"):
+        env.step(np.array([1, 1, 0, 1]))
+    assert env.respawned_env_indices == [2, 3]
+    env.reset(seed=0, indices=env.respawned_env_indices)
+    env.step(np.ones(4, dtype=np.int64))
+    env.close()
+
+
+def test_shared_actions_async_vector_env():
+    env = AsyncVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(4)], shared_step_buffers=True
+    )
+    env.reset(seed=0)
+    actions = np.array([0, 1, 1, 0])
+    env.step(actions)
+    assert np.all(env._actions == actions)
+    env.step_async([1, 1], env_ids=[2, 0])
+    env.step_wait()
+    assert np.all(env._actions == [1, 1, 1, 0])
+    env.close()
+
+
+def downsample(observation):
+    return observation[::2, ::2, 0]
+
+
+@pytest.mark.parametrize("shared_step_buffers", [False, True])
+def test_observation_transform_async_vector_env(shared_step_buffers):
+    env_fns = [make_env("CarRacing-v2", i) for i in range(2)]
+    single_env = env_fns[0]()
+    height, width, _ = single_env.observation_space.shape
+    observation_space = Box(
+        low=0, high=255, shape=(height // 2, width // 2), dtype=np.uint8
+    )
+
+    env = AsyncVectorEnv(
+        env_fns,
+        observation_space=observation_space,
+        observation_transform=downsample,
+        shared_step_buffers=shared_step_buffers,
+    )
+    assert env.observation_space.shape == (2, height // 2, width // 2)
+
+    observations, _ = env.reset(seed=0)
+    single_observation, _ = single_env.reset(seed=0)
+    assert np.all(observations[0] == downsample(single_observation))
+
+    observations, _, _, _, _ = env.step(np.zeros((2, 3), dtype=np.float32))
+    single_observation, _, _, _, _ = single_env.step(np.zeros(3, dtype=np.float32))
+    assert np.all(observations[0] == downsample(single_observation))
+    env.close()
+    single_env.close()
+
+    with pytest.raises(ValueError):
+        AsyncVectorEnv(env_fns, observation_transform=downsample)
@@ -0,0 +1,147 @@
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+import gym
+from gym.vector import AsyncState, AsyncVectorEnv, DoubleBatchVectorEnv, SyncVectorEnv
+from gym.vector.wrappers import ClipAction
+from tests.vector.utils import make_env
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_double_batch_vector_env(envs_per_worker):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = DoubleBatchVectorEnv(
+        AsyncVectorEnv(
+            env_fns, envs_per_worker=envs_per_worker, shared_step_buffers=True
+        )
+    )
+    sync_env = SyncVectorEnv(env_fns)
+    assert env.num_envs == 2
+    assert env.action_space.shape == (2,)
+
+    sync_observations, _ = sync_env.reset(seed=0)
+    observations, infos = env.reset(seed=0)
+    assert np.all(infos["env_id"] == [0, 1])
+    assert np.all(observations == sync_observations[:2])
+
+    actions = np.array([1, 0])
+    observations, rewards, terminateds, truncateds, infos = env.step(actions)
+    assert np.all(infos["env_id"] == [2, 3])
+    assert np.all(observations == sync_observations[2:])
+    assert np.all(rewards == 0) and not np.any(terminateds | truncateds)
+
+    sync_results = sync_env.step(np.array([1, 0, 0, 1]))
+    observations, rewards, terminateds, truncateds, infos = env.step(np.array([0, 1]))
+    assert np.all(infos["env_id"] == [0, 1])
+    assert np.all(observations == sync_results[0][:2])
+    assert np.all(rewards == sync_results[1][:2])
+
+    observations, rewards, terminateds, truncateds, infos = env.step(actions)
+    assert np.all(infos["env_id"] == [2, 3])
+    assert np.all(observations == sync_results[0][2:])
+
+    env.close()
+    sync_env.close()
+
+
+def test_double_batch_vector_env_reset_after_step():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = DoubleBatchVectorEnv(AsyncVectorEnv(env_fns, shared_step_buffers=True))
+    sync_env = SyncVectorEnv(env_fns)
+
+    env.reset(seed=0)
+    for _ in range(3):
+        env.step(np.array([1, 0]))
+
+    sync_observations, _ = sync_env.reset(seed=1)
+    observations, infos = env.reset(seed=1)
+    assert np.all(infos["env_id"] == [0, 1])
+    assert np.all(observations == sync_observations[:2])
+    observations, rewards, _, _, infos = env.step(np.array([1, 0]))
+    assert np.all(infos["env_id"] == [2, 3])
+    assert np.all(observations == sync_observations[2:])
+    assert np.all(rewards == 0)
+
+    env.close()
+    sync_env.close()
+
+
+class WaitEventWrapper(gym.Wrapper):
+    def __init__(self, env, event):
+        super().__init__(env)
+        self.event = event
+
+    def step(self, action):
+        if not self.event.wait(timeout=10):
+            raise RuntimeError("The step was waited for before the event was set")
+        return self.env.step(action)
+
+
+def make_wait_event_env(seed, event):
+    def _make():
+        return WaitEventWrapper(make_env("CartPole-v1", seed)(), event)
+
+    return _make
+
+
+def test_double_batch_vector_env_overlaps_steps():
+    ctx = mp.get_context("fork")
+    event = ctx.Event()
+    # The steps of half A block until the event is set, after the results of half B are returned
+    env_fns = [make_wait_event_env(i, event) for i in range(2)] + [
+        make_env("CartPole-v1", i) for i in range(2, 4)
+    ]
+    env = DoubleBatchVectorEnv(
+        AsyncVectorEnv(env_fns, shared_step_buffers=True, context="fork")
+    )
+    env.reset(seed=0)
+    _, _, _, _, infos = env.step(np.ones(2, dtype=np.int64))
+    assert np.all(infos["env_id"] == [2, 3])
+    assert env.unwrapped._state == AsyncState.WAITING_STEP
+
+    event.set()
+    _, _, _, _, infos = env.step(np.ones(2, dtype=np.int64))
+    assert np.all(infos["env_id"] == [0, 1])
+    env.close()
+
+
+def test_double_batch_vector_env_wrapped():
+    env_fns = [make_env("Pendulum-v1", i) for i in range(4)]
+    env = DoubleBatchVectorEnv(
+        ClipAction(AsyncVectorEnv(env_fns, shared_step_buffers=True))
+    )
+    sync_env = SyncVectorEnv(env_fns)
+    sync_observations, _ = sync_env.reset(seed=0)
+    env.reset(seed=0)
+    env.step(np.full((2, 1), 5.0))
+    sync_results = sync_env.step(np.full((4, 1), 2.0))
+    observations, rewards, _, _, infos = env.step(np.full((2, 1), -5.0))
+    assert np.all(infos["env_id"] == [0, 1])
+    assert np.allclose(observations, sync_results[0][:2])
+    assert np.allclose(rewards, sync_results[1][:2])
+    env.close()
+    sync_env.close()
+
+
+def test_double_batch_vector_env_requires_shared_step_buffers():
+    env = AsyncVectorEnv([make_env("CartPole-v1", i) for i in range(4)])
+    with pytest.raises(ValueError):
+        DoubleBatchVectorEnv(env)
+    env.close()
+
+    env = AsyncVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(3)], shared_step_buffers=True
+    )
+    with pytest.raises(ValueError):
+        DoubleBatchVectorEnv(env)
+    env.close()
+
+    # The worker hosting the sub-environments 2 and 3 would step both halves
+    env = AsyncVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(6)], envs_per_worker=2
+    )
+    with pytest.raises(ValueError, match="hosted by different workers"):
+        DoubleBatchVectorEnv(env)
+    env.close()
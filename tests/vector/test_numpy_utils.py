@@ -4,8 +4,16 @@ import numpy as np
 import pytest
 
 from gym.spaces import Dict, Tuple
-from gym.vector.utils.numpy_utils import concatenate, create_empty_array
-from gym.vector.utils.spaces import BaseGymSpaces
+from gym.utils.env_checker import data_equivalence
+from gym.vector.utils.numpy_utils import (
+    concatenate,
+    copy_batch,
+    create_empty_array,
+    get_batch_item,
+    scatter,
+    set_batch_item,
+)
+from gym.vector.utils.spaces import BaseGymSpaces, batch_space
 from tests.vector.utils import spaces
 
 
@@ -51,6 +59,101 @@ def test_concatenate(space):
     assert_nested_equal(array, samples, n=8)
 
 
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_copy_batch(space):
+    def assert_nested_copy(lhs, rhs, out):
+        if isinstance(rhs, np.ndarray):
+            assert lhs is out
+            assert np.all(lhs == rhs)
+        elif isinstance(rhs, tuple):
+            for i in range(len(rhs)):
+                assert_nested_copy(lhs[i], rhs[i], out[i])
+        elif isinstance(rhs, OrderedDict):
+            for key in rhs.keys():
+                assert_nested_copy(lhs[key], rhs[key], out[key])
+        else:
+            raise TypeError(f"Got unknown type `{type(rhs)}`.")
+
+    batch = concatenate(
+        space, [space.sample() for _ in range(8)], create_empty_array(space, n=8)
+    )
+    out = create_empty_array(space, n=8)
+    assert_nested_copy(copy_batch(space, batch, out), batch, out)
+
+
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_scatter(space):
+    samples = [space.sample() for _ in range(4)]
+    batch = concatenate(space, samples, create_empty_array(space, n=4))
+    new_samples = [space.sample() for _ in range(2)]
+    out = scatter(space, new_samples, [3, 1], batch)
+
+    expected = concatenate(
+        space,
+        [samples[0], new_samples[1], samples[2], new_samples[0]],
+        create_empty_array(space, n=4),
+    )
+    assert data_equivalence(out, expected)
+
+
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_get_batch_item(space):
+    samples = [space.sample() for _ in range(4)]
+    batch = concatenate(space, samples, create_empty_array(space, n=4))
+
+    expected = concatenate(space, [samples[2]], create_empty_array(space, n=1))
+    out = create_empty_array(space, n=1)
+    set_batch_item(out, 0, get_batch_item(batch, 2))
+    assert data_equivalence(out, expected)
+    assert data_equivalence(
+        get_batch_item(batch, [3, 1]),
+        concatenate(space, [samples[3], samples[1]], create_empty_array(space, n=2)),
+    )
+
+    item, view = get_batch_item(batch, 2), get_batch_item(batch, 2, copy=False)
+    for batch_array, item_array, view_array in zip(
+        _leaves(batch), _leaves(item), _leaves(view)
+    ):
+        # The elements of 1-dimensional arrays are numpy scalars, which are never views
+        if isinstance(view_array, np.ndarray):
+            assert not np.shares_memory(item_array, batch_array)
+            assert np.shares_memory(view_array, batch_array)
+
+
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_set_batch_item(space):
+    batched_space = batch_space(space, n=4)
+    batched_space.seed(0)
+    actions = batched_space.sample()
+    batch = create_empty_array(space, n=4)
+    set_batch_item(batch, slice(None), actions)
+    assert data_equivalence(batch, actions)
+
+    sub_actions = batch_space(space, n=2).sample()
+    set_batch_item(batch, [3, 1], sub_actions)
+    expected = create_empty_array(space, n=4)
+    set_batch_item(expected, slice(None), actions)
+    set_batch_item(expected, 3, get_batch_item(sub_actions, 0))
+    set_batch_item(expected, 1, get_batch_item(sub_actions, 1))
+    assert data_equivalence(batch, expected)
+
+
+def _leaves(batch):
+    if isinstance(batch, dict):
+        return [leaf for value in batch.values() for leaf in _leaves(value)]
+    elif isinstance(batch, tuple):
+        return [leaf for value in batch for leaf in _leaves(value)]
+    return [batch]
+
+
 @pytest.mark.parametrize("n", [1, 8])
 @pytest.mark.parametrize(
     "space", spaces, ids=[space.__class__.__name__ for space in spaces]
@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+
+import gym
+from gym.vector import NumpyVectorEnv
+
+NATIVE_ENV_IDS = [
+    "CartPole-v1",
+    "MountainCar-v0",
+    "MountainCarContinuous-v0",
+    "Pendulum-v1",
+    "Acrobot-v1",
+]
+
+
+@pytest.mark.parametrize("env_id", NATIVE_ENV_IDS)
+def test_numpy_vector_env_equal(env_id, num_envs=4, num_steps=20):
+    envs = gym.vector.make(
+        env_id,
+        num_envs=num_envs,
+        native=True,
+        vector_kwargs={"autoreset_mode": "disabled"},
+    )
+    assert isinstance(envs, NumpyVectorEnv)
+    assert envs.max_episode_steps == gym.spec(env_id).max_episode_steps
+
+    observations, infos = envs.reset(seed=123)
+    assert envs.observation_space.contains(observations)
+    assert infos == {}
+
+    single_envs = [gym.make(env_id, disable_env_checker=True) for _ in range(num_envs)]
+    for i, env in enumerate(single_envs):
+        env.reset(seed=i)
+        env.unwrapped.state = np.copy(envs.state[i])
+
+    envs.action_space.seed(123)
+    alive = np.ones(num_envs, dtype=np.bool_)
+    for _ in range(num_steps):
+        actions = envs.action_space.sample()
+        observations, rewards, terminateds, _, _ = envs.step(actions)
+        assert envs.observation_space.contains(observations)
+        assert rewards.dtype == np.float64 and terminateds.dtype == np.bool_
+
+        for i, env in enumerate(single_envs):
+            if not alive[i]:
+                continue
+            observation, reward, terminated, _, _ = env.step(actions[i])
+            assert np.allclose(observations[i], observation, rtol=1e-5, atol=1e-6)
+            assert np.isclose(rewards[i], reward, rtol=1e-5, atol=1e-6)
+            assert terminateds[i] == terminated
+            alive[i] = not terminated
+
+    envs.close()
+    for env in single_envs:
+        env.close()
+
+
+@pytest.mark.parametrize("env_id", NATIVE_ENV_IDS)
+def test_numpy_vector_env_state_dtype(env_id, num_envs=4):
+    envs = gym.vector.make(env_id, num_envs=num_envs, native=True)
+    envs.reset(seed=0)
+    dtype = envs.state.dtype
+    envs.step(envs.action_space.sample())
+    assert envs.state.dtype == dtype
+    envs.reset(indices=[1, 2])
+    assert envs.state.dtype == dtype
+    envs.close()
+
+
+@pytest.mark.parametrize("env_id", NATIVE_ENV_IDS)
+def test_numpy_vector_env_single_env_constants(env_id):
+    envs = gym.vector.make(env_id, num_envs=2, native=True)
+    env = gym.make(env_id, disable_env_checker=True)
+    constants = {
+        key: value
+        for key, value in vars(type(envs)).items()
+        if isinstance(value, (int, float, str, list)) and not key.startswith("_")
+    }
+    assert constants
+    for key, value in constants.items():
+        assert getattr(env.unwrapped, key) == value
+    envs.close()
+    env.close()
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int8, np.int64])
+def test_mountain_car_vector_env_action_dtype(dtype):
+    envs = gym.vector.make("MountainCar-v0", num_envs=3, native=True)
+    envs.reset(seed=0)
+    state = np.copy(envs.state)
+    actions = np.array([0, 1, 2])
+    expected, *_ = envs.step(actions)
+
+    envs.state = state
+    observations, *_ = envs.step(actions.astype(dtype))
+    assert np.array_equal(observations, expected)
+    envs.close()
+
+
+@pytest.mark.parametrize("autoreset_mode", ["same-step", "next-step"])
+def test_numpy_vector_env_autoreset(autoreset_mode):
+    envs = gym.vector.make(
+        "Pendulum-v1",
+        num_envs=3,
+        native=True,
+        vector_kwargs={"autoreset_mode": autoreset_mode, "max_episode_steps": 2},
+    )
+    envs.reset(seed=0)
+    envs.step(envs.action_space.sample())
+    observations, rewards, _, truncateds, infos = envs.step(envs.action_space.sample())
+    assert np.all(truncateds)
+
+    if autoreset_mode == "same-step":
+        assert np.all(infos["_final_observation"])
+        assert np.all(envs._elapsed_steps == 0)
+        for i in range(3):
+            assert not np.allclose(infos["final_observation"][i], observations[i])
+    else:
+        assert infos == {}
+        terminal_state = np.copy(envs.state)
+        _, rewards, _, truncateds, _ = envs.step(envs.action_space.sample())
+        assert np.all(rewards == 0.0) and not np.any(truncateds)
+        assert not np.allclose(envs.state, terminal_state)
+    envs.close()
+
+
+def test_numpy_vector_env_partial_reset():
+    envs = gym.vector.make("CartPole-v1", num_envs=4, native=True)
+    envs.reset(seed=0)
+    for _ in range(3):
+        envs.step(envs.action_space.sample())
+    state = np.copy(envs.state)
+
+    observations, _ = envs.reset(indices=[1, 3], options={"low": 0.1, "high": 0.2})
+    assert np.array_equal(envs.state[[0, 2]], state[[0, 2]])
+    assert np.all((envs.state[[1, 3]] >= 0.1) & (envs.state[[1, 3]] <= 0.2))
+    assert np.array_equal(envs._elapsed_steps, [3, 0, 3, 0])
+    assert np.allclose(observations, envs.state)
+
+    with pytest.raises(ValueError):
+        envs.reset(seed=[0, 1, 2, 3])
+    envs.close()
+
+
+def test_vector_make_native_errors():
+    with pytest.raises(gym.error.Error):
+        gym.vector.make("LunarLander-v2", native=True)
+    with pytest.raises(ValueError):
+        gym.vector.make("CartPole-v1", native=True, wrappers=lambda env: env)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from gym.spaces import Box
+from gym.vector import AsyncVectorEnv, RolloutCollector, SyncVectorEnv
+from tests.vector.utils import make_env
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_rollout_collector(asynchronous, num_envs=4, num_steps=25):
+    env_fns = [make_env("CartPole-v1", i) for i in range(num_envs)]
+    if asynchronous:
+        env = AsyncVectorEnv(env_fns, copy=False)
+    else:
+        env = SyncVectorEnv(env_fns, copy=False)
+    reference_env = SyncVectorEnv(env_fns)
+
+    collector = RolloutCollector(env, num_steps=num_steps, num_buffers=2)
+    collector.reset(seed=0)
+    observations, _ = reference_env.reset(seed=0)
+
+    env.action_space.seed(0)
+    rollouts = [
+        collector.collect(lambda _: env.action_space.sample()) for _ in range(2)
+    ]
+    env.close()
+
+    env.action_space.seed(0)
+    for rollout in rollouts:
+        assert rollout.observations.shape == (num_steps, num_envs, 4)
+        assert rollout.actions.shape == rollout.rewards.shape == (num_steps, num_envs)
+        for t in range(num_steps):
+            actions = env.action_space.sample()
+            assert np.array_equal(rollout.observations[t], observations)
+            assert np.array_equal(rollout.actions[t], actions)
+            observations, rewards, terminateds, truncateds, infos = reference_env.step(
+                actions
+            )
+            assert np.array_equal(rollout.rewards[t], rewards)
+            assert np.array_equal(rollout.terminateds[t], terminateds)
+            assert np.array_equal(rollout.truncateds[t], truncateds)
+
+            mask = infos.get("_final_observation", np.zeros(num_envs, dtype=np.bool_))
+            assert np.array_equal(rollout.final_observation_mask[t], mask)
+            for i in np.flatnonzero(mask):
+                assert np.array_equal(
+                    rollout.final_observations[t, i], infos["final_observation"][i]
+                )
+        assert np.array_equal(rollout.next_observations, observations)
+    assert np.any(rollouts[0].final_observation_mask)
+    reference_env.close()
+
+
+def test_rollout_collector_ring():
+    env = SyncVectorEnv([make_env("Pendulum-v1", i) for i in range(2)])
+    collector = RolloutCollector(env, num_steps=3, num_buffers=2)
+    policy = lambda _: env.action_space.sample()  # noqa: E731
+
+    first, second = collector.collect(policy), collector.collect(policy)
+    assert first is not second
+    assert np.array_equal(second.observations[0], first.next_observations)
+    third = collector.collect(policy)
+    assert third is first
+    assert np.array_equal(third.observations[0], second.next_observations)
+    assert isinstance(env.action_space, Box)
+    assert first.actions.shape == (3, 2, 1)
+    env.close()
+
+    with pytest.raises(ValueError):
+        RolloutCollector(env, num_steps=0)
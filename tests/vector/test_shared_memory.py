@@ -8,9 +8,14 @@ import pytest
 
 from gym.error import CustomSpaceError
 from gym.spaces import Dict, Tuple
+from gym.utils.env_checker import data_equivalence
+from gym.vector.utils.numpy_utils import concatenate, create_empty_array
 from gym.vector.utils.shared_memory import (
+    SharedMemoryArena,
+    create_shared_info_memory,
     create_shared_memory,
     read_from_shared_memory,
+    read_info_from_shared_memory,
     write_to_shared_memory,
 )
 from gym.vector.utils.spaces import BaseGymSpaces
@@ -175,3 +180,79 @@ def test_read_from_shared_memory(space):
         process.join()
 
     assert_nested_equal(memory_view_n8, samples, space, n=8)
+
+
+def _process_write_info(i, shared_memory):
+    values, mask = read_info_from_shared_memory(shared_memory)["x"]
+    values[i], mask[i] = 2.5 * i, i % 2 == 0
+
+
+@pytest.mark.parametrize(
+    "ctx", [None, "fork", "spawn"], ids=["default", "fork", "spawn"]
+)
+def test_shared_info_memory(ctx):
+    ctx = mp if (ctx is None) else mp.get_context(ctx)
+    shared_memory = create_shared_info_memory(
+        {"x": np.float64, "y": np.int32, "flag": bool}, n=4, ctx=ctx
+    )
+    infos = read_info_from_shared_memory(shared_memory)
+    assert list(infos.keys()) == ["x", "y", "flag"]
+    for (values, mask), dtype in zip(infos.values(), [np.float64, np.int32, bool]):
+        assert values.dtype == dtype and values.shape == (4,)
+        assert mask.dtype == np.bool_ and mask.shape == (4,)
+
+    processes = [
+        ctx.Process(target=_process_write_info, args=(i, shared_memory))
+        for i in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert np.all(infos["x"][0] == [0.0, 2.5, 5.0, 7.5])
+    assert np.all(infos["x"][1] == [True, False, True, False])
+
+    with pytest.raises(ValueError):
+        create_shared_info_memory({"z": object}, n=4, ctx=ctx)
+
+
+@pytest.mark.parametrize(
+    "dtype", [object, np.str_, np.float16, np.complex64, np.longdouble]
+)
+def test_shared_info_memory_invalid_dtype(dtype):
+    with pytest.raises(ValueError, match="Expected the data type of info key `z`"):
+        create_shared_info_memory({"x": np.float64, "z": dtype}, n=4)
+
+
+@pytest.mark.parametrize(
+    "space", spaces, ids=[space.__class__.__name__ for space in spaces]
+)
+def test_shared_memory_arena(space):
+    # The `spawn` and `forkserver` contexts are tested with `AsyncVectorEnv`
+    ctx = mp.get_context("fork")
+    arena = SharedMemoryArena()
+    shared_memory_n8 = create_shared_memory(space, n=8, ctx=arena)
+    arena.allocate()
+    assert all(
+        array.offset % SharedMemoryArena.alignment == 0 for array in arena.arrays
+    )
+
+    memory_view_n8 = read_from_shared_memory(space, shared_memory_n8, n=8)
+    samples = [space.sample() for _ in range(8)]
+    processes = [
+        ctx.Process(
+            target=_process_write, args=(space, i, shared_memory_n8, samples[i])
+        )
+        for i in range(8)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    expected = concatenate(space, samples, create_empty_array(space, n=8))
+    assert data_equivalence(memory_view_n8, expected)
+
+    del memory_view_n8
+    arena.unlink()
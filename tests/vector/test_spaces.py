@@ -5,6 +5,8 @@ import pytest
 from numpy.testing import assert_array_equal
 
 from gym.spaces import Box, Dict, MultiDiscrete, Space, Tuple
+from gym.utils.env_checker import data_equivalence
+from gym.vector.utils.rng import get_space_rng_state, seed_space, set_space_rng_state
 from gym.vector.utils.spaces import batch_space, iterate
 from tests.vector.utils import CustomSpace, assert_rng_equal, custom_spaces, spaces
 
@@ -197,3 +199,17 @@ def test_deterministic(space: Space, n: int, base_seed: int):
                 assert_array_equal(a_subsample, b_subsample)
         else:
             assert_array_equal(a_sample, b_sample)
+
+
+@pytest.mark.parametrize("space", spaces + custom_spaces)
+def test_seed_space_rng_state(space):
+    copied_space = copy.deepcopy(space)
+    seed_space(space, np.random.SeedSequence(0))
+    seed_space(copied_space, np.random.SeedSequence(0))
+    assert_rng_equal(space.np_random, copied_space.np_random)
+
+    state = get_space_rng_state(space)
+    samples = [space.sample() for _ in range(5)]
+    set_space_rng_state(space, state)
+    for sample in samples:
+        assert data_equivalence(sample, space.sample())
@@ -36,6 +36,18 @@ def test_reset_sync_vector_env():
     del observations
 
 
+def test_reset_empty_indices_sync_vector_env():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = SyncVectorEnv(env_fns, autoreset_mode="disabled")
+    env.reset(seed=0)
+    observations, _, _, _, _ = env.step(np.ones(4, dtype=np.int64))
+
+    reset_observations, infos = env.reset(seed=1, indices=[])
+    assert np.all(reset_observations == observations) and infos == {}
+    env.step(np.ones(4, dtype=np.int64))
+    env.close()
+
+
 @pytest.mark.parametrize("use_single_action_space", [True, False])
 def test_step_sync_vector_env(use_single_action_space):
     env_fns = [make_env("FrozenLake-v1", i) for i in range(8)]
@@ -122,6 +134,25 @@ def test_check_spaces_sync_vector_env():
         env.close()
 
 
+def test_observation_buffers_sync_vector_env():
+    env = SyncVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(4)], num_observation_buffers=2
+    )
+    observations, _ = env.reset(seed=0)
+    first_observations = np.copy(observations)
+
+    step_observations, _, _, _, _ = env.step(env.action_space.sample())
+    assert step_observations is not observations
+    assert np.all(observations == first_observations)
+
+    next_observations, _, _, _, _ = env.step(env.action_space.sample())
+    assert next_observations is observations
+    env.close()
+
+    with pytest.raises(ValueError):
+        SyncVectorEnv([make_env("CartPole-v1", 0)], num_observation_buffers=0)
+
+
 def test_custom_space_sync_vector_env():
     env_fns = [make_custom_space_env(i) for i in range(4)]
 
@@ -175,3 +206,17 @@ def test_sync_vector_determinism(spec: EnvSpec, seed: int = 123, n: int = 3):
         env_1_samples = env_1.action_space.sample()
         env_2_samples = env_2.action_space.sample()
         assert np.all(env_1_samples == env_2_samples)
+
+
+def test_call_batch_sync_vector_env():
+    env_fns = [make_env("CartPole-v1", i, render_mode="rgb_array") for i in range(4)]
+
+    env = SyncVectorEnv(env_fns)
+    env.reset()
+    images = env.call_batch("render", Box(0, 255, (400, 600, 3), np.uint8))
+    expected_images = env.call("render")
+    env.close()
+
+    assert images.shape == (4, 400, 600, 3) and images.dtype == np.uint8
+    for image, expected_image in zip(images, expected_images):
+        assert np.array_equal(image, expected_image)
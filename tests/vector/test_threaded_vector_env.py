@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import gym
+from gym.spaces import Box, Discrete, MultiDiscrete
+from gym.vector.sync_vector_env import SyncVectorEnv
+from gym.vector.threaded_vector_env import ThreadedVectorEnv
+from tests.vector.utils import make_env
+
+
+def test_create_threaded_vector_env():
+    env_fns = [make_env("FrozenLake-v1", i) for i in range(8)]
+    env = ThreadedVectorEnv(env_fns, num_threads=3)
+    env.close()
+
+    assert env.num_envs == 8
+    assert env.num_threads == 3
+
+
+@pytest.mark.parametrize("env_id", ["CartPole-v1", "FrozenLake-v1"])
+def test_step_threaded_vector_env(env_id):
+    env_fns = [make_env(env_id, i) for i in range(8)]
+
+    env = ThreadedVectorEnv(env_fns, num_threads=4)
+    sync_env = SyncVectorEnv(env_fns)
+    assert isinstance(env.action_space, MultiDiscrete)
+    assert isinstance(env.single_action_space, Discrete)
+
+    observations, infos = env.reset(seed=123)
+    sync_observations, sync_infos = sync_env.reset(seed=123)
+    assert observations.dtype == env.observation_space.dtype
+    assert np.all(observations == sync_observations)
+
+    for _ in range(100):
+        actions = env.action_space.sample()
+        observations, rewards, terminateds, truncateds, infos = env.step(actions)
+        (
+            sync_observations,
+            sync_rewards,
+            sync_terminateds,
+            sync_truncateds,
+            sync_infos,
+        ) = sync_env.step(actions)
+
+        assert np.all(observations == sync_observations)
+        assert np.all(rewards == sync_rewards)
+        assert np.all(terminateds == sync_terminateds)
+        assert np.all(truncateds == sync_truncateds)
+        assert infos.keys() == sync_infos.keys()
+
+    env.close()
+    sync_env.close()
+
+
+def test_call_threaded_vector_env():
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+
+    env = ThreadedVectorEnv(env_fns)
+    env.set_attr("gravity", [9.81, 3.72, 8.87, 1.62])
+    assert env.get_attr("gravity") == (9.81, 3.72, 8.87, 1.62)
+    env.close()
+
+
+def test_make_threaded_vector_env():
+    env = gym.vector.make("CartPole-v1", num_envs=3, threaded=True)
+    assert isinstance(env, ThreadedVectorEnv)
+    assert isinstance(env.observation_space, Box)
+    assert env.num_envs == 3
+    env.close()
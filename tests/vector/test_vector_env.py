@@ -1,6 +1,9 @@
+import json
+
 import numpy as np
 import pytest
 
+import gym
 from gym.spaces import Tuple
 from gym.vector.async_vector_env import AsyncVectorEnv
 from gym.vector.sync_vector_env import SyncVectorEnv
@@ -58,3 +61,207 @@ def test_custom_space_vector_env():
 
     assert isinstance(env.single_action_space, CustomSpace)
     assert isinstance(env.action_space, Tuple)
+
+
+@pytest.mark.parametrize(
+    "vector_env_fn",
+    [
+        SyncVectorEnv,
+        lambda env_fns, **kwargs: AsyncVectorEnv(
+            env_fns, shared_memory=False, **kwargs
+        ),
+        lambda env_fns, **kwargs: AsyncVectorEnv(env_fns, shared_memory=True, **kwargs),
+        lambda env_fns, **kwargs: AsyncVectorEnv(env_fns, envs_per_worker=2, **kwargs),
+    ],
+    ids=["sync", "async", "async_shared_memory", "async_shared_step_buffers"],
+)
+@pytest.mark.parametrize("autoreset_mode", ["next-step", "disabled"])
+def test_vector_env_autoreset_mode(vector_env_fn, autoreset_mode):
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    env = vector_env_fn(env_fns, autoreset_mode=autoreset_mode)
+    single_env = env_fns[0]()
+
+    observations, _ = env.reset(seed=0)
+    single_observation, _ = single_env.reset(seed=0)
+    actions = np.ones(2, dtype=np.int64)
+    terminated = False
+    while not terminated:
+        observations, rewards, terminateds, truncateds, infos = env.step(actions)
+        single_observation, _, terminated, _, _ = single_env.step(1)
+        assert np.all(observations[0] == single_observation)
+        assert terminateds[0] == terminated
+    # The terminal observation is in the batch of observations, not in the infos
+    assert "final_observation" not in infos
+
+    terminal_observation = np.copy(observations[0])
+
+    if autoreset_mode == "next-step":
+        observations, rewards, terminateds, truncateds, infos = env.step(actions)
+        assert rewards[0] == 0.0 and not terminateds[0] and not truncateds[0]
+        assert np.any(observations[0] != terminal_observation)
+    else:
+        observations, infos = env.reset(seed=1, indices=[0])
+        single_observation, _ = single_env.reset(seed=1)
+        assert np.all(observations[0] == single_observation)
+
+    env.close()
+    single_env.close()
+
+    with pytest.raises(ValueError):
+        vector_env_fn(env_fns, autoreset_mode="never")
+
+
+@pytest.mark.parametrize(
+    "vector_kwargs",
+    [
+        {"asynchronous": False},
+        {"asynchronous": True},
+        {"asynchronous": True, "shared_step_buffers": True},
+    ],
+)
+def test_vector_env_stats(vector_kwargs, tmp_path):
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    asynchronous = vector_kwargs.pop("asynchronous")
+    if asynchronous:
+        env = AsyncVectorEnv(env_fns, **vector_kwargs)
+    else:
+        env = SyncVectorEnv(env_fns)
+    assert env.get_stats() == {}
+
+    stats_file = tmp_path / "stats.jsonl"
+    env.enable_stats(stats_file=str(stats_file), interval=0.0)
+    env.reset(seed=0)
+    for _ in range(5):
+        env.step(env.action_space.sample())
+    stats = env.get_stats()
+    env.close()
+
+    assert stats["add_info"]["count"] == 6
+    assert stats["concatenate"]["count"] == 6
+    if asynchronous:
+        assert stats["ipc_send"]["count"] == 6
+        assert stats["ipc_recv"]["count"] == 6
+        assert len(stats["workers"]) == 2
+        for worker_stats in stats["workers"]:
+            assert worker_stats["env_reset"]["count"] == 1
+            assert worker_stats["env_step"]["count"] == 5
+    else:
+        assert stats["env_reset"]["count"] == 1
+        assert stats["env_step"]["count"] == 5
+    for counter in stats.values():
+        if isinstance(counter, dict):
+            assert counter["total"] >= 0.0
+            assert counter["mean"] == pytest.approx(counter["total"] / counter["count"])
+
+    lines = stats_file.read_text().splitlines()
+    assert len(lines) == 5
+    assert "time" in json.loads(lines[-1])
+
+
+@pytest.mark.parametrize(
+    "vector_env_fn",
+    [
+        SyncVectorEnv,
+        AsyncVectorEnv,
+        lambda env_fns: AsyncVectorEnv(env_fns, envs_per_worker=2),
+    ],
+    ids=["sync", "async", "async_shared_step_buffers"],
+)
+def test_vector_env_spawn_seeds(vector_env_fn):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = vector_env_fn(env_fns)
+    reference_env = SyncVectorEnv(env_fns)
+
+    seed_seq = env.spawn_seeds(42)
+    assert seed_seq.entropy == 42
+    reference_env.spawn_seeds(42)
+    observations, _ = env.reset()
+    reference_observations, _ = reference_env.reset()
+    assert np.all(observations == reference_observations)
+    # The sub-environments are seeded with independent streams
+    assert len(np.unique(observations, axis=0)) == env.num_envs
+    assert np.all(env.action_space.sample() == reference_env.action_space.sample())
+    assert np.all(
+        np.array(env.call("action_space"))
+        == np.array(reference_env.call("action_space"))
+    )
+
+    # The states of all the random number generators are restored at once
+    states = env.get_rng_states()
+    assert len(states["envs"]) == env.num_envs
+    observations, _ = env.reset()
+    actions = env.action_space.sample()
+    env.set_rng_states(states)
+    restored_observations, _ = env.reset()
+    assert np.all(observations == restored_observations)
+    assert np.all(actions == env.action_space.sample())
+
+    env.close()
+    reference_env.close()
+
+
+@pytest.mark.parametrize(
+    "vector_env_fn",
+    [
+        SyncVectorEnv,
+        AsyncVectorEnv,
+        lambda env_fns, **kwargs: AsyncVectorEnv(env_fns, envs_per_worker=2, **kwargs),
+        lambda env_fns, **kwargs: gym.vector.make(
+            "CartPole-v1", num_envs=len(env_fns), native=True, **kwargs
+        ),
+    ],
+    ids=["sync", "async", "async_shared_step_buffers", "native"],
+)
+@pytest.mark.parametrize("autoreset_mode", ["same-step", "next-step"])
+def test_vector_env_get_set_state(vector_env_fn, autoreset_mode, num_steps=30):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = vector_env_fn(env_fns, autoreset_mode=autoreset_mode)
+    env.reset(seed=0)
+    for _ in range(20):
+        env.step(env.action_space.sample())
+
+    state = env.get_state()
+    assert isinstance(state, bytes)
+    results = [env.step(env.action_space.sample()) for _ in range(num_steps)]
+    env.close()
+
+    # The snapshot is restored in a new vector environment, e.g. after a restart
+    restored_env = vector_env_fn(env_fns, autoreset_mode=autoreset_mode)
+    restored_env.set_state(state)
+    for result in results:
+        restored_result = restored_env.step(restored_env.action_space.sample())
+        for value, restored_value in zip(result[:4], restored_result[:4]):
+            assert np.all(value == restored_value)
+    restored_env.close()
+
+
+@pytest.mark.parametrize(
+    "vector_env_fn",
+    [
+        SyncVectorEnv,
+        AsyncVectorEnv,
+        lambda env_fns, **kwargs: AsyncVectorEnv(env_fns, envs_per_worker=2, **kwargs),
+        lambda env_fns, **kwargs: gym.vector.make(
+            "CartPole-v1", num_envs=len(env_fns), native=True, **kwargs
+        ),
+    ],
+    ids=["sync", "async", "async_shared_step_buffers", "native"],
+)
+@pytest.mark.parametrize("autoreset_mode", ["same-step", "next-step"])
+def test_vector_env_truncate_envs(vector_env_fn, autoreset_mode):
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    env = vector_env_fn(env_fns, autoreset_mode=autoreset_mode)
+    env.reset(seed=0)
+    env.truncate_envs([1, 2])
+
+    _, _, terminateds, truncateds, infos = env.step(np.zeros(4, dtype=np.int64))
+    assert not np.any(terminateds)
+    assert np.all(truncateds == [False, True, True, False])
+    if autoreset_mode == "same-step":
+        assert np.all(infos["_final_observation"] == [False, True, True, False])
+
+    _, rewards, _, truncateds, _ = env.step(np.zeros(4, dtype=np.int64))
+    assert not np.any(truncateds)
+    if autoreset_mode == "next-step":
+        assert np.all(rewards == [1.0, 0.0, 0.0, 1.0])
+    env.close()
@@ -54,3 +54,43 @@ def test_vector_env_info_concurrent_termination(concurrent_ends):
                     assert not infos["_final_observation"][i]
                     assert infos["final_observation"][i] is None
             return
+
+
+def test_batch_infos():
+    env = SyncVectorEnv([make_env(ENV_ID, SEED) for _ in range(NUM_ENVS)])
+    env_infos = [
+        {"a": 1, "b": np.zeros(2)},
+        {},
+        {"a": 2, "c": 0.5, "d": True},
+    ]
+
+    expected_infos = {}
+    for i, info in enumerate(env_infos):
+        expected_infos = env._add_info(expected_infos, info, i)
+    infos = env._batch_infos(env_infos)
+    assert list(infos.keys()) == list(expected_infos.keys())
+    for key, value in expected_infos.items():
+        assert infos[key].dtype == value.dtype
+        assert infos[key].tolist() == value.tolist()
+    assert infos["b"][0] is env_infos[0]["b"] and infos["b"][1] is None
+
+    sparse_infos = env._batch_infos({2: {"a": 3}})
+    assert list(sparse_infos.keys()) == ["a", "_a"]
+    assert np.all(sparse_infos["a"] == [0, 0, 3])
+    assert np.all(sparse_infos["_a"] == [False, False, True])
+    # the arrays of the previous step are not overwritten
+    assert np.all(infos["a"] == [1, 0, 2])
+
+    # a key whose type changes is allocated again
+    assert env._batch_infos([{"a": 0.5}, {}, {}])["a"].dtype == np.float64
+    env.close()
+
+
+def test_batch_infos_no_copy():
+    env = SyncVectorEnv([make_env(ENV_ID, SEED) for _ in range(NUM_ENVS)], copy=False)
+    infos = env._batch_infos([{"a": 1}, {}, {}])
+    next_infos = env._batch_infos([{}, {"a": 2}, {}])
+    assert next_infos["a"] is infos["a"] and next_infos["_a"] is infos["_a"]
+    assert np.all(infos["a"] == [0, 2, 0])
+    assert np.all(infos["_a"] == [False, True, False])
+    env.close()
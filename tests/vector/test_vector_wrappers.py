@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+
+import gym
+from gym.spaces import Box
+from gym.vector import AsyncVectorEnv, SyncVectorEnv, wrappers
+from tests.vector.utils import make_env
+
+
+def _make_envs(env_id="CartPole-v1", num_envs=4, **kwargs):
+    return SyncVectorEnv([make_env(env_id, i) for i in range(num_envs)], **kwargs)
+
+
+def test_normalize_observation_and_reward():
+    envs = wrappers.NormalizeReward(wrappers.NormalizeObservation(_make_envs()))
+    reference_envs = gym.wrappers.NormalizeReward(
+        gym.wrappers.NormalizeObservation(_make_envs())
+    )
+
+    observations, _ = envs.reset(seed=0)
+    reference_observations, _ = reference_envs.reset(seed=0)
+    assert np.allclose(observations, reference_observations)
+    for _ in range(50):
+        actions = envs.action_space.sample()
+        observations, rewards, terminateds, truncateds, infos = envs.step(actions)
+        (
+            reference_observations,
+            reference_rewards,
+            reference_terminateds,
+            reference_truncateds,
+            reference_infos,
+        ) = reference_envs.step(actions)
+        assert np.allclose(observations, reference_observations)
+        assert np.allclose(rewards, reference_rewards)
+        assert np.all(terminateds == reference_terminateds)
+        assert np.all(truncateds == reference_truncateds)
+    assert np.allclose(envs.obs_rms.mean, reference_envs.obs_rms.mean)
+    assert np.allclose(envs.return_rms.var, reference_envs.return_rms.var)
+    envs.close()
+    reference_envs.close()
+
+
+def test_clip_and_rescale_action():
+    envs = wrappers.ClipAction(
+        wrappers.RescaleAction(
+            _make_envs("MountainCarContinuous-v0", num_envs=3),
+            min_action=0.0,
+            max_action=2.0,
+        )
+    )
+    assert envs.single_action_space == Box(0.0, 2.0, (1,), np.float32)
+    assert envs.action_space.shape == (3, 1)
+
+    envs.reset(seed=0)
+    sent_actions = []
+    step_async = envs.env.env.step_async
+    envs.env.env.step_async = lambda actions: (
+        sent_actions.append(actions),
+        step_async(actions),
+    )
+    envs.step(np.array([[-1.0], [1.0], [3.0]], dtype=np.float32))
+    assert np.allclose(sent_actions[0], [[-1.0], [0.0], [1.0]])
+    envs.close()
+
+
+def test_transform_observation():
+    envs = wrappers.TransformObservation(
+        _make_envs(),
+        lambda observations: observations[:, :2] * 2,
+        observation_space=Box(-np.inf, np.inf, (2,), np.float32),
+    )
+    assert envs.observation_space.shape == (4, 2)
+
+    observations, _ = envs.reset(seed=0)
+    assert observations.shape == (4, 2)
+    for _ in range(50):
+        observations, _, terminateds, truncateds, infos = envs.step(
+            envs.action_space.sample()
+        )
+        assert observations.shape == (4, 2)
+        if "final_observation" in infos:
+            for i in np.flatnonzero(infos["_final_observation"]):
+                assert infos["final_observation"][i].shape == (2,)
+    envs.close()
+
+
+def _make_async_envs(env_id="CartPole-v1", num_envs=4, **kwargs):
+    return AsyncVectorEnv([make_env(env_id, i) for i in range(num_envs)], **kwargs)
+
+
+def _make_shared_step_envs(env_id="CartPole-v1", num_envs=4, **kwargs):
+    return _make_async_envs(env_id, num_envs, shared_step_buffers=True, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "make_envs",
+    [_make_envs, _make_async_envs, _make_shared_step_envs],
+    ids=["sync", "async", "shared_step_buffers"],
+)
+@pytest.mark.parametrize("autoreset_mode", ["same-step", "next-step", "disabled"])
+def test_time_limit(make_envs, autoreset_mode, max_episode_steps=5):
+    envs = wrappers.TimeLimit(
+        make_envs("Pendulum-v1", autoreset_mode=autoreset_mode),
+        max_episode_steps=max_episode_steps,
+    )
+    # With the "next-step" autoreset mode, the step resetting the sub-environments does not count
+    truncation_steps = (
+        [max_episode_steps, 2 * max_episode_steps + 1]
+        if autoreset_mode == "next-step"
+        else [max_episode_steps, 2 * max_episode_steps]
+    )
+    envs.reset(seed=0)
+    for t in range(1, 2 * max_episode_steps + 2):
+        observations, rewards, terminateds, truncateds, infos = envs.step(
+            envs.action_space.sample()
+        )
+        assert not terminateds.any()
+        if autoreset_mode == "next-step" and t == max_episode_steps + 1:
+            assert np.all(rewards == 0.0)
+        if t in truncation_steps:
+            assert truncateds.all()
+            if autoreset_mode == "same-step":
+                assert infos["_final_observation"].all()
+                assert not np.allclose(
+                    np.stack(infos["final_observation"]), observations
+                )
+            else:
+                assert "final_observation" not in infos
+            if autoreset_mode == "disabled":
+                break
+        else:
+            assert not truncateds.any()
+    envs.close()
+
+
+def test_time_limit_partial_reset(max_episode_steps=3):
+    envs = wrappers.TimeLimit(
+        _make_envs("Pendulum-v1"), max_episode_steps=max_episode_steps
+    )
+    envs.reset(seed=0)
+    envs.step(envs.action_space.sample())
+    envs.reset(indices=[0])
+    for _ in range(max_episode_steps - 1):
+        _, _, _, truncateds, _ = envs.step(envs.action_space.sample())
+    assert np.all(truncateds == [False, True, True, True])
+    envs.close()
+
+
+class _StepCounter(gym.Wrapper):
+    """Counts the steps of the current episode, and the longest episode."""
+
+    def __init__(self, env):
+        super().__init__(env)
+        self.steps, self.max_steps = 0, 0
+
+    def reset(self, **kwargs):
+        self.steps = 0
+        return self.env.reset(**kwargs)
+
+    def step(self, action):
+        self.steps += 1
+        self.max_steps = max(self.max_steps, self.steps)
+        return self.env.step(action)
+
+
+@pytest.mark.parametrize("autoreset_mode", ["same-step", "next-step"])
+def test_time_limit_uses_vector_autoreset(autoreset_mode, max_episode_steps=3):
+    """Tests that the truncated sub-environments are not stepped past the limit, and not reset by an extra call."""
+    envs = SyncVectorEnv(
+        [
+            lambda: _StepCounter(gym.make("Pendulum-v1", disable_env_checker=True))
+            for _ in range(2)
+        ],
+        autoreset_mode=autoreset_mode,
+        num_observation_buffers=2,
+    )
+    envs = wrappers.TimeLimit(envs, max_episode_steps=max_episode_steps)
+    previous_observations, _ = envs.reset(seed=0)
+    for _ in range(4 * max_episode_steps):
+        expected_previous_observations = np.copy(previous_observations)
+        observations, _, _, truncateds, _ = envs.step(envs.action_space.sample())
+        # The batch returned by the last call is only overwritten by the second next call
+        assert np.all(previous_observations == expected_previous_observations)
+        previous_observations = observations
+    assert all(env.max_steps == max_episode_steps for env in envs.unwrapped.envs)
+    envs.close()
@@ -66,7 +66,7 @@ class UnittestSlowEnv(gym.Env):
         return self.observation_space.sample(), {}
 
     def step(self, action):
-        time.sleep(action)
+        time.sleep(float(action))
         observation = self.observation_space.sample()
         reward, terminated, truncated = 0.0, False, False
         return observation, reward, terminated, truncated, {}